@@ -0,0 +1,50 @@
+"""
+Yanıt kayıtlarının DataFrame'e ayrıştırılması karşılaştırması: varsayılan (numpy/object sütunlar) ile Arrow tabanlı
+ayrıştırma (ayarlar(arrow=True)). GİP işlem akışı biçiminde sahte kayıtlar kullanılır; süre ve ayrıştırma sırasındaki
+en yüksek bellek kullanımı (tracemalloc) verilir.
+
+Kullanım:
+    python benchmarks/arrow.py [kayit_sayisi ...]
+"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import seffaflik
+from seffaflik.__ortak import __uc_noktalar as uc_noktalar
+
+
+def ornek_kayitlar(kayit_sayisi):
+    rng = np.random.default_rng(0)
+    saniyeler = np.sort(rng.integers(0, 365 * 86400, kayit_sayisi))
+    zamanlar = np.datetime64("2019-01-01T00:00:00") + saniyeler.astype("timedelta64[s]")
+    return [{"id": i, "date": str(z) + ".000+0300", "conract": "PH19" + "{:04d}".format(i % 8760),
+             "price": float(f), "quantity": float(m)}
+            for i, (z, f, m) in enumerate(zip(zamanlar, rng.random(kayit_sayisi) * 500,
+                                              rng.integers(1, 500, kayit_sayisi)))]
+
+
+def olc(kayitlar, arrow):
+    seffaflik.ayarlar(arrow=arrow)
+    tracemalloc.start()
+    baslangic = time.perf_counter()
+    df = uc_noktalar.ayristir("gip.islem_akisi", kayitlar)
+    sure = time.perf_counter() - baslangic
+    tepe = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return sure, tepe, df
+
+
+if __name__ == "__main__":
+    kayit_sayilari = [int(a) for a in sys.argv[1:]] or [100000, 500000, 1000000]
+    print("{:>8} {:>12} {:>12} {:>14} {:>14}".format("kayıt", "numpy", "arrow", "numpy bellek", "arrow bellek"))
+    for kayit_sayisi in kayit_sayilari:
+        kayitlar = ornek_kayitlar(kayit_sayisi)
+        sure_numpy, bellek_numpy, df_numpy = olc(kayitlar, False)
+        sure_arrow, bellek_arrow, df_arrow = olc(kayitlar, True)
+        assert (df_numpy["Fiyat"].to_numpy() == df_arrow["Fiyat"].to_numpy()).all()
+        assert (df_numpy["Tarih"].to_numpy() == df_arrow["Tarih"].to_numpy("datetime64[us]")).all()
+        print("{:>8} {:>9.0f} ms {:>9.0f} ms {:>11.1f} MB {:>11.1f} MB".format(
+            kayit_sayisi, sure_numpy * 1000, sure_arrow * 1000, bellek_numpy / 2 ** 20, bellek_arrow / 2 ** 20))
@@ -0,0 +1,60 @@
+"""
+Birim bazlı (organizasyon, UEVÇB, santral) sonuçların geniş tabloda birleştirilmesi karşılaştırması: ikili dış
+birleştirmelerin (reduce + merge) art arda uygulanması ile tek geçişte birleştirme (birim_tablosu). Varsayılan olarak
+bir haftalık saatlik veri ve 100, 250, 500, 1000, 1500 birim kullanılır. Ardından seyrek dolu (birimlerin saatlerin
+yalnızca bir kısmında veri verdiği) bir yıllık veri için genis, uzun ve seyrek biçimlerin bellek kullanımı verilir.
+
+Kullanım:
+    python benchmarks/birim_tablosu.py [gun_sayisi] [birim_sayisi ...]
+"""
+import sys
+import time
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+from seffaflik.__ortak.__araclar import birim_tablosu
+
+
+def ornek_veri(gun_sayisi, birim_sayisi, doluluk=0.9):
+    rng = np.random.default_rng(0)
+    saatler = pd.date_range("2019-01-01", periods=gun_sayisi * 24, freq="h")
+    list_df = []
+    for i in range(birim_sayisi):
+        # Birimler aralığın tamamında veri vermez
+        secili = saatler[rng.random(len(saatler)) < doluluk]
+        list_df.append(pd.DataFrame({"Tarih": secili.normalize(), "Saat": secili.hour.astype("int64"),
+                                     "UEVÇB-" + str(i): rng.random(len(secili)) * 100}))
+    return list_df
+
+
+def ikili_birlestirme(list_df):
+    return reduce(lambda left, right: pd.merge(left, right, how="outer", on=["Tarih", "Saat"], sort=True), list_df)
+
+
+def sure(f, *args):
+    baslangic = time.perf_counter()
+    sonuc = f(*args)
+    return time.perf_counter() - baslangic, sonuc
+
+
+if __name__ == "__main__":
+    gun_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    birim_sayilari = [int(a) for a in sys.argv[2:]] or [100, 250, 500, 1000, 1500]
+    print("{:>6} {:>8} {:>14} {:>14} {:>14} {:>8}".format("birim", "satır", "reduce+merge", "birim_tablosu",
+                                                          "uzun format", "kat"))
+    for birim_sayisi in birim_sayilari:
+        list_df = ornek_veri(gun_sayisi, birim_sayisi)
+        sure_eski, eski = sure(ikili_birlestirme, list_df)
+        sure_yeni, yeni = sure(birim_tablosu, list_df)
+        sure_uzun, _ = sure(birim_tablosu, list_df, ("Tarih", "Saat"), "uzun")
+        pd.testing.assert_frame_equal(eski.reset_index(drop=True), yeni)
+        print("{:>6} {:>8} {:>11.0f} ms {:>11.0f} ms {:>11.0f} ms {:>7.1f}x".format(
+            birim_sayisi, len(yeni), sure_eski * 1000, sure_yeni * 1000, sure_uzun * 1000, sure_eski / sure_yeni))
+
+    list_df = ornek_veri(365, 1000, doluluk=0.1)
+    print("\nBellek kullanımı (365 gün, 1000 birim, %10 dolu):")
+    for bicim in ("genis", "uzun", "seyrek"):
+        df = birim_tablosu(list_df, bicim=bicim)
+        print("{:<7}: {:>8.1f} MB {}".format(bicim, df.memory_usage(deep=True).sum() / 2 ** 20, df.shape))
@@ -0,0 +1,44 @@
+"""
+İçe aktarma (import) süresi ölçümü. Her modül ayrı ve temiz bir Python sürecinde içe aktarılır; süre birkaç
+tekrarın medyanıdır. Modülle birlikte yüklenen ağır paketler (pandas, requests, bs4, multiprocessing, ...) de
+listelenir. Ayrıntılı döküm için: python -X importtime -c "import seffaflik"
+
+Kullanım:
+    python benchmarks/ice_aktarma.py [modul ...]
+"""
+import os
+import sys
+import json
+import statistics
+import subprocess
+
+TEKRAR_SAYISI = 5
+AGIR_PAKETLER = ("pandas", "numpy", "requests", "dateutil", "bs4", "multiprocessing", "pyarrow")
+KOD = """
+import sys, time, json
+baslangic = time.perf_counter()
+import {modul}
+sure = time.perf_counter() - baslangic
+print(json.dumps([sure, [p for p in {paketler!r} if p in sys.modules]]))
+"""
+
+
+def olc(modul):
+    kok = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    ortam = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [kok, os.environ.get("PYTHONPATH")])))
+    sureler, paketler = [], []
+    for _ in range(TEKRAR_SAYISI):
+        cikti = subprocess.run([sys.executable, "-c", KOD.format(modul=modul, paketler=AGIR_PAKETLER)], env=ortam,
+                               check=True, capture_output=True, text=True).stdout
+        sure, paketler = json.loads(cikti.strip().splitlines()[-1])
+        sureler.append(sure)
+    return statistics.median(sureler), paketler
+
+
+if __name__ == "__main__":
+    moduller = sys.argv[1:] or ["seffaflik", "seffaflik.elektrik.piyasalar.gop", "seffaflik.elektrik.santraller",
+                                "seffaflik.elektrik.piyasalar.genel", "seffaflik.aio"]
+    print("{:<36} {:>10}  {}".format("modül", "süre", "yüklenen ağır paketler"))
+    for modul in moduller:
+        sure, paketler = olc(modul)
+        print("{:<36} {:>7.0f} ms  {}".format(modul, sure * 1000, ", ".join(paketler) or "-"))
@@ -0,0 +1,72 @@
+"""
+Yanıt gövdelerinin JSON çözücülerine göre çözülme süresi karşılaştırması. Yüklü olan her çözücü (orjson, simdjson,
+ujson, json) için tüm belgenin ve yalnızca kayıt listesinin (json_alt_agac=True) çözülme süreleri verilir. Kayıt
+listesi gövdedeki ilk liste anahtarıdır. Dosya girilmediği taktirde GİP işlem akışı ve santral bazlı gerçek zamanlı
+üretim biçiminde sahte yanıtlar kullanılır.
+
+Kullanım:
+    python benchmarks/json_cozucu.py [kayitli_yanit.json ...]
+"""
+import sys
+import json
+import time
+import importlib
+
+import numpy as np
+
+import seffaflik
+from seffaflik.__ortak import __cozucu as cozucu
+
+CALISMA_SAYISI = 5
+
+
+def islem_akisi(kayit_sayisi=500000):
+    rng = np.random.default_rng(0)
+    return {"resultCode": "0", "resultDescription": "success", "body": {"intraDayTradeHistoryList": [
+        {"id": i, "date": "2019-01-%02dT%02d:%02d:00.000+0300" % (1 + i % 28, i % 24, i % 60),
+         "conract": "PH19010%d%02d" % (1 + i % 9, i % 24), "price": round(float(f), 2), "quantity": int(m)}
+        for i, (f, m) in enumerate(zip(rng.random(kayit_sayisi) * 500, rng.integers(1, 500, kayit_sayisi)))]}}
+
+
+def santral_uretimi(saat_sayisi=24 * 31):
+    rng = np.random.default_rng(0)
+    alanlar = ["fueloil", "gasOil", "blackCoal", "lignite", "geothermal", "naturalGas", "river", "dammedHydro",
+               "lng", "biomass", "naphta", "importCoal", "asphaltiteCoal", "wind", "nucklear", "sun", "importExport",
+               "total"]
+    return {"resultCode": "0", "resultDescription": "success", "body": {"hourlyGenerations": [
+        dict({"date": "2019-01-%02dT%02d:00:00.000+0300" % (1 + s // 24, s % 24)},
+             **{a: round(float(d), 2) for a, d in zip(alanlar, rng.random(len(alanlar)) * 1000)})
+        for s in range(saat_sayisi)] * 40}}
+
+
+def liste_anahtari(belge):
+    return next((a for a, d in belge.get("body", {}).items() if isinstance(d, list)), None)
+
+
+def olc(icerik, yol):
+    sureler = []
+    for _ in range(CALISMA_SAYISI):
+        baslangic = time.perf_counter()
+        cozucu.coz(icerik, yol)
+        sureler.append(time.perf_counter() - baslangic)
+    return min(sureler)
+
+
+if __name__ == "__main__":
+    yanitlar = [(dosya, open(dosya, "rb").read()) for dosya in sys.argv[1:]] or \
+               [("islem_akisi", json.dumps(islem_akisi()).encode()),
+                ("santral_uretimi", json.dumps(santral_uretimi()).encode())]
+    cozuculer = []
+    for ad in ("orjson", "simdjson", "ujson", "json"):
+        try:
+            importlib.import_module(ad)
+            cozuculer.append(ad)
+        except ImportError:
+            print(ad + " yüklü değil; atlanıyor")
+    print("{:<20} {:>8} {:<9} {:>12} {:>12}".format("yanıt", "MB", "çözücü", "tüm belge", "kayıt listesi"))
+    for ad, icerik in yanitlar:
+        yol = ("body", liste_anahtari(json.loads(icerik)))
+        for cozucu_adi in cozuculer:
+            seffaflik.ayarlar(json_cozucu=cozucu_adi)
+            print("{:<20} {:>8.1f} {:<9} {:>9.0f} ms {:>9.0f} ms".format(
+                ad[-20:], len(icerik) / 2 ** 20, cozucu_adi, olc(icerik, ()) * 1000, olc(icerik, yol) * 1000))
@@ -0,0 +1,293 @@
+"""
+Şeffaflık Platformu yerine kullanılabilecek yerel sahte sunucu. elektrik/ ve dogalgaz/ modüllerinin kullandığı tüm
+uç noktalar (seffaflik.__ortak.__uc_noktalar kaydı) için kayıtlı yanıtları olduğu gibi, kaydı olmayanlar için uç nokta
+tanımındaki (kayıtları modülde elle ayrıştırılan uç noktalarda SEKILLER'deki) alanlardan ve sorgudaki tarih
+aralığından sentetik yanıtlar üretir. Aynı adres her seferinde aynı yanıtı
+alır; yanıtlar ETag ile verilir ve If-None-Match ile gelen isteklere 304 döner. Gecikme, hata oranı ve yanıt boyutu
+ayarlanabilir.
+
+    from sahte_sunucu import SahteSunucu
+    with SahteSunucu(gecikme=0.05, hata_orani=0.01) as sunucu:
+        seffaflik.ayarlar(ana_url=sunucu.adres, onbellek=False, bellek_suresi=0)
+        ...
+
+Komut satırından:
+    python benchmarks/sahte_sunucu.py [--port 8000] [--gecikme 0.05] [--hata-orani 0.01] [--carpan 1]
+                                      [--liste-boyutu 50] [--anlik-saatlik 40] [--kayitlar yanitlar.json]
+"""
+import sys
+import json
+import time
+import zlib
+import random
+import hashlib
+import argparse
+import datetime as dt
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from seffaflik.__ortak.__uc_noktalar import UC_NOKTALAR
+
+METIN_ALANLARI = ("name", "eic", "code", "contract", "conract", "type", "direction", "status", "city", "reason",
+                  "subject", "message", "district", "week", "orgname")
+TARIH_ALANLARI = ("date", "day", "period", "donem", "version", "versiyon")
+# Kayıtları modülde elle ayrıştırılan (tanımında sütun bulunmayan) uç noktaların alanları ve zaman başına kayıt sayısı.
+# Sözlük tipli alanlar kayıt sırasıyla anahtarlarını, sayı tipli alanlar sabit değerlerini alır.
+__kurulu_guc_tipleri = {"WIND": 0, "SUN": 0, "GEOTHERMAL": 0, "BIOMASS": 0, "RIVER": 0, "RESERVOIR": 0, "LANDFILL": 0}
+__profiller = {"AYDINLATMA": 0, "DIGER": 0, "MESKEN": 0, "SANAYI": 0, "TARIMSAL": 0, "TICARETHANE": 0}
+__lisanslar = {"URETIM": 0, "TEDARIK": 0, "DAGITIM": 0, "ILETIM": 0, "OTOPRODUKTOR": 0}
+__islemler = {"gasDay": "zaman", "transactionDate": "zaman", "contractName": "metin", "price": "sayi",
+              "quantity": "sayi", "direction": {"GIRIS": 0, "CIKIS": 0}}
+SEKILLER = {
+    "santraller.kurulu_guc": ({"capacityType": {"ALL": 0, "LICENSED": 0, "UNLICENSED": 0}, "capacity": "sayi"}, 3),
+    "yekdem.kurulu_guc": ({"capacityType": __kurulu_guc_tipleri, "capacity": "sayi"}, len(__kurulu_guc_tipleri)),
+    "stp.ilave_dengeleyici_3_kodlu_islemler": (__islemler, 1),
+    "stp.ilave_dengeleyici_4_kodlu_islemler": (__islemler, 1),
+    "genel.katilimci_sayisi": ({"licence": __lisanslar, "privateSector": "sayi", "publicCompany": "sayi",
+                                "privateSectorOfSum": 1000, "publicCompanyOfSum": 100}, len(__lisanslar)),
+    "tuketim.profil_serbest_tuketici_sayisi": ({"id.date": "zaman", "id.profilAboneGrupAdi": __profiller,
+                                                "stCount": "sayi"}, len(__profiller)),
+}
+
+
+class SahteSunucu:
+    """
+    Ayrı bir iş parçacığında çalışan sahte Şeffaflık Platformu sunucusu.
+
+    Parametreler
+    ------------
+    port          : dinlenecek port; 0 ise boş bir port seçilir (Varsayılan: 0)
+    gecikme       : saniye cinsinden her yanıttan önce beklenecek ortalama süre; süre [0, 2 * gecikme] aralığında
+                    rastgele seçilir (Varsayılan: 0)
+    hata_orani    : isteklerin 503 ile yanıtlanma olasılığı (Varsayılan: 0)
+    carpan        : sentetik yanıtlarda zaman başına kayıt sayısı çarpanı (Varsayılan: 1)
+    liste_boyutu  : tarih aralığı almayan listelerdeki (organizasyonlar, santraller, UEVÇB'ler, ...) kayıt sayısı
+                    (Varsayılan: 50)
+    anlik_saatlik : anlık verilerde (işlem akışı, bildirimler, ...) saat başına kayıt sayısı (Varsayılan: 40)
+    kayitlar      : {uç nokta yolu: yanıt} formatında kayıtlı yanıtlar ya da bu sözlüğü içeren JSON dosyası; yanıt
+                    platformun tam yanıtı ya da yalnızca "body" kısmı olabilir (Varsayılan: None)
+    """
+
+    def __init__(self, port=0, gecikme=0.0, hata_orani=0.0, carpan=1, liste_boyutu=50, anlik_saatlik=40,
+                 kayitlar=None):
+        if isinstance(kayitlar, str):
+            with open(kayitlar, encoding="utf-8") as f:
+                kayitlar = json.load(f)
+        self.gecikme, self.hata_orani = gecikme, hata_orani
+        self.boyutlar = {"carpan": carpan, "liste_boyutu": liste_boyutu, "anlik_saatlik": anlik_saatlik}
+        self.kayitlar = {yol.strip("/").split("?")[0]: yanit for yol, yanit in (kayitlar or {}).items()}
+        self.tanimlar = tanimlar()
+        self.sayaclar = {"istek": 0, "hata": 0, "degismedi": 0, "bayt": 0}
+        self._kilit = threading.Lock()
+        self._rastgele = random.Random(0)
+        self._sunucu = ThreadingHTTPServer(("127.0.0.1", port), isleyici(self))
+        self._sunucu.daemon_threads = True
+        self._is_parcacigi = None
+
+    @property
+    def adres(self):
+        """ayarlar(ana_url=...) ile kullanılacak sunucu adresi"""
+        return "http://127.0.0.1:" + str(self._sunucu.server_address[1]) + "/"
+
+    def baslat(self):
+        self._is_parcacigi = threading.Thread(target=self._sunucu.serve_forever, name="sahte-sunucu", daemon=True)
+        self._is_parcacigi.start()
+        return self
+
+    def durdur(self):
+        self._sunucu.shutdown()
+        self._sunucu.server_close()
+
+    def sifirla(self):
+        with self._kilit:
+            self.sayaclar.update({anahtar: 0 for anahtar in self.sayaclar})
+
+    def __enter__(self):
+        return self.baslat()
+
+    def __exit__(self, *args):
+        self.durdur()
+
+    def yanit(self, yol, sorgu):
+        """Uç nokta yolu ve sorgu parametreleri için yanıt gövdesini (bayt) verir; bilinmeyen uç noktalarda None."""
+        if yol in self.kayitlar:
+            kayitli = self.kayitlar[yol]
+            kayitli = kayitli if isinstance(kayitli, dict) and "body" in kayitli else {"body": kayitli}
+            return json.dumps(dict({"resultCode": "0", "resultDescription": "success"}, **kayitli)).encode()
+        tanim = self.tanimlar.get(yol)
+        if tanim is None:
+            return None
+        return json.dumps({"resultCode": "0", "resultDescription": "success",
+                           "body": {tanim["anahtar"]: sentetik_kayitlar(tanim, sorgu, **self.boyutlar)}}).encode()
+
+    def _rastgele_sayi(self):
+        with self._kilit:
+            return self._rastgele.random()
+
+    def _say(self, **artislar):
+        with self._kilit:
+            for anahtar, artis in artislar.items():
+                self.sayaclar[anahtar] += artis
+
+
+def isleyici(sunucu):
+    class Isleyici(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            adres = urlsplit(self.path)
+            sunucu._say(istek=1)
+            if sunucu.gecikme:
+                time.sleep(sunucu._rastgele_sayi() * 2 * sunucu.gecikme)
+            if sunucu.hata_orani and sunucu._rastgele_sayi() < sunucu.hata_orani:
+                sunucu._say(hata=1)
+                return self._gonder(503, b"", {"Retry-After": "0"})
+            govde = sunucu.yanit(adres.path.strip("/"), {a: d[-1] for a, d in parse_qs(adres.query).items()})
+            if govde is None:
+                sunucu._say(hata=1)
+                return self._gonder(404, b"")
+            etag = '"' + hashlib.md5(govde).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                sunucu._say(degismedi=1)
+                return self._gonder(304, b"", {"ETag": etag})
+            sunucu._say(bayt=len(govde))
+            self._gonder(200, govde, {"ETag": etag, "Content-Type": "application/json"})
+
+        def _gonder(self, durum, govde, basliklar=None):
+            if govde and "gzip" in self.headers.get("Accept-Encoding", ""):
+                sikistirici = zlib.compressobj(1, zlib.DEFLATED, 31)
+                govde = sikistirici.compress(govde) + sikistirici.flush()
+                basliklar = dict(basliklar or {}, **{"Content-Encoding": "gzip"})
+            self.send_response(durum)
+            for ad, deger in (basliklar or {}).items():
+                self.send_header(ad, deger)
+            self.send_header("Content-Length", str(len(govde)))
+            self.end_headers()
+            self.wfile.write(govde)
+
+        def log_message(self, *args):
+            pass
+
+    return Isleyici
+
+
+def tanimlar():
+    # Aynı yolu kullanan uç noktaların (ör: gop.hacim, gop.organizasyon_hacim) alanları birleştirilir
+    sonuc = {}
+    for ad, tanim in UC_NOKTALAR.items():
+        birlesik = sonuc.setdefault(tanim["yol"].split("?")[0], {
+            "anahtar": tanim["anahtar"], "alanlar": {}, "zaman": tanim["zaman"], "ayrinti": tanim["ayrinti"],
+            "sorgu": set(), "tekrar": 1})
+        birlesik["sorgu"].update(tanim["sorgu"])
+        if ad in SEKILLER:
+            birlesik["alanlar"].update(SEKILLER[ad][0])
+            birlesik["tekrar"] = max(birlesik["tekrar"], SEKILLER[ad][1])
+        if tanim["zaman"] is not None:
+            birlesik["alanlar"][tanim["zaman"]] = "zaman"
+        for hedef, kaynak in tanim["sutunlar"].items():
+            tip = tanim["tipler"].get(hedef)
+            birlesik["alanlar"][kaynak] = tip if isinstance(tip, dict) else alan_tipi(kaynak, tip)
+    return sonuc
+
+
+def alan_tipi(alan, tip):
+    ad = alan.rsplit(".", 1)[-1].lower()
+    if tip in ("tarih", "zaman", "gun", "donem", "ay") or any(a in ad for a in TARIH_ALANLARI):
+        return "zaman"
+    if ad == "id" or ad.endswith("id"):
+        return "id"
+    if any(a in ad for a in METIN_ALANLARI):
+        return "metin"
+    return "sayi"
+
+
+def sentetik_kayitlar(tanim, sorgu, carpan=1, liste_boyutu=50, anlik_saatlik=40):
+    # Aynı sorgu her seferinde aynı değerleri alır
+    rastgele = random.Random(zlib.crc32(json.dumps([tanim["anahtar"], sorted(sorgu.items())]).encode()))
+    tekrar = tanim.get("tekrar", 1)
+    return [kayit(tanim["alanlar"], zaman, i, rastgele)
+            for i, zaman in enumerate(z for z in zamanlar(tanim, sorgu, carpan, liste_boyutu, anlik_saatlik)
+                                      for _ in range(tekrar))]
+
+
+def zamanlar(tanim, sorgu, carpan, liste_boyutu, anlik_saatlik):
+    ilk, son = aralik(sorgu)
+    adim = None
+    if ilk is None and tanim["ayrinti"] is not None and not tanim["sorgu"]:
+        # Tarih almayan zaman serileri (ör: aylık serbest tüketici sayısı) liste_boyutu adımlık geçmişi verir
+        ilk, son, adim = dt.date(2019, 1, 1), dt.date.max, liste_boyutu
+    if ilk is None or ("startDate" not in tanim["sorgu"] and tanim["ayrinti"] is None and tanim["zaman"] is None):
+        # Referans listeleri (organizasyonlar, santraller, UEVÇB'ler, ...)
+        return [dt.datetime.combine(ilk or dt.date(2019, 1, 1), dt.time())] * (liste_boyutu * carpan)
+    sonuc, zaman = [], dt.datetime.combine(ilk, dt.time())
+    while zaman.date() <= son and adim != 0:
+        adim = None if adim is None else adim - 1
+        if tanim["ayrinti"] == "anlik":
+            adet = anlik_saatlik * carpan
+            sonuc.extend(zaman + dt.timedelta(seconds=3600 * k // adet) for k in range(adet))
+        else:
+            sonuc.extend([zaman] * carpan)
+        if tanim["ayrinti"] == "aylik":
+            zaman = dt.datetime(zaman.year + zaman.month // 12, zaman.month % 12 + 1, 1)
+        else:
+            zaman += {"gunluk": dt.timedelta(days=1), "haftalik": dt.timedelta(days=7)}.get(
+                tanim["ayrinti"], dt.timedelta(hours=1))
+    return sonuc
+
+
+def aralik(sorgu):
+    try:
+        if "startDate" in sorgu:
+            return dt.date.fromisoformat(sorgu["startDate"][:10]), dt.date.fromisoformat(sorgu["endDate"][:10])
+        if "period" in sorgu:
+            gun = dt.date.fromisoformat(sorgu["period"][:10])
+            return gun, gun
+    except (KeyError, ValueError):
+        pass
+    return None, None
+
+
+def kayit(alanlar, zaman, sira, rastgele):
+    sonuc = {}
+    for alan, tip in alanlar.items():
+        if tip == "zaman":
+            deger = zaman.strftime("%Y-%m-%dT%H:%M:%S.000+0300")
+        elif tip == "id":
+            deger = sira + 1
+        elif tip == "metin":
+            deger = alan.rsplit(".", 1)[-1] + "-" + str(sira)
+        elif isinstance(tip, dict):
+            anahtarlar = list(tip)
+            deger = anahtarlar[sira % len(anahtarlar)]
+        elif isinstance(tip, (int, float)):
+            deger = tip
+        else:
+            deger = round(rastgele.random() * 1000, 2)
+        *ust, son = alan.split(".")
+        hedef = sonuc
+        for parca in ust:
+            hedef = hedef.setdefault(parca, {})
+        hedef[son] = deger
+    return sonuc
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Yerel sahte Şeffaflık Platformu sunucusu")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--gecikme", type=float, default=0.0)
+    parser.add_argument("--hata-orani", type=float, default=0.0)
+    parser.add_argument("--carpan", type=int, default=1)
+    parser.add_argument("--liste-boyutu", type=int, default=50)
+    parser.add_argument("--anlik-saatlik", type=int, default=40)
+    parser.add_argument("--kayitlar", default=None)
+    argumanlar = parser.parse_args()
+    sunucu = SahteSunucu(argumanlar.port, argumanlar.gecikme, argumanlar.hata_orani, argumanlar.carpan,
+                         argumanlar.liste_boyutu, argumanlar.anlik_saatlik, argumanlar.kayitlar)
+    # İlk satır adresi verir; benchmark betikleri sunucuyu ayrı süreçte başlatıp adresi buradan okur
+    print(sunucu.adres, flush=True)
+    print("seffaflik.ayarlar(ana_url=\"" + sunucu.adres + "\", onbellek=False, bellek_suresi=0)", file=sys.stderr)
+    try:
+        sunucu._sunucu.serve_forever()
+    except KeyboardInterrupt:
+        sunucu.durdur()
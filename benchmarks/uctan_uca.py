@@ -0,0 +1,70 @@
+"""
+Yerel sahte sunucuya (sahte_sunucu.py) karşı uçtan uca ölçüm: temsili çağrılar için toplam süre, en yüksek bellek
+kullanımı (tracemalloc, ayrı bir çalıştırmada) ile metriklerden (seffaflik.metrikler) alınan istek sayısı ve alınan
+bayt. Sunucu ayrı bir süreçte çalışır; böylece yanıtların üretilmesi ölçülen sürece dahil olmaz. Disk, bellek ve
+koşullu istek önbellekleri kapatılır; her senaryo tüm verisini sahte sunucudan çeker.
+
+Kullanım:
+    python benchmarks/uctan_uca.py [--gecikme 0.02] [--hata-orani 0.01] [--carpan 1] [senaryo ...]
+"""
+import os
+import sys
+import time
+import argparse
+import subprocess
+import tracemalloc
+
+import seffaflik
+from seffaflik.elektrik import uretim
+from seffaflik.elektrik.piyasalar import genel, gip
+
+SENARYOLAR = {
+    "tum_uevcb_kgup": lambda: uretim.tum_uevcb_kgup("2019-01-01", "2019-01-07"),
+    "genel.fiyat(yillik)": lambda: genel.fiyat("2019-01-01", "2019-12-31", periyot="yillik"),
+    "gip.islem_akisi": lambda: gip.islem_akisi("2019-01-01", "2019-12-31"),
+}
+
+
+def sunucu_baslat(gecikme, hata_orani, carpan):
+    betik = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sahte_sunucu.py")
+    surec = subprocess.Popen([sys.executable, betik, "--port", "0", "--gecikme", str(gecikme), "--hata-orani",
+                              str(hata_orani), "--carpan", str(carpan), "--liste-boyutu", "20"],
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+                             env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+    return surec, surec.stdout.readline().strip()
+
+
+def olc(senaryo):
+    seffaflik.metrikler(sifirla=True)
+    baslangic = time.perf_counter()
+    df = SENARYOLAR[senaryo]()
+    sure = time.perf_counter() - baslangic
+    metrikler = seffaflik.metrikler(sifirla=True).values()
+    istek = sum(m["istek"] for m in metrikler)
+    bayt = sum(m["bayt"] for m in metrikler)
+    tracemalloc.start()
+    SENARYOLAR[senaryo]()
+    tepe = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return sure, tepe, istek, bayt, 0 if df is None else len(df)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("senaryolar", nargs="*", default=list(SENARYOLAR))
+    parser.add_argument("--gecikme", type=float, default=0.0)
+    parser.add_argument("--hata-orani", type=float, default=0.0)
+    parser.add_argument("--carpan", type=int, default=1)
+    argumanlar = parser.parse_args()
+    surec, adres = sunucu_baslat(argumanlar.gecikme, argumanlar.hata_orani, argumanlar.carpan)
+    try:
+        seffaflik.ayarlar(ana_url=adres, onbellek=False, bellek_suresi=0, kosullu_istek=False)
+        print("{:<22} {:>10} {:>10} {:>8} {:>10} {:>9}".format("senaryo", "süre", "bellek", "istek", "bayt",
+                                                                  "satır"))
+        for senaryo in argumanlar.senaryolar:
+            sure, tepe, istek, bayt, satir = olc(senaryo)
+            print("{:<22} {:>7.2f} sn {:>7.1f} MB {:>8} {:>7.1f} MB {:>9}".format(
+                senaryo, sure, tepe / 2 ** 20, istek, bayt / 2 ** 20, satir))
+    finally:
+        surec.terminate()
+        surec.wait()
@@ -0,0 +1,47 @@
+"""
+Zaman damgası ayrıştırma karşılaştırması: satır satır (apply) ayrıştırma ile vektörel ayrıştırma. Varsayılan olarak
+bir yıllık saatlik veri (8760 satır) kullanılır.
+
+Kullanım:
+    python benchmarks/zaman_damgasi.py [gun_sayisi]
+"""
+import sys
+import timeit
+
+import pandas as pd
+
+from seffaflik.__ortak.__araclar import tarih_saat_ekle
+
+
+def ornek_veri(gun_sayisi):
+    saatler = pd.date_range("2019-01-01", periods=gun_sayisi * 24, freq="h")
+    return pd.DataFrame({"date": saatler.strftime("%Y-%m-%dT%H:%M:%S.000+0300"), "price": 1.0})
+
+
+def satir_satir(df):
+    df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
+    df["Tarih"] = pd.to_datetime(df["date"].apply(lambda d: d[:10]))
+    return df
+
+
+def satir_satir_to_datetime(df):
+    df["Saat"] = df["date"].apply(pd.to_datetime).dt.hour
+    df["Tarih"] = pd.to_datetime(df["date"].apply(pd.to_datetime).dt.date)
+    return df
+
+
+def vektorel(df):
+    return tarih_saat_ekle(df)
+
+
+if __name__ == "__main__":
+    gun_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    df = ornek_veri(gun_sayisi)
+    eski, yeni = satir_satir(df.copy()), vektorel(df.copy())
+    assert (eski["Saat"].values == yeni["Saat"].values).all()
+    assert (eski["Tarih"].values == yeni["Tarih"].values).all()
+    tekrar = 20
+    for ad, f in (("apply(pd.to_datetime)", satir_satir_to_datetime), ("satır satır (apply)", satir_satir),
+                  ("vektörel", vektorel)):
+        sure = min(timeit.repeat(lambda: f(df.copy()), number=1, repeat=1 if f is satir_satir_to_datetime else tekrar))
+        print("{:<22}: {:9.2f} ms ({} satır)".format(ad, sure * 1000, len(df)))
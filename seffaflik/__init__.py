@@ -1,4 +1,38 @@
-from seffaflik import elektrik
-from seffaflik._kimlik import Kimlik
+"""
+EPİAŞ tarafından Şeffaflık Platformunda yayımlanmakta olan verileri çekmek için tasarlanmış Python kütüphanesi.
+
+Alt paketler (elektrik, dogalgaz, aio, ...) ve pandas/requests gerektiren fonksiyonlar ilk erişildiklerinde yüklenir
+(PEP 562); böylece "import seffaflik" yalnızca ayarları yükler.
+"""
+import importlib as __importlib
+
+from seffaflik._ayarlar import ayarlar, uc_nokta_ayarlari
+from seffaflik.__ortak.__metrik import metrikler, metrik_kancasi_ekle, metrik_kancasi_kaldir
 
 __version__ = "0.0.22"
+
+__alt_moduller = ("elektrik", "dogalgaz", "aio", "senkron", "veri_seti")
+__nitelikler = {
+    "Kimlik": "seffaflik._kimlik",
+    "baglanti_sayaclari": "seffaflik.__ortak.__oturum",
+    "onbellek_temizle": "seffaflik.__ortak.__onbellek",
+    "arrow_tablosu": "seffaflik.__ortak.__veri_tipi",
+}
+# "from seffaflik import *" tembel yüklenen adları da __getattr__ üzerinden verir
+__all__ = ["ayarlar", "uc_nokta_ayarlari", "metrikler", "metrik_kancasi_ekle", "metrik_kancasi_kaldir",
+           "elektrik", "dogalgaz", "aio", "senkron", "veri_seti",
+           "Kimlik", "baglanti_sayaclari", "onbellek_temizle", "arrow_tablosu"]
+
+
+def __getattr__(ad):
+    if ad in __alt_moduller:
+        return __importlib.import_module("seffaflik." + ad)
+    if ad in __nitelikler:
+        deger = getattr(__importlib.import_module(__nitelikler[ad]), ad)
+        globals()[ad] = deger
+        return deger
+    raise AttributeError("module 'seffaflik' has no attribute '" + ad + "'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__alt_moduller) | set(__nitelikler))
@@ -1,12 +1,29 @@
-import requests as __requests
 from requests import ConnectionError as __ConnectionError
 from requests.exceptions import HTTPError as __HTTPError, RequestException as __RequestException, Timeout as __Timeout
+import os as __os
+import time as __time
+import numpy as __np
 import pandas as __pd
 import logging as __logging
+import threading as __threading
+import collections as __collections
+from concurrent.futures import Future as __Future
+from seffaflik import _ayarlar as __ayarlar
 from seffaflik.__ortak.__anahtar import HEADERS
+from seffaflik.__ortak import __oturum
+from seffaflik.__ortak import __cozucu
+from seffaflik.__ortak import __kaset
+from seffaflik.__ortak import __metrik
+from seffaflik.__ortak import __veri_tipi
 from seffaflik.__ortak.__dogrulama import __check_http_error
-from seffaflik.__ortak.__parametreler import __timeout, __requestsConnectionErrorLogging, \
-    __requestsTimeoutErrorLogging, __request_error
+from seffaflik.__ortak.__parametreler import __requestsConnectionErrorLogging, __requestsTimeoutErrorLogging, \
+    __request_error, __kosullu_istek_boyutu
+
+__kosullu_kilit = __threading.Lock()
+__kosullu_yanitlar = __collections.OrderedDict()
+__kosullu_bayt = [0]
+__ucustaki_kilit = __threading.Lock()
+__ucustaki_istekler = {}
 
 
 def __merge_ia_dfs_evenif_empty(df_arz, df_talep):
@@ -40,19 +57,293 @@ def __merge_ia_dfs_evenif_empty(df_arz, df_talep):
     return df
 
 
-def make_requests(corresponding_url):
-    main_url = "https://seffaflik.epias.com.tr/transparency/service/"
+__AYLAR = __np.array(["", "Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", "Temmuz", "Ağustos", "Eylül", "Ekim",
+                      "Kasım", "Aralık"], dtype=object)
+
+
+def zaman(seri):
+    """
+    Şeffaflık Platformunun ISO 8601 formatındaki zaman bilgilerini (ör: "2019-01-01T00:00:00.000+0300") tek seferde,
+    vektörel olarak İstanbul yerel saatine (duvar saati) çevirir. Platform zamanları İstanbul yerel saatiyle
+    verdiğinden UTC farkı satır satır ayrıştırılmaz; böylece yaz saati geçişlerindeki saatler de yayımlandığı gibi
+    korunur.
+
+    Parametreler
+    ------------
+    seri : metin formatında zaman bilgilerini içeren pandas.Series
+
+    Geri Dönüş Değeri
+    -----------------
+    Yerel Zaman (datetime64)
+    """
+    return __pd.to_datetime(seri.str.slice(0, 19), format="ISO8601")
+
+
+def tarih(seri):
+    """
+    Zaman bilgilerinden yerel takvim gününü verir.
+
+    Parametreler
+    ------------
+    seri : metin formatında zaman bilgilerini içeren pandas.Series
+
+    Geri Dönüş Değeri
+    -----------------
+    Tarih (datetime64)
+    """
+    return zaman(seri).dt.normalize()
+
+
+def saat(seri):
+    """
+    Zaman bilgilerinden yerel saati verir.
+
+    Parametreler
+    ------------
+    seri : metin formatında zaman bilgilerini içeren pandas.Series
+
+    Geri Dönüş Değeri
+    -----------------
+    Saat (int64)
+    """
+    return zaman(seri).dt.hour.astype("int64")
+
+
+def tarih_saat_ekle(df, sutun="date"):
+    """
+    İlgili sütundaki zaman bilgilerinden "Tarih" (yerel takvim günü) ve "Saat" (yerel saat) sütunlarını tek bir
+    vektörel ayrıştırma ile oluşturur.
+
+    Parametreler
+    ------------
+    df    : pandas.DataFrame
+    sutun : zaman bilgisini içeren sütun adı (Varsayılan: "date")
+
+    Geri Dönüş Değeri
+    -----------------
+    Tarih ve Saat Sütunları Eklenmiş DataFrame
+    """
+    yerel = zaman(df[sutun])
+    df["Saat"] = yerel.dt.hour.astype("int64")
+    df["Tarih"] = yerel.dt.normalize()
+    return df
+
+
+def donem(seri):
+    """
+    Zaman bilgilerini "Ocak-2019" formatındaki dönem bilgisine çevirir.
+
+    Parametreler
+    ------------
+    seri : metin formatında zaman bilgilerini içeren pandas.Series
+
+    Geri Dönüş Değeri
+    -----------------
+    Dönem (metin)
+    """
+    yerel = zaman(seri)
+    return __pd.Series(__AYLAR[yerel.dt.month.to_numpy()], index=seri.index) + "-" + yerel.dt.year.astype(str)
+
+
+def birim_tablosu(list_df, anahtar=("Tarih", "Saat"), bicim="genis"):
+    """
+    Her biri anahtar sütunları ve tek bir değer sütunu (birim adı) içeren birim (organizasyon, UEVÇB, santral, ...)
+    sonuçlarını tek geçişte birleştirir. Sonuçlar birim anahtarıyla uzun formatta alt alta eklenir ve tek seferde ortak
+    anahtar dizinine yayılır; ikili dış birleştirmelerdeki (merge) gibi her adımda büyüyen tablo yeniden kopyalanmaz.
+    Boş sonuçlar atlanır; bir birimde tekrar eden anahtarların ilki kullanılır.
+
+    Biçimler:
+        genis  : her birim için bir sütun içeren geniş tablo
+        uzun   : anahtar sütunları, kategorik "Birim" ve "Değer" sütunlarından oluşan uzun format; yalnızca veri olan
+                 satırları içerir. "Saat" int8 olarak verilir. Aynı adı taşıyan farklı birimlerin adlarına sıra
+                 numarası eklenir (ör: "X (2)")
+        seyrek : geniş tablo; birim sütunları boş değerleri saklamayan seyrek (sparse) sütunlardır
+    Uzun ve seyrek biçimlerde ondalıklı değerler float32 olarak verilir. Geniş ve seyrek biçimlerde veri tipi
+    politikası (ayarlar(veri_tipi=...)) uygulanır.
+
+    Parametreler
+    ------------
+    list_df : birim sırasıyla DataFrame listesi
+    anahtar : birleştirmede kullanılacak sütunlar (Varsayılan: ("Tarih", "Saat"))
+    bicim   : "genis", "uzun" yada "seyrek" (Varsayılan: "genis")
+
+    Geri Dönüş Değeri
+    -----------------
+    Anahtar sırasında birleştirilmiş birim sonuçları (DataFrame)
+    """
+    anahtar = list(anahtar)
+    list_df = [df for df in list_df if df is not None and len(df) > 0]
+    if len(list_df) == 0:
+        return __pd.DataFrame()
+    adlar = [next(s for s in df.columns if s not in anahtar) for df in list_df]
+    kodlar = __np.repeat(__np.arange(len(list_df)), [len(df) for df in list_df])
+    sutunlar = {a: __np.concatenate([df[a].to_numpy() for df in list_df]) for a in anahtar}
+    degerler = __np.concatenate([df[ad].to_numpy() for df, ad in zip(list_df, adlar)])
+    if bicim != "genis" and degerler.dtype.kind == "f":
+        degerler = degerler.astype("float32")
+    dizin = __pd.MultiIndex.from_arrays([sutunlar[a] for a in anahtar] + [kodlar], names=anahtar + [None])
+    ilk = ~dizin.duplicated()
+    if bicim == "uzun":
+        df = __pd.DataFrame({a: d[ilk] for a, d in sutunlar.items()})
+        if "Saat" in df.columns:
+            df["Saat"] = df["Saat"].astype("int8")
+        # Her birim ayrı bir kategoridir; aynı adı taşıyan farklı birimler birleştirilmez
+        df["Birim"] = __pd.Categorical.from_codes(kodlar[ilk], categories=__ayirt_edilebilir(adlar))
+        df["Değer"] = degerler[ilk]
+        df = df[df["Değer"].notna()]
+        return df.sort_values(anahtar, kind="stable", ignore_index=True)
+    seri = __pd.Series(degerler, index=dizin)
+    seri = seri[ilk]
+    df = seri.unstack(level=-1)
+    if bicim == "seyrek":
+        df = df.astype(__pd.SparseDtype(df.dtypes.iloc[0], __np.nan))
+    df.columns = adlar
+    return __veri_tipi.uygula(df.reset_index())
+
+
+def __ayirt_edilebilir(adlar):
+    # Tekrar eden birim adlarına sıra numarası eklenir (ör: "X", "X (2)")
+    sayilar, sonuc = {}, []
+    for ad in adlar:
+        sayilar[ad] = sayilar.get(ad, 0) + 1
+        sonuc.append(ad if sayilar[ad] == 1 else ad + " (" + str(sayilar[ad]) + ")")
+    return sonuc
+
+
+def make_requests(corresponding_url, yol=(), kosullu=True):
+    """
+    İlgili uç noktaya GET isteği yapar ve ayrıştırılmış JSON yanıtını verir. Aynı adres için eşzamanlı yapılan
+    çağrılar tek istekte birleştirilir (single-flight): ilk çağrı isteği yapar, yanıt beklenirken gelen diğer çağrılar
+    aynı ayrıştırılmış yanıtı alır. Yanıt ayarlar(json_cozucu=...) ile seçilen çözücüyle çözülür; ayarlar(
+    json_alt_agac=True) ise yalnızca yol üzerindeki alt ağaç çözülür. Hatalar kayda geçirilir ve None verilir.
+    kosullu=False ise yanıt koşullu istek için saklanmaz; tarih aralığı alan, pencere pencere ya da parça parça
+    çekilen uç noktaların yanıtları böylece bellekte tutulmaz.
+
+    Parametreler
+    ------------
+    corresponding_url : metin formatında uç nokta adresi
+    yol               : kayıt listesinin yanıttaki yolu (ör: ("body", "hourlyGenerations")) (Varsayılan: ())
+    kosullu           : yanıtın ETag/Last-Modified ile doğrulanmak üzere saklanıp saklanmayacağı (Varsayılan: True)
+
+    Geri Dönüş Değeri
+    -----------------
+    JSON Yanıtı (dict)
+    """
+    # Süreç kimliği anahtara eklenir; fork edilen alt süreç üst süreçte yarım kalmış istekleri beklemez
+    yol = tuple(yol) if yol and __ayarlar.deger("json_alt_agac", corresponding_url) else ()
+    anahtar = (__os.getpid(), corresponding_url, yol)
+    with __ucustaki_kilit:
+        gelecek = __ucustaki_istekler.get(anahtar)
+        ilk = gelecek is None
+        if ilk:
+            gelecek = __ucustaki_istekler[anahtar] = __Future()
+    if not ilk:
+        return gelecek.result()
+    try:
+        json = __istek_yap(corresponding_url, yol, kosullu)
+    except BaseException as e:
+        gelecek.set_exception(e)
+        raise
+    else:
+        gelecek.set_result(json)
+        return json
+    finally:
+        with __ucustaki_kilit:
+            __ucustaki_istekler.pop(anahtar, None)
+
+
+def __istek_yap(corresponding_url, yol=(), kosullu=True):
+    kaset = __kaset.mod(corresponding_url)
+    if kaset in ("oynat", "ekle"):
+        govde = __kaset.oku(corresponding_url)
+        __metrik.onbellek(corresponding_url, "kaset", govde is not None)
+        if govde is not None:
+            try:
+                return __coz(corresponding_url, govde, yol)
+            except ValueError:
+                __logging.error(__request_error, exc_info=False)
+                return
+        if kaset == "oynat":
+            __logging.error(corresponding_url + " için kasette kayıt bulunmamaktadır!")
+            return
+    main_url = __ayarlar.deger("ana_url", corresponding_url)
+    # Kayıtta yanıt gövdesi gerektiğinden koşullu istek yapılmaz
+    kosullu = kosullu and kaset is None and __ayarlar.deger("kosullu_istek", corresponding_url)
+    onceki = __kosullu_yanit(corresponding_url, yol) if kosullu else None
     try:
-        resp = __requests.get(main_url + corresponding_url, headers=HEADERS, timeout=__timeout)
-        resp.raise_for_status()
-        json = resp.json()
+        resp = __oturum.istek("GET", main_url + corresponding_url, corresponding_url,
+                              headers=HEADERS if onceki is None else dict(HEADERS, **onceki[0]))
+        if onceki is not None:
+            __metrik.onbellek(corresponding_url, "kosullu", resp.status_code == 304)
+        if resp.status_code == 304 and onceki is not None:
+            # Yanıt değişmemiş; önceki ayrıştırılmış yanıt (ve ondan oluşturulan DataFrame) yeniden kullanılır
+            json = onceki[1]
+        else:
+            json = __coz(corresponding_url, resp.content, yol)
+            if kaset is not None:
+                __kaset.yaz(corresponding_url, resp.content)
+            if kosullu:
+                __kosullu_sakla(corresponding_url, resp, json, yol, len(resp.content))
     except __ConnectionError:
         __logging.error(__requestsConnectionErrorLogging, exc_info=False)
     except __Timeout:
         __logging.error(__requestsTimeoutErrorLogging, exc_info=False)
     except __HTTPError as e:
         __check_http_error(e.response.status_code)
-    except __RequestException:
+    except (__RequestException, ValueError):
         __logging.error(__request_error, exc_info=False)
     else:
         return json
+
+
+def __coz(corresponding_url, govde, yol=()):
+    baslangic = __time.perf_counter()
+    json = __cozucu.coz(govde, yol, corresponding_url)
+    __metrik.cozme(corresponding_url, __time.perf_counter() - baslangic, len(govde))
+    return json
+
+
+def dogrulanabilir(corresponding_url):
+    """
+    İlgili adres için saklanmış, koşullu istekte kullanılabilecek (ETag/Last-Modified) bir yanıt olup olmadığını
+    verir.
+
+    Parametreler
+    ------------
+    corresponding_url : metin formatında uç nokta adresi
+
+    Geri Dönüş Değeri
+    -----------------
+    bool
+    """
+    with __kosullu_kilit:
+        return corresponding_url in __kosullu_yanitlar
+
+
+def __kosullu_yanit(corresponding_url, yol=()):
+    with __kosullu_kilit:
+        onceki = __kosullu_yanitlar.get(corresponding_url)
+        if onceki is None or onceki[2] != yol:
+            # Başka bir alt ağaçla çözülmüş yanıt yeniden kullanılamaz
+            return None
+        __kosullu_yanitlar.move_to_end(corresponding_url)
+        return onceki
+
+
+def __kosullu_sakla(corresponding_url, resp, json, yol=(), boyut=0):
+    basliklar = {}
+    if resp.headers.get("ETag"):
+        basliklar["If-None-Match"] = resp.headers["ETag"]
+    if resp.headers.get("Last-Modified"):
+        basliklar["If-Modified-Since"] = resp.headers["Last-Modified"]
+    with __kosullu_kilit:
+        eski = __kosullu_yanitlar.pop(corresponding_url, None)
+        if eski is not None:
+            __kosullu_bayt[0] -= eski[3]
+        # Sınırdan büyük yanıtlar saklanmaz; sınır yanıt gövdelerinin toplam boyutuna uygulanır
+        if not basliklar or boyut > __kosullu_istek_boyutu:
+            return
+        __kosullu_yanitlar[corresponding_url] = (basliklar, json, yol, boyut)
+        __kosullu_bayt[0] += boyut
+        while __kosullu_bayt[0] > __kosullu_istek_boyutu:
+            __kosullu_bayt[0] -= __kosullu_yanitlar.popitem(last=False)[1][3]
@@ -0,0 +1,117 @@
+"""
+Yanıt gövdelerinin JSON çözücüsü. ayarlar(json_cozucu="otomatik") ile yüklü olan en hızlı çözücü (orjson, simdjson,
+ujson, json sırasıyla) kullanılır; belirli bir çözücü adıyla da seçilebilir. Yüklü olmayan bir çözücü seçildiğinde
+uyarı verilip standart json modülü kullanılır.
+"""
+import json as __json
+import logging as __logging
+import threading as __threading
+import importlib as __importlib
+
+from seffaflik import _ayarlar as __ayarlar
+
+__SIRA = ("orjson", "simdjson", "ujson", "json")
+__moduller = {"json": __json}
+__uyarilanlar = set()
+__yerel = __threading.local()
+
+
+def cozucu(uc_nokta=None):
+    """
+    İlgili uç nokta için kullanılacak JSON çözücüsünün adını vermektedir.
+
+    Parametreler
+    ------------
+    uc_nokta : metin formatında uç nokta (uç nokta bazlı ayarlar için) (Varsayılan: None)
+
+    Geri Dönüş Değeri
+    -----------------
+    Çözücü Adı ("orjson", "simdjson", "ujson" ya da "json")
+    """
+    secim = __ayarlar.deger("json_cozucu", uc_nokta) or "otomatik"
+    if secim == "otomatik":
+        return next(ad for ad in __SIRA if __modul(ad) is not None)
+    if secim not in __SIRA:
+        __uyar(secim, "Geçersiz JSON çözücüsü: " + str(secim) + ". Geçerli çözücüler: otomatik, " + ", ".join(__SIRA))
+        return "json"
+    if __modul(secim) is None:
+        __uyar(secim, secim + " paketi yüklü değil; standart json modülü kullanılıyor!")
+        return "json"
+    return secim
+
+
+def coz(icerik, yol=(), uc_nokta=None):
+    """
+    Yanıt gövdesini çözer. Yol girildiği taktirde (ör: ("body", "hourlyGenerations")) belge yalnızca bu yol üzerindeki
+    alt ağacı içerecek şekilde, aynı yapıyla ({"body": {"hourlyGenerations": [...]}}) verilir; simdjson ile belgenin
+    geri kalanı Python nesnelerine çevrilmez. Yol yanıtta bulunmuyorsa (ör: hata yanıtları) tüm belge verilir.
+
+    Parametreler
+    ------------
+    icerik   : bayt formatında yanıt gövdesi
+    yol      : çözülecek alt ağacın anahtarları (Varsayılan: ())
+    uc_nokta : metin formatında uç nokta (uç nokta bazlı ayarlar için) (Varsayılan: None)
+
+    Geri Dönüş Değeri
+    -----------------
+    Çözülmüş JSON (dict, list, ...). Geçersiz içerikte ValueError fırlatılır
+    """
+    ad = cozucu(uc_nokta)
+    if ad == "simdjson":
+        return __simdjson_coz(icerik, yol)
+    belge = __moduller[ad].loads(icerik)
+    return __alt_agac(belge, yol)
+
+
+def __alt_agac(belge, yol):
+    dugum = belge
+    for anahtar in yol:
+        if not isinstance(dugum, dict) or anahtar not in dugum:
+            return belge
+        dugum = dugum[anahtar]
+    return __sar(dugum, yol)
+
+
+def __sar(dugum, yol):
+    for anahtar in reversed(yol):
+        dugum = {anahtar: dugum}
+    return dugum
+
+
+def __simdjson_coz(icerik, yol):
+    simdjson = __moduller["simdjson"]
+    # Ayrıştırıcı yeniden kullanıldığında önceki belge geçersizleşir; her iş parçacığı kendi ayrıştırıcısını kullanır
+    ayristirici = getattr(__yerel, "ayristirici", None)
+    if ayristirici is None:
+        ayristirici = __yerel.ayristirici = simdjson.Parser()
+    if len(yol) == 0:
+        return ayristirici.parse(icerik, True)
+    belge = ayristirici.parse(icerik)
+    try:
+        dugum = belge.at_pointer("/" + "/".join(yol))
+    except (KeyError, IndexError, TypeError, ValueError):
+        return __python(belge)
+    return __sar(__python(dugum), yol)
+
+
+def __python(dugum):
+    if hasattr(dugum, "as_list"):
+        return dugum.as_list()
+    if hasattr(dugum, "as_dict"):
+        return dugum.as_dict()
+    return dugum
+
+
+def __modul(ad):
+    if ad not in __moduller:
+        try:
+            __moduller[ad] = __importlib.import_module(ad)
+        except ImportError:
+            __moduller[ad] = None
+    return __moduller[ad]
+
+
+def __uyar(anahtar, mesaj):
+    if anahtar not in __uyarilanlar:
+        __uyarilanlar.add(anahtar)
+        __logging.warning(mesaj)
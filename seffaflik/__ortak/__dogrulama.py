@@ -93,9 +93,19 @@ def __tarih_dogrulama(tarih):
         return True
 
 
+def __bicim_dogrulama(bicim):
+    if bicim not in ["genis", "uzun", "seyrek"]:
+        __logging.warning(
+            "Biçim değeri metin formatında\n\t1) genis\n\t2) uzun\n\t3) seyrek\nseçeneklerinden biri olmalıdır!")
+        return False
+    return True
+
+
 def __check_http_error(error):
     if error == 401:
         __logging.error(__param.__requestsAuthenticationErrorLogging, exc_info=False)
+    elif error == 429 or error >= 500:
+        __logging.error(__param.__requestsServerErrorLogging, exc_info=False)
 
 
 def __kgup_girebilen_organizasyon_dogrulama(eic):
@@ -103,9 +113,9 @@ def __kgup_girebilen_organizasyon_dogrulama(eic):
         __logging.warning("EIC değeri metin formatında girilmelidir!")
         return False
     else:
+        from seffaflik.__ortak import __onbellek
         from seffaflik.elektrik import uretim
-        df_org = uretim.organizasyonlar()
-        if eic in df_org["EIC Kodu"].values:
+        if eic in __onbellek.dizin(uretim.organizasyonlar, "EIC Kodu"):
             return True
         else:
             __logging.warning("İlgili eic değeri KGÜP girebilecek organizasyonlar listesinde bulunmamaktadır!")
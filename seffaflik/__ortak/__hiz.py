@@ -0,0 +1,128 @@
+import os as __os
+import time as __time
+import hashlib as __hashlib
+import threading as __threading
+from contextlib import contextmanager as __contextmanager
+
+try:
+    import fcntl as __fcntl
+except ImportError:  # Windows: sınırlar yalnızca süreç içinde paylaşılır
+    __fcntl = None
+
+from seffaflik import _ayarlar as __ayarlar
+from seffaflik.__ortak.__parametreler import __seffaflik_dir
+
+__hiz_dir = __os.path.join(__seffaflik_dir, "hiz")
+__kilit = __threading.Lock()
+__kovalar = {}
+__semaforlar = {}
+__yoklama_araligi = 0.01
+
+
+@__contextmanager
+def sinir(uc_nokta=None):
+    """
+    İlgili uç nokta için tanımlı saniyede istek ve eşzamanlı istek sınırlarına uyulana kadar bekler; blok süresince
+    eşzamanlı istek yuvalarından birini tutar. Sınırlar tüm iş parçacıkları (aio fonksiyonları da iş parçacıklarında
+    çalıştığından asenkron görevler dahil) ve aynı makinedeki tüm süreçler arasında ortak kova/yuva dosyaları
+    üzerinden paylaşılır.
+
+    Parametreler
+    ------------
+    uc_nokta : metin formatında uç nokta (Varsayılan: None)
+    """
+    yuva = None
+    try:
+        while True:
+            yuva = __yuva_al(uc_nokta)
+            if yuva is not False:
+                break
+            __time.sleep(__yoklama_araligi)
+        while True:
+            bekleme = __jeton_al(uc_nokta)
+            if not bekleme:
+                break
+            __time.sleep(bekleme)
+        yield
+    finally:
+        __yuva_birak(yuva)
+
+
+def __dosya(tur, onek, *ekler):
+    ad = __hashlib.sha1(onek.encode("utf-8")).hexdigest()[:16]
+    if not __os.path.exists(__hiz_dir):
+        __os.makedirs(__hiz_dir, exist_ok=True)
+    return __os.path.join(__hiz_dir, "-".join((tur, ad) + tuple(str(e) for e in ekler)))
+
+
+def __jeton_al(uc_nokta):
+    """Kovadan bir jeton almaya çalışır; alınırsa 0, alınamazsa jeton birikene kadar beklenmesi gereken süreyi verir."""
+    hiz = __ayarlar.deger("saniyede_istek", uc_nokta)
+    if not hiz:
+        return 0
+    onek = __ayarlar.onek("saniyede_istek", uc_nokta)
+    kapasite = max(float(hiz), 1.0)
+    if __fcntl is None:
+        with __kilit:
+            kova = __kovalar.setdefault(onek, [kapasite, __time.time()])
+            kova[:], bekleme = __kovadan_dus(kova[0], kova[1], hiz, kapasite)
+        return bekleme
+    with open(__dosya("kova", onek), "a+") as f:
+        __fcntl.flock(f, __fcntl.LOCK_EX)
+        try:
+            f.seek(0)
+            try:
+                jeton, son = (float(x) for x in f.read().split())
+            except ValueError:
+                jeton, son = kapasite, __time.time()
+            (jeton, son), bekleme = __kovadan_dus(jeton, son, hiz, kapasite)
+            f.seek(0)
+            f.truncate()
+            f.write("{!r} {!r}".format(jeton, son))
+            f.flush()
+        finally:
+            __fcntl.flock(f, __fcntl.LOCK_UN)
+    return bekleme
+
+
+def __kovadan_dus(jeton, son, hiz, kapasite):
+    simdi = __time.time()
+    jeton = min(kapasite, jeton + max(simdi - son, 0) * hiz)
+    if jeton >= 1:
+        return [jeton - 1, simdi], 0
+    return [jeton, simdi], (1 - jeton) / hiz
+
+
+def __yuva_al(uc_nokta):
+    """Boş bir eşzamanlı istek yuvası almaya çalışır; sınır yoksa None, tüm yuvalar doluysa False verir."""
+    azami = __ayarlar.deger("azami_eszamanli_istek", uc_nokta)
+    if not azami:
+        return None
+    onek = __ayarlar.onek("azami_eszamanli_istek", uc_nokta)
+    if __fcntl is None:
+        with __kilit:
+            semafor = __semaforlar.get((onek, azami))
+            if semafor is None:
+                semafor = __semaforlar[(onek, azami)] = __threading.BoundedSemaphore(azami)
+        return semafor if semafor.acquire(blocking=False) else False
+    for i in range(int(azami)):
+        f = open(__dosya("yuva", onek, i), "a")
+        try:
+            __fcntl.flock(f, __fcntl.LOCK_EX | __fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            continue
+        return f
+    return False
+
+
+def __yuva_birak(yuva):
+    if yuva is None or yuva is False:
+        return
+    if isinstance(yuva, __threading.BoundedSemaphore):
+        yuva.release()
+        return
+    try:
+        __fcntl.flock(yuva, __fcntl.LOCK_UN)
+    finally:
+        yuva.close()
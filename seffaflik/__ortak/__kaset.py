@@ -0,0 +1,115 @@
+"""
+İsteklerin kayıt/oynatma (record/replay) kaseti. ayarlar(kaset=..., kaset_modu="kaydet") ile make_requests üzerinden
+yapılan her başarılı isteğin yanıt gövdesi gzip ile sıkıştırılmış bir kaset dosyasına (her satırı bir JSON kaydı)
+eklenir; ayarlar(kaset_modu="oynat") ile yanıtlar ağa çıkılmadan kasetten verilir. Böylece gece işleri ve geriye dönük
+testler aynı verilerle disk hızında tekrar çalıştırılabilir, ayrıştırma performansı ağ gürültüsü olmadan ölçülebilir.
+Kayıtlar uç nokta adresiyle (ana_url olmadan, sorgu parametreleriyle birlikte) eşleştirilir; aynı adres birden fazla
+kez kaydedilmişse son kayıt geçerlidir.
+"""
+import os as __os
+import gzip as __gzip
+import json as __json
+import logging as __logging
+import threading as __threading
+
+from seffaflik import _ayarlar as __ayarlar
+
+__MODLAR = ("kaydet", "oynat", "ekle")
+__kilit = __threading.Lock()
+__kasetler = {}
+__uyarilanlar = set()
+
+
+def mod(uc_nokta=None):
+    """
+    İlgili uç nokta için geçerli kaset modunu vermektedir. Kaset dosyası girilmemişse ya da mod geçersizse None
+    verilir.
+
+    Parametreler
+    ------------
+    uc_nokta : metin formatında uç nokta (uç nokta bazlı ayarlar için) (Varsayılan: None)
+
+    Geri Dönüş Değeri
+    -----------------
+    Kaset Modu ("kaydet", "oynat", "ekle" ya da None)
+    """
+    secim = __ayarlar.deger("kaset_modu", uc_nokta)
+    if secim is None or __ayarlar.deger("kaset", uc_nokta) is None:
+        return None
+    if secim not in __MODLAR:
+        if secim not in __uyarilanlar:
+            __uyarilanlar.add(secim)
+            __logging.warning("Geçersiz kaset modu: " + str(secim) + ". Geçerli modlar: " + ", ".join(__MODLAR))
+        return None
+    return secim
+
+
+def oku(uc_nokta):
+    """
+    İlgili uç nokta adresinin kasetteki yanıt gövdesini vermektedir.
+
+    Parametreler
+    ------------
+    uc_nokta : metin formatında uç nokta adresi (ör: "market/day-ahead-mcp?startDate=...")
+
+    Geri Dönüş Değeri
+    -----------------
+    Yanıt Gövdesi (bayt). Adres kasette yoksa None
+    """
+    return __yukle(__ayarlar.deger("kaset", uc_nokta)).get(uc_nokta)
+
+
+def yaz(uc_nokta, govde):
+    """
+    İlgili uç nokta adresinin yanıt gövdesini kasete ekler. Her kayıt ayrı bir gzip üyesi olarak tek seferde
+    eklenir; böylece yarıda kesilen işlerde o ana kadar kaydedilen yanıtlar korunur.
+
+    Parametreler
+    ------------
+    uc_nokta : metin formatında uç nokta adresi
+    govde    : bayt formatında yanıt gövdesi
+    """
+    dosya = __os.path.abspath(__ayarlar.deger("kaset", uc_nokta))
+    try:
+        satir = __json.dumps({"adres": uc_nokta, "govde": govde.decode("utf-8")}, ensure_ascii=False) + "\n"
+        sikistirilmis = __gzip.compress(satir.encode("utf-8"), compresslevel=6)
+        with __kilit:
+            __os.makedirs(__os.path.dirname(dosya), exist_ok=True)
+            with open(dosya, "ab") as f:
+                f.write(sikistirilmis)
+            kaset = __kasetler.get(dosya)
+            if kaset is not None:
+                kaset[1][uc_nokta] = govde
+                kaset[0] = __imza(dosya)
+    except (OSError, ValueError):
+        __logging.warning(uc_nokta + " yanıtı kasete yazılırken hata oluştu!", exc_info=True)
+
+
+def __yukle(dosya):
+    yol = __os.path.abspath(dosya)
+    imza = __imza(yol)
+    with __kilit:
+        kaset = __kasetler.get(yol)
+        if kaset is not None and kaset[0] == imza:
+            return kaset[1]
+    kayitlar = {}
+    if imza is not None:
+        try:
+            with __gzip.open(yol, "rt", encoding="utf-8") as f:
+                for satir in f:
+                    kayit = __json.loads(satir)
+                    kayitlar[kayit["adres"]] = kayit["govde"].encode("utf-8")
+        except (OSError, EOFError, ValueError, KeyError):
+            # Yarıda kesilmiş son kayıt dışındaki kayıtlar kullanılır
+            __logging.warning(dosya + " kaseti okunurken hata oluştu; okunabilen kayıtlar kullanılıyor!")
+    with __kilit:
+        __kasetler[yol] = [imza, kayitlar]
+    return kayitlar
+
+
+def __imza(dosya):
+    try:
+        durum = __os.stat(dosya)
+    except OSError:
+        return None
+    return durum.st_mtime_ns, durum.st_size
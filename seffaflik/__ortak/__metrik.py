@@ -0,0 +1,182 @@
+"""
+Uç nokta bazında istek, önbellek ve ayrıştırma metrikleri. Metrikler süreç belleğinde, uç nokta yolu (sorgu
+parametreleri olmadan, ör: "market/day-ahead-mcp") ya da günlük disk önbelleği için fonksiyon adı (ör:
+"elektrik.piyasalar.gop.ptf") bazında tutulur. Her olay kayda geçirildikten sonra eklenen kancalara (hook) iletilir;
+böylece metrikler Prometheus, OpenTelemetry gibi sistemlere aktarılabilir.
+"""
+import os as __os
+import bisect as __bisect
+import logging as __logging
+import threading as __threading
+from urllib.parse import urlsplit as __urlsplit
+
+from seffaflik.__ortak.__parametreler import __sure_dilimleri
+
+__kilit = __threading.Lock()
+__metrikler = {}
+__kancalar = []
+__durum = {"pid": None}
+
+
+def metrikler(sifirla=False):
+    """
+    Uç nokta bazında toplanan metriklerin anlık görüntüsünü vermektedir. Süreler saniye cinsindendir; süre dilimleri
+    (histogram) Prometheus'taki gibi kümülatiftir (üst sınıra eşit ya da küçük süreli istek sayısı).
+
+    Metrikler:
+        istek             : yapılan HTTP istek (deneme) sayısı
+        hata              : bağlantı hatası, zaman aşımı ya da 4xx/5xx ile sonuçlanan istek sayısı
+        tekrar            : geçici hatalar nedeniyle tekrar denenen istek sayısı
+        bayt              : alınan yanıt gövdelerinin toplam boyutu
+        sure              : isteklerin toplam süresi
+        sure_dilimleri    : {üst sınır: istek sayısı} formatında istek süresi dağılımı
+        onbellek_isabet   : önbellekten (bellek, disk, 304 yanıtı ya da kaset) karşılanan sonuç sayısı; günlük disk
+                            önbelleğinde gün sayısı
+        onbellek_iska     : önbellekte bulunmayıp platformdan çekilen sonuç sayısı
+        cozme             : JSON çözme sayısı
+        cozme_suresi      : JSON çözme süresi
+        ayristirma        : DataFrame'e ayrıştırma sayısı
+        ayristirma_suresi : DataFrame'e ayrıştırma süresi
+        satir             : ayrıştırılan toplam satır sayısı
+
+    Parametreler
+    ------------
+    sifirla : True ise görüntü alındıktan sonra metrikler sıfırlanır (Varsayılan: False)
+
+    Geri Dönüş Değeri
+    -----------------
+    Metrikler (dict: uç nokta -> metrik -> değer)
+    """
+    with __kilit:
+        __surec_kontrol()
+        goruntu = {}
+        for uc_nokta, metrik in __metrikler.items():
+            kopya = dict(metrik)
+            toplam, dilimler = 0, {}
+            for sinir, sayi in zip(__sure_dilimleri + (float("inf"),), metrik["sure_dilimleri"]):
+                toplam += sayi
+                dilimler[sinir] = toplam
+            kopya["sure_dilimleri"] = dilimler
+            goruntu[uc_nokta] = kopya
+        if sifirla:
+            __metrikler.clear()
+    return goruntu
+
+
+def metrik_kancasi_ekle(kanca):
+    """
+    Her metrik olayında çağrılacak fonksiyonu ekler. Fonksiyon olay bilgilerini içeren tek bir sözlükle çağrılır:
+        {"olay": "istek", "uc_nokta": ..., "sure": ..., "bayt": ..., "durum": ..., "deneme": ...}
+        {"olay": "tekrar", "uc_nokta": ..., "deneme": ..., "bekleme": ...}
+        {"olay": "onbellek", "uc_nokta": ..., "tur": "bellek" | "disk" | "kosullu" | "kaset",
+         "isabet": ..., "adet": ...}
+        {"olay": "cozme", "uc_nokta": ..., "sure": ..., "bayt": ...}
+        {"olay": "ayristirma", "uc_nokta": ..., "sure": ..., "satir": ...}
+    Kancalar isteği yapan iş parçacığında çağrılır; bu nedenle kısa sürmelidir. Kancada oluşan hatalar kayda geçirilir
+    ve yok sayılır.
+
+    Parametreler
+    ------------
+    kanca : olay sözlüğü alan fonksiyon
+    """
+    with __kilit:
+        if kanca not in __kancalar:
+            __kancalar.append(kanca)
+
+
+def metrik_kancasi_kaldir(kanca):
+    """
+    metrik_kancasi_ekle ile eklenen fonksiyonu kaldırır.
+
+    Parametreler
+    ------------
+    kanca : kaldırılacak fonksiyon
+    """
+    with __kilit:
+        if kanca in __kancalar:
+            __kancalar.remove(kanca)
+
+
+def yol(adres):
+    """
+    Adres ya da uç noktadan metriklerde kullanılan uç nokta yolunu (sorgu parametreleri olmadan) verir.
+
+    Parametreler
+    ------------
+    adres : metin formatında tam adres ya da uç nokta (ör: "market/day-ahead-mcp?startDate=...")
+
+    Geri Dönüş Değeri
+    -----------------
+    Uç Nokta Yolu (metin)
+    """
+    if "://" in adres:
+        return __urlsplit(adres).path
+    return adres.split("?", 1)[0]
+
+
+def istek(uc_nokta, sure, bayt=0, durum=None, deneme=1):
+    """HTTP isteğini (denemeyi) kayda geçirir. Durum kodu None ise istek bağlantı hatası ya da zaman aşımıyla
+    sonuçlanmıştır."""
+    hata = durum is None or durum >= 400
+    __kaydet(uc_nokta, {"istek": 1, "hata": int(hata), "bayt": bayt, "sure": sure},
+             __bisect.bisect_left(__sure_dilimleri, sure),
+             {"olay": "istek", "sure": sure, "bayt": bayt, "durum": durum, "deneme": deneme})
+
+
+def tekrar(uc_nokta, deneme, bekleme):
+    """Geçici bir hata nedeniyle isteğin bekleme saniye sonra tekrar deneneceğini kayda geçirir."""
+    __kaydet(uc_nokta, {"tekrar": 1}, None, {"olay": "tekrar", "deneme": deneme, "bekleme": bekleme})
+
+
+def onbellek(uc_nokta, tur, isabet, adet=1):
+    """Önbellek isabetini ya da ıskasını kayda geçirir."""
+    if adet <= 0:
+        return
+    __kaydet(uc_nokta, {"onbellek_isabet" if isabet else "onbellek_iska": adet}, None,
+             {"olay": "onbellek", "tur": tur, "isabet": isabet, "adet": adet})
+
+
+def cozme(uc_nokta, sure, bayt=0):
+    """Yanıt gövdesinin JSON çözme süresini kayda geçirir."""
+    __kaydet(uc_nokta, {"cozme": 1, "cozme_suresi": sure}, None, {"olay": "cozme", "sure": sure, "bayt": bayt})
+
+
+def ayristirma(uc_nokta, sure, satir=0):
+    """Kayıt listesinin DataFrame'e ayrıştırılma süresini kayda geçirir."""
+    __kaydet(uc_nokta, {"ayristirma": 1, "ayristirma_suresi": sure, "satir": satir}, None,
+             {"olay": "ayristirma", "sure": sure, "satir": satir})
+
+
+def __kaydet(uc_nokta, artislar, dilim, olay):
+    uc_nokta = yol(uc_nokta or "")
+    with __kilit:
+        __surec_kontrol()
+        metrik = __metrikler.get(uc_nokta)
+        if metrik is None:
+            metrik = __metrikler[uc_nokta] = __bos_metrik()
+        for anahtar, artis in artislar.items():
+            metrik[anahtar] += artis
+        if dilim is not None:
+            metrik["sure_dilimleri"][dilim] += 1
+        kancalar = list(__kancalar)
+    if kancalar:
+        olay["uc_nokta"] = uc_nokta
+        for kanca in kancalar:
+            try:
+                kanca(olay)
+            except Exception:
+                __logging.warning("Metrik kancası çalıştırılırken hata oluştu!", exc_info=True)
+
+
+def __bos_metrik():
+    return {"istek": 0, "hata": 0, "tekrar": 0, "bayt": 0, "sure": 0.0,
+            "sure_dilimleri": [0] * (len(__sure_dilimleri) + 1), "onbellek_isabet": 0, "onbellek_iska": 0,
+            "cozme": 0, "cozme_suresi": 0.0, "ayristirma": 0, "ayristirma_suresi": 0.0, "satir": 0}
+
+
+def __surec_kontrol():
+    # Fork edilen alt süreç üst sürecin metriklerini devralmaz
+    pid = __os.getpid()
+    if __durum["pid"] != pid:
+        __metrikler.clear()
+        __durum["pid"] = pid
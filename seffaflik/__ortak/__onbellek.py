@@ -0,0 +1,328 @@
+import os as __os
+import json as __json
+import time as __time
+import uuid as __uuid
+import shutil as __shutil
+import hashlib as __hashlib
+import inspect as __inspect
+import logging as __logging
+import datetime as __dt
+import threading as __threading
+import functools as __functools
+import importlib.util as __importlib_util
+import pandas as __pd
+
+from seffaflik import _ayarlar as __ayarlar
+from seffaflik.__ortak import __kaset
+from seffaflik.__ortak import __metrik
+from seffaflik.__ortak import __veri_tipi
+from seffaflik.__ortak import __uc_noktalar
+from seffaflik.__ortak.__parametreler import __seffaflik_dir, __ana_url
+
+__uzanti = ".parquet"
+__motor = {}
+__bellek = {}
+__kilit = __threading.Lock()
+__kilitler = {}
+__kumeler = {}
+__durum = {"pid": None}
+
+
+def gunluk(kesinlesme=1, tarih_sutunu="Tarih"):
+    """
+    Tarih aralığı alan veri fonksiyonlarının sonuçlarını gün gün Parquet dosyalarında saklayan dekoratör. İstenen
+    aralığın önbellekte bulunan günleri diskten okunur, yalnızca eksik günler için istek yapılır. Bugünden itibaren
+    geriye doğru kesinlesme gün içerisinde kalan (henüz değişebilecek) günler önbelleğe yazılmaz, her seferinde
+    platformdan çekilir. Boş sonuçlar önbelleğe alınmaz. Kaset kullanılırken (ayarlar(kaset_modu=...)) önbellek
+    devre dışıdır.
+
+    Parametreler
+    ------------
+    kesinlesme   : bir günün verisinin kaç gün sonra kesinleştiği (Varsayılan: 1)
+    tarih_sutunu : sonuçtaki gün bilgisini taşıyan sütun (Varsayılan: "Tarih")
+    """
+
+    def dekorator(f):
+        imza = __inspect.signature(f)
+        ad = f.__module__.replace("seffaflik.", "") + "." + f.__name__
+
+        @__functools.wraps(f)
+        def onbellekli_f(*args, **kwargs):
+            if not __etkin():
+                return f(*args, **kwargs)
+            arguman = imza.bind(*args, **kwargs)
+            arguman.apply_defaults()
+            parametreler = dict(arguman.arguments)
+            try:
+                ilk = __dt.date.fromisoformat(parametreler.pop("baslangic_tarihi"))
+                son = __dt.date.fromisoformat(parametreler.pop("bitis_tarihi"))
+            except (TypeError, ValueError):
+                return f(*args, **kwargs)
+            if ilk > son:
+                return f(*args, **kwargs)
+
+            def cek(baslangic, bitis):
+                return f(baslangic_tarihi=baslangic.isoformat(), bitis_tarihi=bitis.isoformat(), **parametreler)
+
+            # Kompakt veri tipleriyle ya da başka bir servis adresinden (ör: sahte sunucu) çekilen günler ayrı saklanır;
+            # varsayılan ayarlarla anahtarlar değişmez
+            dizin = __os.path.join(__dizin(), ad, __parametre_anahtari(dict(parametreler, **__veri_tipi.anahtar(),
+                                                                             **__kaynak())))
+            kesin_son = min(son, __dt.date.today() - __dt.timedelta(days=kesinlesme))
+            parcalar, eksik = [], []
+            for gun in __gunler(ilk, kesin_son):
+                dosya = __os.path.join(dizin, gun.isoformat() + __uzanti)
+                df = __oku(dosya)
+                if df is None:
+                    eksik.append(gun)
+                else:
+                    parcalar.append((gun, df))
+            __metrik.onbellek(ad, "disk", True, len(parcalar))
+            __metrik.onbellek(ad, "disk", False, len(eksik))
+            yazildi = False
+            for baslangic, bitis in __ardisik_araliklar(eksik):
+                df = cek(baslangic, bitis)
+                if len(df) > 0 and tarih_sutunu in df.columns:
+                    for gun, df_gun in df.groupby(__pd.to_datetime(df[tarih_sutunu]).dt.date, sort=False):
+                        if baslangic <= gun <= bitis:
+                            yazildi |= __yaz(__os.path.join(dizin, gun.isoformat() + __uzanti), df_gun)
+                parcalar.append((baslangic, df))
+            if son > kesin_son:
+                baslangic = max(ilk, kesin_son + __dt.timedelta(days=1))
+                parcalar.append((baslangic, cek(baslangic, son)))
+            if yazildi:
+                __boyut_sinirla()
+            parcalar = [df for _, df in sorted(parcalar, key=lambda p: p[0]) if len(df) > 0]
+            if len(parcalar) == 0:
+                return __pd.DataFrame()
+            return __veri_tipi.uygula(__pd.concat(parcalar, sort=False).reset_index(drop=True))
+
+        onbellekli_f.kesinlesme = kesinlesme
+        onbellekli_f.tarih_sutunu = tarih_sutunu
+        return onbellekli_f
+
+    return dekorator
+
+
+def sureli(uc_nokta):
+    """
+    Referans listelerini (organizasyonlar, santraller, dağıtım bölgeleri, ...) veren fonksiyonların sonuçlarını süreç
+    belleğinde ayarlar(bellek_suresi=...) saniye boyunca saklayan dekoratör. Süre uç nokta bazında
+    uc_nokta_ayarlari(onek, bellek_suresi=...) ile değiştirilebilir; 0 ya da None girildiğinde sonuçlar saklanmaz.
+    Aynı liste için eşzamanlı çağrılar tek istek yapar. Disk önbelleği etkinse liste aynı süreyle disk üzerinde de
+    saklanır; böylece alt süreçler (process) listeyi yeniden çekmez. Boş sonuçlar ve kaset kullanılırken listeler
+    saklanmaz.
+
+    Parametreler
+    ------------
+    uc_nokta : fonksiyonun çağırdığı uç noktanın kayıttaki adı (ör: "uretim.organizasyonlar")
+    """
+
+    def dekorator(f):
+        imza = __inspect.signature(f)
+        ad = f.__module__.replace("seffaflik.", "") + "." + f.__name__
+
+        def kayit(*args, **kwargs):
+            yol = __uc_noktalar.UC_NOKTALAR[uc_nokta]["yol"]
+            sure = __ayarlar.deger("bellek_suresi", yol)
+            # Kaset kullanılırken her liste isteği kasete kaydedilir/kasetten oynatılır
+            if not sure or __kaset.mod(yol) is not None:
+                return None, 0, f(*args, **kwargs)
+            arguman = imza.bind(*args, **kwargs)
+            arguman.apply_defaults()
+            anahtar = __parametre_anahtari(dict(arguman.arguments, **__veri_tipi.anahtar(), **__kaynak(yol)))
+            with __anahtar_kilidi(ad, anahtar):
+                zaman, df = __bellek.get((ad, anahtar), (0, None))
+                if __time.time() - zaman < sure:
+                    __metrik.onbellek(yol, "bellek", True)
+                else:
+                    zaman, df = __disk_oku(__os.path.join(__dizin(), ad, anahtar + __uzanti), sure)
+                    __metrik.onbellek(yol, "disk" if df is not None else "bellek", df is not None)
+                    if df is None:
+                        zaman, df = __time.time(), f(*args, **kwargs)
+                        if df is not None and len(df) > 0 and __etkin():
+                            __yaz(__os.path.join(__dizin(), ad, anahtar + __uzanti), df)
+                    if df is None or len(df) == 0:
+                        return None, 0, df
+                    __bellek[(ad, anahtar)] = (zaman, df)
+            return (ad, anahtar), zaman, df
+
+        @__functools.wraps(f)
+        def sureli_f(*args, **kwargs):
+            anahtar, _, df = kayit(*args, **kwargs)
+            # Çağıranların değişiklikleri saklanan listeyi etkilemez
+            return df.copy() if anahtar is not None else df
+
+        sureli_f.uc_nokta = uc_nokta
+        sureli_f.kayit = kayit
+        return sureli_f
+
+    return dekorator
+
+
+def dizin(fonksiyon, sutun, *args, **kwargs):
+    """
+    Bellekte saklanan referans listesinin (ör: uretim.organizasyonlar) ilgili sütunundaki değerlerden oluşan kümeyi
+    vermektedir. Küme liste yenilenene kadar saklanır; böylece bir değerin listede bulunup bulunmadığı her seferinde
+    listeyi indirmeden ve taramadan sabit sürede sınanır.
+
+    Parametreler
+    ------------
+    fonksiyon : sureli dekoratörü ile saklanan referans listesi fonksiyonu
+    sutun     : kümesi oluşturulacak sütun
+    args      : fonksiyona iletilecek parametreler
+    kwargs    : fonksiyona iletilecek parametreler
+
+    Geri Dönüş Değeri
+    -----------------
+    Sütun Değerleri (frozenset)
+    """
+    anahtar, zaman, df = fonksiyon.kayit(*args, **kwargs)
+    if df is None or sutun not in df.columns:
+        return frozenset()
+    if anahtar is None:
+        return frozenset(df[sutun].tolist())
+    with __kilit:
+        kume_zamani, kume = __kumeler.get(anahtar + (sutun,), (None, None))
+        if kume_zamani != zaman:
+            kume = frozenset(df[sutun].tolist())
+            __kumeler[anahtar + (sutun,)] = (zaman, kume)
+    return kume
+
+
+def onbellek_temizle(fonksiyon=None):
+    """
+    Disk önbelleğini ve bellekte saklanan referans listelerini tamamen ya da ilgili fonksiyon için temizler.
+
+    Parametreler
+    ------------
+    fonksiyon : önbelleği temizlenecek veri fonksiyonu (ör: gop.ptf). Girilmediği taktirde tüm önbellek temizlenir
+                (Varsayılan: None)
+    """
+    dizin = __dizin()
+    with __kilit:
+        if fonksiyon is None:
+            __bellek.clear()
+            __kumeler.clear()
+        else:
+            ad = fonksiyon.__module__.replace("seffaflik.", "") + "." + fonksiyon.__name__
+            dizin = __os.path.join(dizin, ad)
+            for anahtar in [a for a in list(__bellek) if a[0] == ad]:
+                __bellek.pop(anahtar, None)
+            for anahtar in [a for a in list(__kumeler) if a[0] == ad]:
+                __kumeler.pop(anahtar, None)
+    __shutil.rmtree(dizin, ignore_errors=True)
+
+
+def __etkin():
+    # Kaset kullanılırken diskten karşılanan sonuçlar kasete kaydedilmeyeceğinden disk önbelleği kullanılmaz
+    if not __ayarlar.deger("onbellek") or __kaset.mod() is not None:
+        return False
+    if "var" not in __motor:
+        __motor["var"] = any(__importlib_util.find_spec(m) is not None for m in ("pyarrow", "fastparquet"))
+        if not __motor["var"]:
+            __logging.info("Disk önbelleği için pyarrow ya da fastparquet paketi gereklidir (pip install "
+                           "seffaflik[parquet]). Önbellek devre dışı.")
+    return __motor["var"]
+
+
+def __kaynak(uc_nokta=None):
+    ana_url = __ayarlar.deger("ana_url", uc_nokta)
+    return {} if ana_url == __ana_url else {"__ana_url": ana_url}
+
+
+def __dizin():
+    return __ayarlar.deger("onbellek_dizini") or __os.path.join(__seffaflik_dir, "onbellek")
+
+
+def __anahtar_kilidi(ad, anahtar):
+    with __kilit:
+        if __durum["pid"] != __os.getpid():  # fork sonrası üst süreçte tutulan kilitler devralınmaz
+            __kilitler.clear()
+            __durum["pid"] = __os.getpid()
+        return __kilitler.setdefault((ad, anahtar), __threading.Lock())
+
+
+def __disk_oku(dosya, sure):
+    if not __etkin():
+        return 0, None
+    try:
+        zaman = __os.path.getmtime(dosya)
+        if __time.time() - zaman >= sure:
+            return 0, None
+        return zaman, __pd.read_parquet(dosya)
+    except (OSError, ValueError):
+        return 0, None
+
+
+def __parametre_anahtari(parametreler):
+    metin = __json.dumps(parametreler, sort_keys=True, default=str)
+    return __hashlib.sha1(metin.encode("utf-8")).hexdigest()[:16]
+
+
+def __gunler(ilk, son):
+    gun = ilk
+    while gun <= son:
+        yield gun
+        gun += __dt.timedelta(days=1)
+
+
+def __ardisik_araliklar(gunler):
+    araliklar = []
+    for gun in gunler:
+        if araliklar and araliklar[-1][1] + __dt.timedelta(days=1) == gun:
+            araliklar[-1][1] = gun
+        else:
+            araliklar.append([gun, gun])
+    return [tuple(a) for a in araliklar]
+
+
+def __oku(dosya):
+    try:
+        df = __pd.read_parquet(dosya)
+    except (OSError, ValueError):
+        return None
+    try:
+        __os.utime(dosya)  # LRU için son kullanım zamanı
+    except OSError:
+        pass
+    return df
+
+
+def __yaz(dosya, df):
+    __os.makedirs(__os.path.dirname(dosya), exist_ok=True)
+    gecici = dosya + "." + __uuid.uuid4().hex + ".tmp"
+    try:
+        df.reset_index(drop=True).to_parquet(gecici, index=False)
+        __os.replace(gecici, dosya)
+    except (OSError, ValueError, TypeError, ImportError) as e:
+        __logging.warning("Önbelleğe yazılamadı: " + str(e))
+        if __os.path.exists(gecici):
+            __os.remove(gecici)
+        return False
+    return True
+
+
+def __boyut_sinirla():
+    sinir = __ayarlar.deger("onbellek_boyutu")
+    if not sinir:
+        return
+    dosyalar, toplam = [], 0
+    for kok, _, adlar in __os.walk(__dizin()):
+        for a in adlar:
+            if a.endswith(__uzanti):
+                yol = __os.path.join(kok, a)
+                try:
+                    bilgi = __os.stat(yol)
+                except OSError:
+                    continue
+                dosyalar.append((bilgi.st_mtime, bilgi.st_size, yol))
+                toplam += bilgi.st_size
+    for _, boyut, yol in sorted(dosyalar):
+        if toplam <= sinir:
+            break
+        try:
+            __os.remove(yol)
+        except OSError:
+            continue
+        toplam -= boyut
@@ -0,0 +1,184 @@
+import os as __os
+import time as __time
+import random as __random
+import logging as __logging
+import threading as __threading
+from email.utils import parsedate_to_datetime as __parsedate_to_datetime
+import requests as __requests
+from requests import ConnectionError as __ConnectionError
+from requests.adapters import HTTPAdapter as __HTTPAdapter
+from requests.exceptions import Timeout as __Timeout
+
+from seffaflik import _ayarlar as __ayarlar
+from seffaflik.__ortak import __hiz
+from seffaflik.__ortak import __metrik
+from seffaflik.__ortak.__parametreler import __request_error
+
+__kilit = __threading.Lock()
+__durum = {"oturum": None, "pid": None, "surum": None, "anahtar": None}
+__kapanan_havuzlar = {"acilan": 0, "istek": 0}
+__TEKRAR_DENENEBILIR_METOTLAR = {"GET", "HEAD", "OPTIONS"}
+__TEKRAR_DENENEBILIR_DURUMLAR = {429, 500, 502, 503, 504}
+
+
+def oturum():
+    """
+    Süreç (process) genelinde paylaşılan, bağlantıları açık tutan (keep-alive) ve sunucu başına bağlantı sayısı
+    sınırlandırılmış HTTP oturumunu vermektedir. Oturum ilk istekte oluşturulur; fork edilen alt süreçlerde ve bağlantı
+    havuzu ayarları (havuz_sayisi, host_basina_baglanti) değiştiğinde yeniden oluşturulur. Eski oturum, diğer iş
+    parçacıklarında hâlâ kullanılıyor olabileceğinden kapatılmaz; referansı kalmadığında bağlantıları kapanır.
+
+    Geri Dönüş Değeri
+    -----------------
+    requests.Session
+    """
+    pid = __os.getpid()
+    surum = __ayarlar.surum()
+    if __durum["oturum"] is not None and __durum["pid"] == pid and __durum["surum"] == surum:
+        return __durum["oturum"]
+    with __kilit:
+        anahtar = (__ayarlar.deger("havuz_sayisi"), __ayarlar.deger("host_basina_baglanti"))
+        if __durum["oturum"] is None or __durum["pid"] != pid or __durum["anahtar"] != anahtar:
+            if __durum["oturum"] is not None and __durum["pid"] == pid:
+                __havuz_sayaclarini_aktar(__durum["oturum"])
+            elif __durum["pid"] != pid:
+                __kapanan_havuzlar.update({"acilan": 0, "istek": 0})
+            __durum.update({"oturum": __oturum_olustur(), "pid": pid, "anahtar": anahtar})
+        # Bağlantıyla ilgisiz ayar değişikliklerinde oturum korunur
+        __durum["surum"] = surum
+        return __durum["oturum"]
+
+
+def istek(metot, url, uc_nokta=None, ayri_oturum=None, tekrar_denenebilir=None, **kwargs):
+    """
+    Paylaşılan oturum üzerinden HTTP isteği yapmaktadır. Bağlantı hatası, zaman aşımı, 429 ve 5xx yanıtlarında
+    idempotent istekler üstel geri çekilme ve titreme (jitter) ile tekrar denenir; sunucunun Retry-After başlığına
+    uyulur. Her deneme saniyede istek ve eşzamanlı istek sınırlarına tabidir. Deneme, bekleme ve sınır ayarları uç
+    nokta önekine göre ayrı ayrı belirlenebilir (bkz. uc_nokta_ayarlari).
+
+    Parametreler
+    ------------
+    metot              : metin formatında HTTP metodu (ör: "GET")
+    url                : metin formatında tam adres
+    uc_nokta           : metin formatında uç nokta (uç nokta bazlı ayarlar için) (Varsayılan: None)
+    ayri_oturum        : isteğin yapılacağı ayrı oturum (ör: çerez ve form durumu taşıyan sayfalar için
+                         yeni_oturum ile oluşturulan). None ise paylaşılan oturum kullanılır (Varsayılan: None)
+    tekrar_denenebilir : isteğin hata durumunda tekrar denenip denenemeyeceği. None ise metoda göre belirlenir
+                         (GET, HEAD, OPTIONS) (Varsayılan: None)
+    kwargs             : requests.Session.request fonksiyonuna iletilen diğer parametreler
+
+    Geri Dönüş Değeri
+    -----------------
+    requests.Response (Tüm denemeler başarısız olduğunda son hata yükseltilir)
+    """
+    if tekrar_denenebilir is None:
+        tekrar_denenebilir = metot.upper() in __TEKRAR_DENENEBILIR_METOTLAR
+    deneme_sayisi = __ayarlar.deger("deneme_sayisi", uc_nokta) if tekrar_denenebilir else 1
+    kwargs.setdefault("timeout", __ayarlar.deger("zaman_asimi", uc_nokta))
+    deneme = 1
+    while True:
+        baslangic = __time.perf_counter()
+        try:
+            with __hiz.sinir(uc_nokta):
+                # Süre ölçümüne hız sınırı beklemesi dahil edilmez
+                baslangic = __time.perf_counter()
+                resp = (ayri_oturum or oturum()).request(metot, url, **kwargs)
+        except (__ConnectionError, __Timeout):
+            __metrik.istek(uc_nokta or url, __time.perf_counter() - baslangic, deneme=deneme)
+            if deneme >= deneme_sayisi:
+                raise
+            bekleme = __bekleme_suresi(deneme, uc_nokta)
+        else:
+            __metrik.istek(uc_nokta or url, __time.perf_counter() - baslangic, len(resp.content), resp.status_code,
+                           deneme)
+            if resp.status_code not in __TEKRAR_DENENEBILIR_DURUMLAR or deneme >= deneme_sayisi:
+                resp.raise_for_status()
+                return resp
+            bekleme = __bekleme_suresi(deneme, uc_nokta, resp.headers.get("Retry-After"))
+            resp.close()
+        __metrik.tekrar(uc_nokta or url, deneme, bekleme)
+        __logging.warning(__request_error + " (" + str(deneme) + "/" + str(deneme_sayisi) + ", " +
+                          "{:.1f}".format(bekleme) + " sn sonra)")
+        __time.sleep(bekleme)
+        deneme += 1
+
+
+def yeni_oturum():
+    """
+    Paylaşılan oturumla aynı bağlantı ayarlarına sahip, ancak çerezleri ayrı tutulan yeni bir HTTP oturumu vermektedir.
+    Çerez ya da sunucu tarafı form durumu (ör: JSF ViewState) taşıyan sayfalarda eşzamanlı çağrıların birbirinin
+    durumunu bozmaması için kullanılır; işi biten oturum kapatılmalıdır.
+
+    Geri Dönüş Değeri
+    -----------------
+    requests.Session
+    """
+    return __oturum_olustur()
+
+
+def baglanti_sayaclari():
+    """
+    Paylaşılan HTTP oturumunun açtığı ve yeniden kullandığı bağlantı sayılarını vermektedir.
+
+    Geri Dönüş Değeri
+    -----------------
+    Bağlantı Sayaçları (dict: istek, acilan, yeniden_kullanilan)
+    """
+    with __kilit:
+        acilan, istek = __kapanan_havuzlar["acilan"], __kapanan_havuzlar["istek"]
+        if __durum["oturum"] is not None and __durum["pid"] == __os.getpid():
+            havuz_acilan, havuz_istek = __havuz_sayaclari(__durum["oturum"])
+            acilan, istek = acilan + havuz_acilan, istek + havuz_istek
+    return {"istek": istek, "acilan": acilan, "yeniden_kullanilan": max(istek - acilan, 0)}
+
+
+def __oturum_olustur():
+    adaptor = __HTTPAdapter(pool_connections=__ayarlar.deger("havuz_sayisi"),
+                            pool_maxsize=__ayarlar.deger("host_basina_baglanti"), pool_block=True)
+    s = __requests.Session()
+    s.mount("https://", adaptor)
+    s.mount("http://", adaptor)
+    s.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"})
+    return s
+
+
+def __havuz_sayaclari(s):
+    acilan, istek = 0, 0
+    for adaptor in set(s.adapters.values()):
+        havuzlar = adaptor.poolmanager.pools
+        for anahtar in list(havuzlar.keys()):
+            havuz = havuzlar.get(anahtar)
+            if havuz is not None:
+                acilan += havuz.num_connections
+                istek += havuz.num_requests
+    return acilan, istek
+
+
+def __havuz_sayaclarini_aktar(s):
+    acilan, istek = __havuz_sayaclari(s)
+    __kapanan_havuzlar["acilan"] += acilan
+    __kapanan_havuzlar["istek"] += istek
+
+
+def __bekleme_suresi(deneme, uc_nokta, retry_after=None):
+    azami = __ayarlar.deger("azami_bekleme", uc_nokta)
+    sunucu_beklemesi = __retry_after_saniye(retry_after)
+    if sunucu_beklemesi is not None:
+        return min(sunucu_beklemesi, azami)
+    bekleme = min(__ayarlar.deger("bekleme_katsayisi", uc_nokta) * 2 ** (deneme - 1), azami)
+    if __ayarlar.deger("titreme", uc_nokta):
+        bekleme = __random.uniform(0, bekleme)
+    return bekleme
+
+
+def __retry_after_saniye(retry_after):
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(__parsedate_to_datetime(retry_after).timestamp() - __time.time(), 0.0)
+    except (TypeError, ValueError, IndexError):
+        return None
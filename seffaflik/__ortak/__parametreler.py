@@ -1,5 +1,8 @@
+import os as __os
+
 # URLs
 SEFFAFLIK_URL = "https://api.epias.com.tr/epias/exchange/transparency/"
+__ana_url = "https://seffaflik.epias.com.tr/transparency/service/"
 # Requests Errors
 __request_error = "İstek esnasında hata oluştu. İstek tekrar deneniyor!"
 __requestsConnectionErrorLogging = "Bağlantı Hatası! Lütfen internet bağlantınızı kontrol ediniz!"
@@ -7,5 +10,36 @@ __requestsAuthenticationErrorLogging = "Kimlik dosyası oluşturulmamış yada g
                                        "bilgilerinizi kontrol edip kimlik dosyasını tekrar oluşturunuz!"
 __requestsTimeoutErrorLogging = "İstek zaman aşımına uğradı! Web-Servis şartnamesinde belirtmiş olduğunuz IP " \
                                 "adresini kullandığınızdan emin olunuz!"
+__requestsServerErrorLogging = "Sunucu isteği tüm denemelere rağmen yanıtlayamadı! Lütfen daha sonra tekrar deneyiniz!"
 # Requests timeout
-__timeout = 1000000
+__timeout = 120
+# Connection pool
+__havuz_sayisi = 10
+__host_basina_baglanti = 32
+# Retry
+__deneme_sayisi = 5
+__bekleme_katsayisi = 0.5
+__azami_bekleme = 60
+# Rate limit
+__saniyede_istek = None
+__azami_eszamanli_istek = None
+# Executor
+__executor = "thread"
+__max_workers = None
+# Disk cache
+__onbellek = True
+__onbellek_boyutu = 2 * 1024 ** 3
+# Reference list cache
+__bellek_suresi = 3600
+# Conditional requests (total body bytes of responses kept for revalidation)
+__kosullu_istek_boyutu = 64 * 1024 ** 2
+# Metrics (upper bounds of request latency buckets in seconds)
+__sure_dilimleri = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# Data types
+__veri_tipi = "tam"
+__float32 = False
+# JSON decoding
+__json_cozucu = "otomatik"
+__json_alt_agac = False
+# Directories
+__seffaflik_dir = __os.environ.get("SEFFAFLIK_DIR", __os.path.join(__os.path.expanduser("~"), ".seffaflik"))
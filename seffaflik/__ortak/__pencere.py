@@ -0,0 +1,190 @@
+import importlib as __importlib
+import inspect as __inspect
+import datetime as __dt
+import functools as __functools
+import logging as __logging
+import pandas as __pd
+from dateutil import relativedelta as __rd
+
+from seffaflik.__ortak import __yurutucu
+from seffaflik.__ortak import __dogrulama
+from seffaflik.__ortak import __veri_tipi
+
+
+def pencereli(gun=31):
+    """
+    Tarih aralığı alan veri fonksiyonlarında uzun aralıkları en fazla gun günlük pencerelere bölen dekoratör.
+    Pencereler paylaşılan yürütücüde eşzamanlı çekilir, sonuçlar tarih sırasıyla birleştirilir ve pencere sınırlarında
+    oluşabilecek tekrar eden satırlar çıkarılır. Tek pencereye sığan aralıklar doğrudan çekilir.
+
+    Parametreler
+    ------------
+    gun : bir penceredeki azami gün sayısı (Varsayılan: 31)
+    """
+
+    def dekorator(f):
+        imza = __inspect.signature(f)
+
+        @__functools.wraps(f)
+        def pencereli_f(*args, **kwargs):
+            arguman = imza.bind(*args, **kwargs)
+            arguman.apply_defaults()
+            parametreler = dict(arguman.arguments)
+            try:
+                pencereler = araliklar(parametreler["baslangic_tarihi"], parametreler["bitis_tarihi"], gun)
+            except (TypeError, ValueError):
+                return f(*args, **kwargs)
+            if len(pencereler) <= 1:
+                return f(*args, **kwargs)
+            liste = [dict(parametreler, baslangic_tarihi=ilk, bitis_tarihi=son) for ilk, son in pencereler]
+            # Pencereler modüldeki fonksiyon adıyla çağrılır; böylece süreç havuzuna gönderilebilir. Üstteki
+            # dekoratörler (ör: gün gün disk önbelleği) tüm aralığı zaten işlediğinden pencerelerde atlanır
+            return birlestir(__yurutucu.esle(__functools.partial(__cagir, f.__module__, f.__name__, pencere_ici=True),
+                                              liste))
+
+        pencereli_f.pencere = gun
+        return pencereli_f
+
+    return dekorator
+
+
+def parcali(f, baslangic_tarihi, bitis_tarihi, pencere="1D", **kwargs):
+    """
+    İlgili veri fonksiyonunu tarih aralığının her penceresi için çalıştırır ve her pencerenin sonucunu hazır oldukça
+    sırasıyla verir (generator). Bellekte aynı anda yalnızca birkaç pencere tutulur; boş pencereler atlanır, pencere
+    sınırında tekrar eden satırlar çıkarılır.
+
+    Parametreler
+    ------------
+    f                : tarih aralığı alan veri fonksiyonu
+    baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi
+    bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi
+    pencere          : pencere uzunluğu; gün ("1D"), hafta ("1W") ya da ay ("1M") cinsinden (Varsayılan: "1D")
+    kwargs           : fonksiyona iletilecek diğer parametreler
+
+    Geri Dönüş Değeri
+    -----------------
+    Pencere Sonuçları (generator of DataFrame)
+    """
+    for _, _, df in pencere_sonuclari(f, baslangic_tarihi, bitis_tarihi, pencere, **kwargs):
+        if df is not None and len(df) > 0:
+            yield df
+
+
+def pencere_sonuclari(f, baslangic_tarihi, bitis_tarihi, pencere="1D", **kwargs):
+    """
+    parcali gibi çalışır; ancak boş pencereler de atlanmadan her pencere başlangıç ve bitiş tarihiyle birlikte verilir.
+    Sonuç döndürmeyen (hatalı ya da boş yanıt alınan) pencerelerde DataFrame yerine None verilir.
+
+    Parametreler
+    ------------
+    f                : tarih aralığı alan veri fonksiyonu
+    baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi
+    bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi
+    pencere          : pencere uzunluğu; gün ("1D"), hafta ("1W") ya da ay ("1M") cinsinden (Varsayılan: "1D")
+    kwargs           : fonksiyona iletilecek diğer parametreler
+
+    Geri Dönüş Değeri
+    -----------------
+    Pencere Sonuçları (generator of (başlangıç, bitiş, DataFrame ya da None))
+    """
+    if not __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
+        return
+    try:
+        pencereler = araliklar(baslangic_tarihi, bitis_tarihi, pencere)
+    except ValueError:
+        __logging.warning("Pencere değeri tam sayı (gün) yada 1D, 1W, 1M formatında girilmelidir!")
+        return
+    liste = [dict(kwargs, baslangic_tarihi=ilk, bitis_tarihi=son) for ilk, son in pencereler]
+    onceki = None
+    for (ilk, son), df in zip(pencereler, __yurutucu.sirali(__functools.partial(__cagir, f.__module__, f.__name__),
+                                                            liste)):
+        if df is None or len(df) == 0:
+            yield ilk, son, None
+            continue
+        ozet = __satir_ozeti(df)
+        if onceki is not None and ozet is not None:
+            df = df[~ozet.isin(onceki).values].reset_index(drop=True)
+        onceki = ozet
+        yield ilk, son, df
+
+
+def araliklar(baslangic_tarihi, bitis_tarihi, pencere):
+    """
+    İlgili tarih aralığını ardışık pencerelere böler.
+
+    Parametreler
+    ------------
+    baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi
+    bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi
+    pencere          : tam sayı formatında gün sayısı ya da "7D", "2W", "1M" formatında pencere uzunluğu
+
+    Geri Dönüş Değeri
+    -----------------
+    Pencereler (list of (başlangıç, bitiş) %YYYY-%AA-%GG)
+    """
+    adim = __adim(pencere)
+    ilk = __dt.date.fromisoformat(baslangic_tarihi)
+    son = __dt.date.fromisoformat(bitis_tarihi)
+    pencereler = []
+    while ilk <= son:
+        pencere_sonu = min(ilk + adim - __dt.timedelta(days=1), son)
+        pencereler.append((ilk.isoformat(), pencere_sonu.isoformat()))
+        ilk = pencere_sonu + __dt.timedelta(days=1)
+    return pencereler
+
+
+def birlestir(list_df):
+    """
+    Pencere sonuçlarını sırasıyla alt alta birleştirir. Bir pencerenin önceki pencerede de yer alan (sınırda tekrar
+    eden) satırları çıkarılır; pencere içindeki satırlara dokunulmaz.
+
+    Parametreler
+    ------------
+    list_df : pencere sırasıyla DataFrame listesi
+
+    Geri Dönüş Değeri
+    -----------------
+    Birleştirilmiş Veri (DataFrame)
+    """
+    list_df = [df for df in list_df if df is not None and len(df) > 0]
+    if len(list_df) == 0:
+        return __pd.DataFrame()
+    onceki = None
+    for i, df in enumerate(list_df):
+        ozet = __satir_ozeti(df)
+        if onceki is not None and ozet is not None:
+            list_df[i] = df[~ozet.isin(onceki).values]
+        onceki = ozet
+    return __veri_tipi.uygula(__pd.concat(list_df, sort=False).reset_index(drop=True))
+
+
+def __adim(pencere):
+    if isinstance(pencere, int):
+        sayi, birim = pencere, "D"
+    else:
+        sayi, birim = int(pencere[:-1] or 1), pencere[-1].upper()
+    if sayi < 1 or birim not in ("D", "W", "M"):
+        raise ValueError(pencere)
+    if birim == "M":
+        return __rd.relativedelta(months=sayi)
+    return __dt.timedelta(days=sayi * (7 if birim == "W" else 1))
+
+
+def __satir_ozeti(df):
+    try:
+        return __pd.util.hash_pandas_object(df, index=False)
+    except TypeError:  # liste/sözlük içeren sütunlar
+        return None
+
+
+def __cagir(modul, ad, parametreler, pencere_ici=False):
+    # Alt süreçlerde modül henüz yüklenmemiş olabilir
+    f = getattr(__importlib.import_module(modul), ad)
+    if pencere_ici:
+        # functools.wraps "pencere" niteliğini üstteki sarmalayıcılara da kopyaladığından pencereli sarmalayıcıya
+        # kadar inilir ve onun sardığı fonksiyon çağrılır
+        while hasattr(getattr(f, "__wrapped__", None), "pencere"):
+            f = f.__wrapped__
+        f = getattr(f, "__wrapped__", f)
+    return f(**parametreler)
@@ -0,0 +1,597 @@
+"""
+Şeffaflık Platformu uç noktalarının merkezi kaydı ve kayıtlardan derlenen ortak ayrıştırma adımı.
+
+Her uç nokta; adresi, sorgu parametreleri, yanıt gövdesindeki liste anahtarı, çıktı sütunlarının platformdaki
+karşılıkları, sütun veri tipleri, zaman sütunu ve zaman ayrıntısı (saatlik, günlük, ...) ile tanımlanır. Veri
+fonksiyonları uç noktayı adıyla çağırır; sütunlar ara DataFrame, yeniden adlandırma ve sütun seçimi olmadan doğrudan
+kayıtlardan, tanımlı tipleriyle oluşturulur.
+"""
+import time as __time
+import logging as __logging
+import threading as __threading
+import collections as __collections
+import importlib as __importlib
+import pandas as __pd
+
+from seffaflik import _ayarlar as __ayarlar
+from seffaflik.__ortak import __kaset
+from seffaflik.__ortak import __metrik
+from seffaflik.__ortak import __veri_tipi
+from seffaflik.__ortak.__araclar import make_requests as __make_requests, donem as __donem, tarih as __tarih, \
+    zaman as __zaman, dogrulanabilir as __dogrulanabilir
+
+UC_NOKTALAR = {}
+__kilit = __threading.Lock()
+__cerceveler = __collections.OrderedDict()
+__arrow = {}
+
+
+def uc_nokta(ad, yol, anahtar, sutunlar=None, sorgu=("startDate", "endDate"), zaman=None, turet=("Tarih", "Saat"),
+             ayrinti=None, tipler=None, tum=False):
+    """
+    İlgili uç noktayı kayda ekler ve ayrıştırma adımlarını önceden derler.
+
+    Parametreler
+    ------------
+    ad       : uç noktanın kayıttaki adı (ör: "gop.ptf")
+    yol      : uç noktanın adresi; sabit sorgu parametreleri adrese eklenebilir (ör: "market/day-ahead-mcp")
+    anahtar  : yanıt gövdesinde kayıt listesini taşıyan anahtar
+    sutunlar : {çıktı sütunu: platformdaki alan} formatında sütun eşlemesi; iç içe alanlar "id.date" biçiminde yazılır
+               (Varsayılan: None)
+    sorgu    : sırasıyla değer verilecek sorgu parametreleri (Varsayılan: ("startDate", "endDate"))
+    zaman    : "Tarih"/"Saat" sütunlarının türetileceği zaman alanı (Varsayılan: None)
+    turet    : zaman alanından türetilecek sütunlar (Varsayılan: ("Tarih", "Saat"))
+    ayrinti  : verinin zaman ayrıntısı ("saatlik", "gunluk", "haftalik", "aylik", "anlik") (Varsayılan: None)
+    tipler   : {çıktı sütunu: tip} formatında sütun tipleri; numpy/pandas tipleri ile "tarih", "zaman", "gun" (metin
+               tarih), "ay" (metin YYYY-AA), "donem" ve değer eşleme sözlükleri kullanılabilir (Varsayılan: None)
+    tum      : True ise eşlenmeyen alanlar da platformdaki sırasıyla korunur (Varsayılan: False)
+
+    Geri Dönüş Değeri
+    -----------------
+    Uç Nokta Tanımı (dict)
+    """
+    sutunlar = dict(sutunlar or {})
+    tipler = dict(tipler or {})
+    tanim = {"ad": ad, "yol": yol, "anahtar": anahtar, "sorgu": tuple(sorgu), "sutunlar": sutunlar, "zaman": zaman,
+             "turet": tuple(turet) if zaman is not None else (), "ayrinti": ayrinti, "tipler": tipler, "tum": tum,
+             "zaman_alani": __alan(zaman) if zaman is not None else None,
+             "adimlar": [(hedef, __alan(kaynak), tipler.get(hedef)) for hedef, kaynak in sutunlar.items()],
+             "yeniden_adlandir": {kaynak: hedef for hedef, kaynak in sutunlar.items()}}
+    UC_NOKTALAR[ad] = tanim
+    return tanim
+
+
+def url(ad, *degerler):
+    """
+    İlgili uç nokta için sorgu parametreleri eklenmiş adresi verir.
+
+    Parametreler
+    ------------
+    ad       : uç noktanın kayıttaki adı
+    degerler : sorgu parametrelerinin sırasıyla değerleri
+
+    Geri Dönüş Değeri
+    -----------------
+    Adres (metin)
+    """
+    tanim = UC_NOKTALAR[ad]
+    if len(tanim["sorgu"]) == 0:
+        return tanim["yol"]
+    return tanim["yol"] + ("&" if "?" in tanim["yol"] else "?") + "&".join(
+        p + "=" + str(d) for p, d in zip(tanim["sorgu"], degerler))
+
+
+def kayitlar(ad, *degerler):
+    """
+    İlgili uç noktadan istek yapar ve yanıttaki kayıt listesini işlenmeden verir. Beklenmeyen yanıtlarda KeyError ya
+    da TypeError fırlatılır.
+
+    Parametreler
+    ------------
+    ad       : uç noktanın kayıttaki adı
+    degerler : sorgu parametrelerinin sırasıyla değerleri
+
+    Geri Dönüş Değeri
+    -----------------
+    Kayıtlar (list of dict)
+    """
+    tanim = UC_NOKTALAR[ad]
+    anahtar = tanim["anahtar"]
+    # Tarih aralığı alan uç noktalar pencere pencere çekildiğinden yanıtları koşullu istek için saklanmaz
+    return __make_requests(url(ad, *degerler), ("body", anahtar),
+                           "startDate" not in tanim["sorgu"])["body"][anahtar]
+
+
+def cek(ad, *degerler):
+    """
+    İlgili uç noktadan istek yapar ve yanıtı tanımlı sütun ve tiplerle DataFrame'e çevirir. Beklenmeyen yanıtlarda
+    boş DataFrame verir. Koşullu istekte yanıt değişmemişse (304) önceki DataFrame yeniden ayrıştırılmadan verilir;
+    DataFrame'ler yalnızca koşullu istek için saklanan yanıtlar için tutulur, kaset kullanılırken saklanmaz.
+
+    Parametreler
+    ------------
+    ad       : uç noktanın kayıttaki adı
+    degerler : sorgu parametrelerinin sırasıyla değerleri
+
+    Geri Dönüş Değeri
+    -----------------
+    DataFrame
+    """
+    adres = url(ad, *degerler)
+    try:
+        liste = kayitlar(ad, *degerler)
+        anahtar = (ad, adres, tuple(__veri_tipi.anahtar().items()))
+        with __kilit:
+            onceki = __cerceveler.get(anahtar)
+        if onceki is not None and onceki[0] is liste:
+            return onceki[1].copy()
+        df = ayristir(ad, liste)
+    except (KeyError, TypeError):
+        return __pd.DataFrame()
+    with __kilit:
+        if not __dogrulanabilir(adres) or __kaset.mod(adres) is not None:
+            __cerceveler.pop(anahtar, None)
+            return df
+        __cerceveler[anahtar] = (liste, df)
+        # Koşullu istek önbelleğinden çıkarılan yanıtların DataFrame'leri de bırakılır
+        for eski in [a for a in __cerceveler if not __dogrulanabilir(a[1])]:
+            del __cerceveler[eski]
+    return df.copy()
+
+
+def ayristir(ad, liste):
+    """
+    İlgili uç noktanın kayıt listesini tanımlı sütun ve tiplerle DataFrame'e çevirir ve veri tipi politikasını
+    uygular. ayarlar(arrow=True) ise değerler doğrudan Arrow dizilerine çevrilir ve Arrow tabanlı (pd.ArrowDtype)
+    sütunlar verilir. Tanımlı bir alan hiçbir kayıtta bulunmuyorsa KeyError fırlatılır.
+
+    Parametreler
+    ------------
+    ad    : uç noktanın kayıttaki adı
+    liste : kayıt listesi (list of dict)
+
+    Geri Dönüş Değeri
+    -----------------
+    DataFrame
+    """
+    tanim = UC_NOKTALAR[ad]
+    if len(liste) == 0:
+        return __pd.DataFrame()
+    baslangic = __time.perf_counter()
+    df = __ayristir(tanim, liste)
+    __metrik.ayristirma(tanim["yol"], __time.perf_counter() - baslangic, len(df))
+    return df
+
+
+def __ayristir(tanim, liste):
+    pa = __pyarrow() if __ayarlar.deger("arrow") else None
+    if pa is not None:
+        try:
+            return __veri_tipi.uygula(__arrow_ayristir(pa, tanim, liste))
+        except (pa.ArrowException, ValueError, TypeError):  # Arrow'a çevrilemeyen karışık tipli alanlar
+            pass
+    if tanim["tum"]:
+        df = __pd.DataFrame(liste).rename(columns=tanim["yeniden_adlandir"])
+        for hedef, tip in tanim["tipler"].items():
+            df[hedef] = __donustur(df[hedef], tip)
+        return __veri_tipi.uygula(df)
+    sutunlar = {}
+    if tanim["zaman"] is not None:
+        yerel = __zaman(__pd.Series(__degerler(liste, tanim["zaman"], tanim["zaman_alani"])))
+        tarih = yerel.dt.normalize()
+        for hedef in tanim["turet"]:
+            if hedef == "Saat":
+                sutunlar[hedef] = yerel - tarih if tanim["ayrinti"] == "anlik" else yerel.dt.hour.astype("int64")
+            else:
+                sutunlar[hedef] = __donustur(tarih, tanim["tipler"][hedef]) if hedef in tanim["tipler"] else tarih
+    for hedef, alan, tip in tanim["adimlar"]:
+        degerler = __degerler(liste, tanim["sutunlar"][hedef], alan)
+        sutunlar[hedef] = degerler if tip is None else __donustur(__pd.Series(degerler), tip)
+    return __veri_tipi.uygula(__pd.DataFrame(sutunlar))
+
+
+def __arrow_ayristir(pa, tanim, liste):
+    pc = __importlib.import_module("pyarrow.compute")
+    if tanim["tum"]:
+        tablo = pa.Table.from_pylist(liste)
+        tablo = tablo.rename_columns([tanim["yeniden_adlandir"].get(s, s) for s in tablo.column_names])
+        sutunlar = dict(zip(tablo.column_names, tablo.columns))
+        for hedef, tip in tanim["tipler"].items():
+            sutunlar[hedef] = __arrow_donustur(pa, sutunlar[hedef].to_pandas(), tip)
+        return pa.table(sutunlar).to_pandas(types_mapper=__pd.ArrowDtype)
+    sutunlar = {}
+    if tanim["zaman"] is not None:
+        zaman = pa.array(__degerler(liste, tanim["zaman"], tanim["zaman_alani"]), pa.string())
+        # Zamanlar İstanbul yerel saatiyle verildiğinden UTC farkı (ilk 19 karakterden sonrası) ayrıştırılmaz
+        yerel = pc.cast(pc.utf8_slice_codeunits(zaman, 0, 19), pa.timestamp("us"))
+        tarih = pc.floor_temporal(yerel, unit="day")
+        for hedef in tanim["turet"]:
+            if hedef == "Saat":
+                sutunlar[hedef] = pc.subtract(yerel, tarih) if tanim["ayrinti"] == "anlik" else pc.hour(yerel)
+            elif hedef in tanim["tipler"]:
+                sutunlar[hedef] = __arrow_donustur(pa, tarih.to_pandas(), tanim["tipler"][hedef])
+            else:
+                sutunlar[hedef] = tarih
+    for hedef, alan, tip in tanim["adimlar"]:
+        degerler = __degerler(liste, tanim["sutunlar"][hedef], alan)
+        sutunlar[hedef] = pa.array(degerler) if tip is None else __arrow_donustur(pa, __pd.Series(degerler), tip)
+    return pa.table(sutunlar).to_pandas(types_mapper=__pd.ArrowDtype)
+
+
+def __arrow_donustur(pa, seri, tip):
+    return pa.array(__donustur(seri, tip), from_pandas=True)
+
+
+def __pyarrow():
+    if "pa" not in __arrow:
+        try:
+            __arrow["pa"] = __importlib.import_module("pyarrow")
+        except ImportError:
+            __arrow["pa"] = None
+            __logging.warning("Arrow tabanlı sonuçlar için pyarrow paketi gereklidir (pip install seffaflik[parquet])!")
+    return __arrow["pa"]
+
+
+def __alan(kaynak):
+    if "." in kaynak:
+        ust, alt = kaynak.split(".", 1)
+        return lambda kayit: (kayit.get(ust) or {}).get(alt)
+    return lambda kayit: kayit.get(kaynak)
+
+
+def __degerler(liste, kaynak, alan):
+    degerler = [alan(kayit) for kayit in liste]
+    if "." not in kaynak and kaynak not in liste[0] and all(d is None for d in degerler):
+        raise KeyError(kaynak)
+    return degerler
+
+
+def __donustur(seri, tip):
+    if isinstance(tip, dict):
+        return seri.map(tip)
+    if tip == "tarih":
+        return __tarih(seri)
+    if tip == "zaman":
+        return __pd.to_datetime(seri)
+    if tip == "gun":
+        if not __pd.api.types.is_datetime64_any_dtype(seri):
+            seri = __tarih(seri)
+        return seri.dt.strftime("%Y-%m-%d")
+    if tip == "donem":
+        return __donem(seri)
+    if tip == "ay":
+        return seri.str[:7]
+    return seri.astype(tip)
+
+
+# Ortak sütun eşlemeleri
+__kaynak_bazli = {"Doğalgaz": "dogalgaz", "Barajlı": "barajli", "Linyit": "linyit", "Akarsu": "akarsu",
+                  "İthal Kömür": "ithalKomur", "Rüzgar": "ruzgar", "Fuel Oil": "fuelOil", "Jeo Termal": "jeotermal",
+                  "Taş Kömür": "tasKomur", "Biyokütle": "biokutle", "Nafta": "nafta", "Diğer": "diger",
+                  "Toplam": "toplam"}
+__gerceklesen = {"Doğalgaz": "naturalGas", "Barajlı": "dammedHydro", "Linyit": "lignite", "Akarsu": "river",
+                 "İthal Kömür": "importCoal", "Rüzgar": "wind", "Güneş": "sun", "Fuel Oil": "fueloil",
+                 "Jeo Termal": "geothermal", "Asfaltit Kömür": "asphaltiteCoal", "Taş Kömür": "blackCoal",
+                 "Biyokütle": "biomass", "Nafta": "naphta", "LNG": "lng", "Uluslararası": "importExport",
+                 "Atık Isı": "wasteheat", "Toplam": "total"}
+__yekdem_gerceklesen = {"Rüzgar": "wind", "Jeotermal": "geothermal", "Rezervuarlı": "reservoir",
+                        "Kanal Tipi": "canalType", "Nehir Tipi": "riverType", "Çöp Gazı": "lfg", "Biyogaz": "biogas",
+                        "Güneş": "sun", "Biyokütle": "biomass", "Diğer": "others", "Toplam": "total"}
+__santral = {"Id": "id", "Adı": "name", "EIC Kodu": "eic", "Kısa Adı": "shortName"}
+__uevcb = {"Id": "id", "Adı": "name", "EIC Kodu": "eic"}
+__organizasyon = {"Id": "organizationId", "Adı": "organizationName", "EIC Kodu": "organizationETSOCode",
+                  "Kısa Adı": "organizationShortName", "Durum": "organizationStatus"}
+__gop_hacim = {"Talep Eşleşme Miktarı": "matchedBids", "Arz Eşleşme Miktarı": "matchedOffers"}
+__sistem_yonu = {"IN_BALANCE": "Dengede", "ENERGY_SURPLUS": "Enerji Fazlası", "ENERGY_DEFICIT": "Enerji Açığı"}
+
+# Doğal gaz - Sürekli Ticaret Platformu (STP)
+uc_nokta("stp.gunluk_fiyat", "stp/daily-price", "stpDailyPriceDtos", ayrinti="gunluk", tum=True,
+         sutunlar={"Gaz Günü": "gasDay", "Kontrat İsmi": "contractName", "GİF": "intraDayPrice",
+                   "GEF": "dayAfterPrice", "GÖF": "dayAheadPrice", "AOF": "weightedAverage",
+                   "GRF": "gasReferencePrice"},
+         tipler={"Gaz Günü": "tarih"})
+uc_nokta("stp.gunluk_hacim", "stp/matching-quantity", "matchingDtos", ayrinti="gunluk",
+         sutunlar={"Gaz Günü": "gasDay", "Kontrat İsmi": "contractName", "GİEM": "intraDayMatchingQuantity",
+                   "GEEM": "dayAfterMatchingQuantity", "GÖEM": "dayAheadMatchingQuantity",
+                   "GRFEM": "gasReferenceMatchingQuantity", "HEM": "weeklyMatchingQuantity"},
+         tipler={"Gaz Günü": "tarih"})
+uc_nokta("stp.gunluk_islem_hacmi", "stp/trade-value", "tradeValues", ayrinti="gunluk",
+         sutunlar={"Gaz Günü": "gasDay", "Kontrat İsmi": "contractName", "GİİH": "intraDayTradeValue",
+                   "GEİH": "dayAfterTradeValue", "GÖİH": "dayAheadTradeValue", "GRFİH": "gasReferenceTradeValue"},
+         tipler={"Gaz Günü": "tarih"})
+uc_nokta("stp.haftalik_fiyat", "stp/stp-weekly-reference-price", "weeklyRefPriceList", ayrinti="haftalik", tum=True,
+         sutunlar={"Hafta": "week", "HI": "weekdayPrice", "HS": "weekendPrice", "HT": "weekTotalPrice",
+                   "HRF": "weeklyRefPrice"})
+uc_nokta("stp.haftalik_hacim", "stp/matching-quantity/stp-weekly-matching-quantity", "stpWeeklyMatchList",
+         ayrinti="haftalik", tum=True,
+         sutunlar={"Hafta": "week", "HİEM": "hiem", "HSEM": "hsem", "HTEM": "htem", "TOPLAM": "emTotal"})
+uc_nokta("stp.haftalik_islem_hacmi", "stp/volume/stp-weekly-volume", "stpWeeklyMatchList", ayrinti="haftalik",
+         tum=True, sutunlar={"Hafta": "week", "HİİH": "hiih", "HSİH": "hsih", "HTİH": "htih", "TOPLAM": "ihTotal"})
+uc_nokta("stp.dengeleme_gazi_fiyati", "stp/balancing-gas-price", "prices", ayrinti="gunluk", tum=True,
+         sutunlar={"Gaz Günü": "gasDay", "İDAF": "additionalBalancingPurchase", "İDSF": "additionalBalancingSale",
+                   "DGAF": "balancingGasPurchase", "DGSF": "balancingGasSale", "İDAF (Kesinleşmiş)": "finalAbp",
+                   "İDSF (Kesinleşmiş)": "finalAbs", "DGAF (Kesinleşmiş)": "finalBgp",
+                   "DGSF (Kesinleşmiş)": "finalBgs"},
+         tipler={"Gaz Günü": "tarih"})
+uc_nokta("stp.ilave_dengeleyici_1_kodlu_islemler", "stp/greencode-operation", "operations", ayrinti="gunluk",
+         tum=True,
+         sutunlar={"Etki Ettiği Gaz Günü": "gasDay", "Kontrat Gaz Günü": "contractGasDay",
+                   "İşlem Tarihi": "transactionDate", "Kontrat İsmi": "contractName", "Miktar": "amount",
+                   "AOF": "weightedAverage"},
+         tipler={"Etki Ettiği Gaz Günü": "tarih", "Kontrat Gaz Günü": "tarih", "İşlem Tarihi": "tarih"})
+uc_nokta("stp.ilave_dengeleyici_2_kodlu_islemler", "stp/bluecode-operation", "operations", ayrinti="gunluk",
+         tum=True,
+         sutunlar={"Gaz Günü": "gasDay", "Kontrat İsmi": "contractName", "Miktar": "amount",
+                   "AOF": "weightedAverage"},
+         tipler={"Gaz Günü": "tarih"})
+uc_nokta("stp.ilave_dengeleyici_3_kodlu_islemler", "stp/orangecode-operation", "operations", ayrinti="gunluk",
+         tum=True)
+uc_nokta("stp.ilave_dengeleyici_4_kodlu_islemler", "stp/fourcode-operation", "operations", ayrinti="gunluk",
+         tum=True)
+uc_nokta("stp.ilave_dengeleyici_bildirimleri", "stp/additional-notification", "additionalNotifications",
+         ayrinti="anlik", sutunlar={"Tarih": "date", "Konu": "subjectTr", "Açıklama": "messageTr"},
+         tipler={"Tarih": "zaman"})
+uc_nokta("stp.dengesizlik_ve_tahsilat", "stp/allowance", "allowances", ayrinti="gunluk", tum=True,
+         sutunlar={"Gaz Günü": "gasDay", "Veri Türü": "type", "Fiziki Giriş (Sm3)": "inputDataPyhsical",
+                   "Fiziki Çıkış (Sm3)": "outputDataPyhsical", "Sanal Giriş (Sm3)": "inputDataVirtual",
+                   "Sanal Çıkış (Sm3)": "outputDataVirtual", "Sistem Yönü": "systemDirection",
+                   "Negatif Dengesizlik Miktarı (Sm3)": "negativeImbalance",
+                   "Pozitif Dengesizlik Miktarı (Sm3)": "positiveImbalance",
+                   "Negatif Dengesizlik Tutarı (TL)": "negativeImbalanceTradeValue",
+                   "Pozitif Dengesizlik Tutarı (TL)": "positiveImbalanceTradeValue"},
+         tipler={"Gaz Günü": "tarih"})
+uc_nokta("stp.bast", "stp/zero-balance", "zeroBalances", ayrinti="gunluk", tum=True,
+         sutunlar={"Gaz Günü": "gasDay", "BAST(TL)": "zeroBalance"}, tipler={"Gaz Günü": "tarih"})
+uc_nokta("stp.gddk", "stp/past-invoice", "pastInvoices", ayrinti="aylik", tum=True,
+         sutunlar={"Dönem": "period", "Versiyon": "version", "GDDK Borç Tutarı (TL)": "debt",
+                   "GDDK Alacak Tutarı (TL)": "credit"})
+uc_nokta("stp.islem_akisi", "stp/transaction-history", "transactionHistories", ayrinti="anlik",
+         sutunlar={"Kontrat": "contractName", "Tarih": "mathcingDate", "Fiyat": "price", "Miktar": "quantity"},
+         tipler={"Tarih": "zaman"})
+
+# Elektrik - İletim
+uc_nokta("iletim.entso_kodlari", "transmission/ents-organization?organizationId=-1", "entsOrganizationList",
+         sorgu=("period",),
+         sutunlar={"Adı": "organizationName", "EIC Kodu": "etsorganizationCode", "Kısa Adı": "organizationShortName"})
+uc_nokta("iletim.sifir_bakiye", "transmission/zero-balance", "zeroBalances", ayrinti="aylik", tum=True,
+         sutunlar={"Tarih": "date", "Toplam": "zeroBalanceAdjustment", "YAT": "downRegulation", "YAL": "upRegulation",
+                   "Manuel": "manual", "Enerji Dengesizliği Tutarı": "negativeImbalance", "KÜPST": "kupst",
+                   "YEK Enerji Dengesizliği Tutarı": "renewableImbalance"},
+         tipler={"Tarih": "tarih"})
+uc_nokta("iletim.kayip_katsayisi", "transmission/transmission-system-loss-factor",
+         "transmissionSystemLossFactorList", zaman="date", ayrinti="saatlik",
+         sutunlar={"İlk Versiyon": "firstVersionValue", "Son Versiyon": "lastVersionValue",
+                   "İlk Versiyon Tarihi": "firstVersionDate", "Son Versiyon Tarihi": "lastVersionDate"},
+         tipler={"İlk Versiyon Tarihi": "tarih", "Son Versiyon Tarihi": "tarih"})
+uc_nokta("iletim.kisit_maliyeti", "transmission/congestion-rent", "congestionRentList",
+         sorgu=("startDate", "endDate", "orderType"), tum=True,
+         sutunlar={"Şehir Id": "cityId", "Şehir Adı": "cityName", "PTF Maliyeti": "mcpCost",
+                   "SMF Maliyeti": "smpCost", "Talimat Sayısı": "orderCount",
+                   "YAL Talimat Miktarı": "upRegulationOrderCount", "YAT Talimat Miktarı": "downRegulationOrderCount",
+                   "Toplam Talimat Miktarı": "totalOrderCount"})
+uc_nokta("iletim.nomine_kapasite", "transmission/nominal-capacity", "nominalCapacitiyList", zaman="date",
+         ayrinti="saatlik", sutunlar={"İthalat (MWh)": "offerQuantity", "İhracat (MWh)": "bidQuantity"},
+         tipler={"Tarih": "gun"})
+uc_nokta("iletim.kapasite_talepleri", "transmission/tcat-participant-capacity", "data",
+         sorgu=("startDate", "endDate", "td"),
+         sutunlar={"Yön": "td", "İhale Numarası": "auctionCode", "Transfer Zamanı": "transferDatetime",
+                   "Katılımcılar Tarafından Talep Edilen Kapasite(MW)": "requestedCapacity",
+                   "Tahsis Edilen Kapasite(MW)": "allocatedCapacity", "Takas Fiyatı(EUR/MWh)": "clearancePrice",
+                   "Katılımcı Sayısı": "participantCount", "Kazanan Katılımcı Sayısı": "winnerCount",
+                   "Teklif Sayısı": "bidCount"})
+
+# Elektrik - Piyasalar
+uc_nokta("dengesizlik.dengesizlik", "market/energy-imbalance-hourly", "energyImbalances", zaman="date",
+         ayrinti="saatlik",
+         sutunlar={"Pozitif Dengesizlik Miktarı (MWh)": "positiveImbalance",
+                   "Negatif Dengesizlik Miktarı (MWh)": "negativeImbalance",
+                   "Pozitif Dengesizlik Tutarı (TL)": "positiveImbalanceIncome",
+                   "Negatif Dengesizlik Tutarı (TL)": "negativeImbalanceIncome"})
+uc_nokta("dengesizlik.dengeden_sorumlu_gruplar", "market/dsg-imbalance-quantity-orgaization-list", "orgList",
+         tum=True,
+         sutunlar={"Id": "organizationId", "Adı": "organizationName", "Durum": "organizationStatus",
+                   "EIC Kodu": "organizationETSOCode", "Kısa Adı": "organizationShortName"})
+uc_nokta("dengesizlik.dsg", "market/dsg-imbalance-quantity", "imbalanceQuantityList",
+         sorgu=("startDate", "endDate", "organizationId"), zaman="date", turet=("Tarih",), ayrinti="gunluk",
+         sutunlar={"Pozitif Dengesizlik Miktarı (MWh)": "positiveImbalanceQuantity",
+                   "Negatif Dengesizlik Miktarı (MWh)": "negativImbalanceQuantity"})
+uc_nokta("dgp.smf", "market/smp", "smpList", zaman="date", ayrinti="saatlik",
+         sutunlar={"SMF": "price", "Sistem Yönü": "smpDirection"})
+uc_nokta("dgp.hacim", "market/bpm-order-summary", "bpmOrderSummaryList", zaman="date", ayrinti="saatlik",
+         sutunlar={"Net": "net", "YAL (0)": "upRegulationZeroCoded", "YAL (1)": "upRegulationOneCoded",
+                   "YAL (2)": "upRegulationTwoCoded", "Teslim Edilen YAL": "upRegulationDelivered",
+                   "YAT (0)": "downRegulationZeroCoded", "YAT (1)": "downRegulationOneCoded",
+                   "YAT (2)": "downRegulationTwoCoded", "Teslim Edilen YAT": "downRegulationDelivered",
+                   "Sistem Yönü": "direction"},
+         tipler={"Sistem Yönü": __sistem_yonu})
+uc_nokta("genel.katilimci_sayisi", "market/participant", "participantList", sorgu=("period",), ayrinti="aylik")
+uc_nokta("genel.piyasa_katilimcilari", "market/market-participants", "marketParticipantList", sorgu=(),
+         sutunlar={"Id": "id", "Adı": "orgName", "Kısa Adı": "orgShortName", "GÖP Katılımı": "damEntry",
+                   "GİP Katılımı": "intraDayEntry", "STP Katılımı": "naturalGasMarketEntry",
+                   "Tüzel Kişilik Durumu": "legalStatus"})
+uc_nokta("genel.hacim", "market/market-volume", "marketVolumeList", sorgu=("startDate", "endDate", "period"),
+         zaman="date", turet=("Tarih",),
+         sutunlar={"İA Miktarı": "bilateralContractAmount", "GÖP Mİktarı": "dayAheadMarketVolume",
+                   "GİP Mİktarı": "intradayVolume", "DGP Miktarı": "balancedPowerMarketVolume"})
+uc_nokta("gip.aof", "market/intra-day-aof", "idmAofList", zaman="date", ayrinti="saatlik", sutunlar={"AOF": "price"})
+uc_nokta("gip.ozet", "market/intra-day-summary", "intraDaySummaryList", zaman="date", ayrinti="saatlik",
+         sutunlar={"Id": "id", "Kontrat Adı": "contract", "Teklif Edilen Talep Miktarı": "quantityOfAsk",
+                   "Teklif Edilen Arz Miktarı": "quantityOfBid", "Eşleşme Miktarı": "volume",
+                   "İşlem Hacmi": "tradingVolume", "Min. Talep Fiyatı": "minAskPrice",
+                   "Max. Talep Fiyatı": "maxAskPrice", "Min. Arz Fiyatı": "minBidPrice",
+                   "Max. Arz Fiyatı": "maxBidPrice", "Min. Eşleşme Fiyatı": "minMatchPrice",
+                   "Max. Eşleşme Fiyatı": "maxMatchPrice"})
+uc_nokta("gip.hacim", "market/intra-day-volume", "matchDetails", zaman="date", ayrinti="saatlik",
+         sutunlar={"Blok Eşleşme Miktarı": "blockMatchQuantity", "Saatlik Eşleşme Miktarı": "hourlyMatchQuantity"})
+uc_nokta("gip.islem_hacmi", "market/intra-day-income", "incomes", zaman="date", ayrinti="saatlik",
+         sutunlar={"İşlem Hacmi": "income"})
+uc_nokta("gip.islem_akisi", "market/intra-day-trade-history", "intraDayTradeHistoryList", zaman="date",
+         ayrinti="anlik",
+         sutunlar={"Id": "id", "Kontrat Adı": "conract", "Fiyat": "price", "Miktar": "quantity"})
+uc_nokta("gip.teklif_edilen_miktarlar", "market/intra-day-quantity", "offerQuantities", zaman="effectiveDate",
+         ayrinti="saatlik",
+         sutunlar={"Saatlik Talep Miktarı": "hourlyPurchaseQuantity", "Blok Talep Miktarı": "blockPurchaseQuantity",
+                   "Saatlik Arz Miktarı": "hourlySaleQuantity", "Blok Arz Miktarı": "blockSaleQuantity"})
+uc_nokta("gip.min_max_fiyatlar", "market/intra-day-min-max-price", "minMaxPriceList",
+         sorgu=("startDate", "endDate", "offerType"), zaman="date", ayrinti="saatlik",
+         sutunlar={"Min. Alış Fiyatı": "minAskPrice", "Max. Alış Fiyatı": "maxAskPrice",
+                   "Min. Satış Fiyatı": "minBidPrice", "Max. Satış Fiyatı": "maxBidPrice",
+                   "Min. Eşleşme Fiyatı": "minMatchPrice", "Max. Eşleşme Fiyatı": "maxMatchPrice"})
+uc_nokta("gop.ptf", "market/day-ahead-mcp", "dayAheadMCPList", zaman="date", ayrinti="saatlik",
+         sutunlar={"PTF": "price", "PTF (EUR/MWh)": "priceEur", "PTF (USD/MWh)": "priceUsd"})
+uc_nokta("gop.hacim", "market/day-ahead-market-volume", "dayAheadMarketVolumeList",
+         sorgu=("startDate", "endDate", "eic"), zaman="date", ayrinti="saatlik",
+         sutunlar={"Talep Eşleşme Miktarı": "matchedBids", "Eşleşme Miktarı": "volume",
+                   "Arz Eşleşme Miktarı": "matchedOffers", "Fiyattan Bağımsız Talep Miktarı": "priceIndependentBid",
+                   "Fiyattan Bağımsız Arz Miktarı": "priceIndependentOffer",
+                   "Maksimum Talep Miktarı": "quantityOfAsk", "Maksimum Arz Miktarı": "quantityOfBid"})
+uc_nokta("gop.organizasyon_hacim", "market/day-ahead-market-volume", "dayAheadMarketVolumeList",
+         sorgu=("startDate", "endDate", "eic"), zaman="date", ayrinti="saatlik", sutunlar=__gop_hacim)
+uc_nokta("gop.arz_talep_egrisi", "market/supply-demand-curve", "supplyDemandCurves", sorgu=("period",), zaman="date",
+         turet=("Saat",), ayrinti="saatlik", sutunlar={"Talep": "demand", "Fiyat": "price", "Arz": "supply"})
+uc_nokta("gop.islem_hacmi", "market/day-ahead-market-trade-volume", "dayAheadMarketTradeVolumeList", zaman="date",
+         ayrinti="saatlik", sutunlar={"Talep İşlem Hacmi": "volumeOfBid", "Arz İşlem Hacmi": "volumeOfAsk"})
+uc_nokta("gop.blok_miktari", "market/amount-of-block", "amountOfBlockList", zaman="date", ayrinti="saatlik",
+         sutunlar={"Talep Blok Teklif Miktarı": "amountOfPurchasingTowardsBlock",
+                   "Eşleşen Talep Blok Teklif Miktarı": "amountOfPurchasingTowardsMatchBlock",
+                   "Arz Blok Teklif Miktarı": "amountOfSalesTowardsBlock",
+                   "Eşleşen Arz Blok Teklif Miktarı": "amountOfSalesTowardsMatchBlock"})
+uc_nokta("gop.esnek_eslesme_miktari", "market/flexible-offer-amount-hourly", "getDamFlexibleOffer", zaman="day",
+         ayrinti="saatlik",
+         sutunlar={"Esnek Alış Teklif Eşleşme Miktarı": "matchedBuyingFlexibleOfferQuantity",
+                   "Esnek Satış Teklif Eşleşme Miktarı": "matchedSellingFlexibleOfferQuantity"},
+         tipler={"Tarih": "gun"})
+uc_nokta("gop.esnek_miktari", "market/flexible-offer-amount", "getDamFlexibleOffer", zaman="day", turet=("Tarih",),
+         ayrinti="gunluk",
+         sutunlar={"Toplam Esnek Alış Teklif Miktarı": "totalBuyingFlexibleOfferQuantity",
+                   "Esnek Alış Teklif Eşleşme Miktarı": "matchedBuyingFlexibleOfferQuantity",
+                   "Eşleşmeyen Esnek Alış Teklif Miktarı": "unmatchedBuyingFlexibleOfferQuantity",
+                   "Toplam Esnek Satış Teklif Miktarı": "totalSellingFlexibleOfferQuantity",
+                   "Esnek Satış Teklif Eşleşme Miktarı": "matchedSellingFlexibleOfferQuantity",
+                   "Eşleşmeyen Esnek Satış Teklif Miktarı": "unmatchedSellingFlexibleOfferQuantity"},
+         tipler={"Tarih": "gun"})
+uc_nokta("gop.fark_tutari", "market/day-ahead-diff-funds", "diffFundList", ayrinti="gunluk",
+         sutunlar={"Tarih": "date", "Talep": "originatingFromBids", "Arz": "originatingFromOffers",
+                   "Yuvarlama": "originatingFromRounding", "Toplam": "total"},
+         tipler={"Tarih": "tarih"})
+uc_nokta("gop.kptf", "market/day-ahead-interim-mcp", "interimMCPList", sorgu=("period",), zaman="date",
+         turet=("Saat",), ayrinti="saatlik", sutunlar={"KPTF": "marketTradePrice"})
+uc_nokta("ia.arz", "market/bilateral-contract-sell", "bilateralContractSellList",
+         sorgu=("startDate", "endDate", "eic"), zaman="date", ayrinti="saatlik", sutunlar={"Arz Miktarı": "quantity"})
+uc_nokta("ia.talep", "market/bilateral-contract-buy", "bilateralContractBuyList",
+         sorgu=("startDate", "endDate", "eic"), zaman="date", ayrinti="saatlik",
+         sutunlar={"Talep Miktarı": "quantity"})
+uc_nokta("yanhizmetler.primer_frekans_rezerv_miktari", "market/pfc-amount", "frequencyReservePriceList",
+         zaman="effectiveDate", ayrinti="saatlik", sutunlar={"PFK Yükümlülük (MWh)": "totalAmount"})
+uc_nokta("yanhizmetler.sekonder_frekans_rezerv_miktari", "market/sfc-amount", "frequencyReservePriceList",
+         zaman="effectiveDate", ayrinti="saatlik", sutunlar={"SFK Yükümlülük (MWh)": "totalAmount"})
+uc_nokta("yanhizmetler.primer_rezerv_fiyati", "market/pfc-price", "frequencyReservePriceList", zaman="effectiveDate",
+         ayrinti="saatlik", sutunlar={"PFK Fiyat (TL/MWh)": "price"})
+uc_nokta("yanhizmetler.sekonder_rezerv_fiyati", "market/sfc-price", "frequencyReservePriceList",
+         zaman="effectiveDate", ayrinti="saatlik", sutunlar={"SFK Fiyat (TL/MWh)": "price"})
+
+# Elektrik - Santraller
+uc_nokta("santraller.santraller", "production/power-plant", "powerPlantList", sorgu=("period",), sutunlar=__santral)
+uc_nokta("santraller.santral_veris_cekis_birimleri", "production/uevcb", "uevcbList",
+         sorgu=("period", "powerPlantId"), sutunlar=__uevcb)
+uc_nokta("santraller.gercek_zamanli_uretim_yapan_santraller", "production/real-time-generation-power-plant-list",
+         "powerPlantList", sorgu=(), sutunlar=__santral)
+uc_nokta("santraller.kurulu_guc", "production/installed-capacity", "installedCapacityList", sorgu=("period",),
+         ayrinti="aylik")
+uc_nokta("santraller.ariza_bakim_bildirimleri", "production/urgent-market-message?regionId=1",
+         "urgentMarketMessageList", ayrinti="anlik",
+         sutunlar={"Olay Bildirim Tarihi": "caseAddDate", "Santral Adı": "powerPlantName", "UEVCB Adı": "uevcbName",
+                   "Şehir": "city", "Olay Balangıç Tarihi": "caseStartDate", "Olay Bitiş Tarihi": "caseEndDate",
+                   "İşletmedeki Kurulu Güç": "operatorPower", "Olay Sırasında Kapasite": "capacityAtCaseTime",
+                   "Yakıt Tipi": "fuelType", "Gerekçe": "reason", "Gerekçe Tipi": "messageType"},
+         tipler={"Olay Bildirim Tarihi": "zaman", "Olay Balangıç Tarihi": "zaman", "Olay Bitiş Tarihi": "zaman",
+                 "Gerekçe Tipi": {0: "Arıza", 2: "Bakım"}})
+
+# Elektrik - Tüketim
+uc_nokta("tuketim.sehir", "consumption/city", "cityList", sorgu=(), tum=True,
+         sutunlar={"Şehir Id": "cityId", "İlçe Id": "districtId", "Şehir İsmi": "cityName",
+                   "İlçe İsmi": "districtName"})
+uc_nokta("tuketim.gerceklesen", "consumption/real-time-consumption", "hourlyConsumptions", zaman="date",
+         ayrinti="saatlik", sutunlar={"Tüketim": "consumption"})
+uc_nokta("tuketim.uecm", "consumption/swv", "swvList", zaman="date", ayrinti="saatlik", sutunlar={"UEÇM": "swv"})
+uc_nokta("tuketim.uecm_donemlik", "consumption/consumption", "consumptions", sorgu=("period",), ayrinti="aylik",
+         sutunlar={"Dönem": "period", "UEÇM": "consumption", "Serbest Tüketici UEÇM": "eligibleCustomerConsumption",
+                   "Tedarik Yükümlülüğü Kapsamındaki UEÇM": "underSupplyLiabilityConsumption"},
+         tipler={"Dönem": "ay"})
+uc_nokta("tuketim.uecm_serbest_tuketici", "consumption/swv-v2", "swvV2List", sorgu=("period",),
+         zaman="vc_gec_trh", ayrinti="saatlik", sutunlar={"Serbest Tüketici UEÇM": "st"})
+uc_nokta("tuketim.uecm_tedarik", "consumption/under-supply-liability-consumption", "swvList", ayrinti="aylik",
+         sutunlar={"Dönem": "date", "Tedarik Yükümlülüğü Kapsamındaki UEÇM": "swv"}, tipler={"Dönem": "ay"})
+uc_nokta("tuketim.tahmin", "consumption/load-estimation-plan", "loadEstimationPlanList", zaman="date",
+         ayrinti="saatlik", sutunlar={"Tüketim": "lep"})
+uc_nokta("tuketim.serbest_tuketici_sayisi", "consumption/eligible-consumer-quantity",
+         "eligibleConsumerQuantityList", sorgu=(), ayrinti="aylik",
+         sutunlar={"Dönem": "date", "Serbest Tüketici Sayısı": "meterQuantity", "Artış Oranı": "meterIncreaseRate"},
+         tipler={"Dönem": "tarih"})
+uc_nokta("tuketim.profil_serbest_tuketici_sayisi", "consumption/st", "stList", ayrinti="aylik")
+uc_nokta("tuketim.sayac_okuyan_kurum", "consumption/meter-reading-company", "meterReadingCompanyList",
+         sorgu=("period",), tum=True, sutunlar={"Id": "id", "Şirket Adı": "name", "Durum": "status"})
+uc_nokta("tuketim.dagitim_bolgeleri", "consumption/distribution", "distributionList", sorgu=(), tum=True,
+         sutunlar={"Id": "id", "Dağıtım Şirket Adı": "name"})
+uc_nokta("tuketim.profil_abone_grubu", "consumption/subscriber-profile-group", "subscriberProfileGroupList",
+         sorgu=("period", "distributionId"), tum=True, sutunlar={"Id": "id", "Profil Adı": "name"})
+uc_nokta("tuketim.sayac_okuma_tipi", "consumption/meter-reading-type", "meterReadingTypeList", sorgu=(), tum=True,
+         sutunlar={"Id": "id", "Sayaç Tipi": "name"})
+
+# Elektrik - Üretim
+uc_nokta("uretim.organizasyonlar", "production/dpp-organization", "organizations", sorgu=(),
+         sutunlar=__organizasyon)
+uc_nokta("uretim.organizasyon_veris_cekis_birimleri", "production/dpp-injection-unit-name", "injectionUnitNames",
+         sorgu=("organizationEIC",), sutunlar=__uevcb)
+uc_nokta("uretim.kgup", "production/dpp", "dppList", sorgu=("startDate", "endDate", "organizationEIC", "uevcbEIC"),
+         zaman="tarih", ayrinti="saatlik", sutunlar=__kaynak_bazli)
+uc_nokta("uretim.eak", "production/aic", "aicList", sorgu=("startDate", "endDate", "organizationEIC", "uevcbEIC"),
+         zaman="tarih", ayrinti="saatlik", sutunlar=__kaynak_bazli)
+uc_nokta("uretim.kudup", "production/sbfgp", "dppList",
+         sorgu=("startDate", "endDate", "organizationId", "uevcbId"), zaman="tarih", ayrinti="saatlik",
+         sutunlar=__kaynak_bazli)
+uc_nokta("uretim.uevm", "production/ssv-categorized", "ssvList", zaman="date", ayrinti="saatlik",
+         sutunlar={"Doğalgaz": "naturalGas", "Barajlı": "dam", "Linyit": "lignite", "Akarsu": "river",
+                   "İthal Kömür": "importedCoal", "Rüzgar": "wind", "Fuel Oil": "fueloil", "Jeo Termal": "geothermal",
+                   "Asfaltit Kömür": "asphaltite", "Taş Kömür": "stonecoal", "Biyokütle": "biomass",
+                   "Nafta": "naphtha", "LNG": "lng", "Uluslararası": "international", "Diğer": "other",
+                   "Toplam": "total"})
+uc_nokta("uretim.gerceklesen", "production/real-time-generation", "hourlyGenerations", zaman="date",
+         ayrinti="saatlik", sutunlar=__gerceklesen)
+uc_nokta("uretim.santral_bazli_gerceklesen", "production/real-time-generation_with_powerplant", "hourlyGenerations",
+         sorgu=("startDate", "endDate", "powerPlantId"), zaman="date", ayrinti="saatlik", sutunlar=__gerceklesen)
+uc_nokta("uretim.gddk", "production/gddk-amount", "gddkAmountList", ayrinti="aylik",
+         sutunlar={"Dönem": "id.date", "Versiyon": "id.version", "Alacak GDDK Tutarı (TL)": "gddkCreditAmount",
+                   "Borç GDDK Tutarı (TL)": "gddkDebtAmount", "Net GDDK Tutarı (TL)": "gddkNetAmount"},
+         tipler={"Dönem": "donem", "Versiyon": "donem"})
+
+# Elektrik - YEKDEM
+uc_nokta("yekdem.santraller", "production/renewable-sm-licensed-power-plant-list", "powerPlantList",
+         sorgu=("period",), sutunlar=__santral)
+uc_nokta("yekdem.kurulu_guc", "production/installed-capacity-of-renewable", "installedCapacityOfRenewableList",
+         sorgu=("period",), ayrinti="aylik")
+uc_nokta("yekdem.lisansli_uevm", "production/renewable-sm-licensed-injection-quantity", "renewableSMProductionList",
+         zaman="date", ayrinti="saatlik", sutunlar=dict(__yekdem_gerceklesen, **{"Çöp Gazı": "landfillGas"}))
+uc_nokta("yekdem.lisanssiz_uevm", "production/renewable-unlicenced-generation-amount",
+         "renewableUnlicencedGenerationAmountList", zaman="date", ayrinti="saatlik",
+         sutunlar={"Rüzgar": "wind", "Kanal Tipi": "canalType", "Biyogaz": "biogas", "Güneş": "sun",
+                   "Biyokütle": "biomass", "Diğer": "others", "Toplam": "total"})
+uc_nokta("yekdem.uevm", "production/renewable-sm-production", "renewableSMProductionList", zaman="date",
+         ayrinti="saatlik",
+         sutunlar={"Rüzgar": "wind", "Jeotermal": "geothermal", "Rezervuarlı": "dammedHydroWithReservoir",
+                   "Kanal Tipi": "canalType", "Nehir Tipi": "riverType", "Çöp Gazı": "landfillGas",
+                   "Biyogaz": "biogas", "Biyokütle": "biomass", "Diğer": "others", "Toplam": "total"})
+uc_nokta("yekdem.gerceklesen", "production/renewable-sm-licensed-real-time-generation",
+         "renewableLicencedGenerationAmount", zaman="date", ayrinti="saatlik", sutunlar=__yekdem_gerceklesen)
+uc_nokta("yekdem.santral_bazli_gerceklesen", "production/renewable-sm-licensed-real-time-generation_with_powerplant",
+         "renewableLicencedGenerationAmount", sorgu=("startDate", "endDate", "powerPlantId"), zaman="date",
+         ayrinti="saatlik", sutunlar=__yekdem_gerceklesen)
+uc_nokta("yekdem.birim_maliyet", "production/renewable-sm-unit-cost", "renewableSMUnitCostList", ayrinti="aylik",
+         sutunlar={"Dönem": "id.donem", "Versiyon": "id.versiyon", "Birim Maliyet (TL)": "unitCost"},
+         tipler={"Dönem": "donem", "Versiyon": "donem"})
+uc_nokta("yekdem.donemsel_maliyet", "production/renewables-support", "renewablesSupports", ayrinti="aylik",
+         sutunlar={"Dönem": "period", "Birim Maliyet (TL)": "unitCost",
+                   "Lisanssız Toplam Maliyet (TL)": "licenseExemptCost",
+                   "Lisanlı Toplam Maliyet (TL)": "reneablesCost", "Toplam Maliyet (TL)": "renewablesTotalCost",
+                   "Toplam Gelir (TL)": "portfolioIncome"},
+         tipler={"Dönem": "donem"})
@@ -0,0 +1,98 @@
+import pandas as __pd
+
+from seffaflik import _ayarlar as __ayarlar
+
+__kategori_orani = 0.5
+
+
+def kompakt():
+    """
+    Sonuçlarda kompakt veri tipi politikasının uygulanıp uygulanmadığını vermektedir.
+
+    Geri Dönüş Değeri
+    -----------------
+    Kompakt Politika (bool)
+    """
+    return __ayarlar.deger("veri_tipi") == "kompakt"
+
+
+def anahtar():
+    """
+    Geçerli veri tipi politikasını ve Arrow ayarını (ayarlar(arrow=...)) önbellek anahtarlarına eklenecek biçimde
+    vermektedir. "tam" politikada ve Arrow kapalıyken boş sözlük verilir; böylece varsayılan ayarlarla oluşturulmuş
+    önbellek anahtarları değişmez.
+
+    Geri Dönüş Değeri
+    -----------------
+    Politika (dict)
+    """
+    politika = {}
+    if kompakt():
+        politika.update({"__veri_tipi": "kompakt", "__float32": bool(__ayarlar.deger("float32"))})
+    if __ayarlar.deger("arrow"):
+        politika["__arrow"] = True
+    return politika
+
+
+def uygula(df):
+    """
+    Geçerli veri tipi politikasını (ayarlar(veri_tipi=...)) sonuç tablosuna uygular. "tam" politikada tablo olduğu
+    gibi verilir. "kompakt" politikada:
+        - tekrar eden metin sütunları (farklı değer sayısı satır sayısının yarısını geçmeyen; ör: Sistem Yönü,
+          Kontrat Adı, Kısa Adı, DST, Yakıt Tipi) kategorik,
+        - tam sayı "Saat" sütunu int8,
+        - ayarlar(float32=True) ise ondalıklı sütunlar float32
+    olarak verilir. Seyrek, tarih ve zaman farkı sütunlarına dokunulmaz.
+
+    Parametreler
+    ------------
+    df : pandas.DataFrame
+
+    Geri Dönüş Değeri
+    -----------------
+    DataFrame
+    """
+    if not kompakt() or not isinstance(df, __pd.DataFrame) or len(df) == 0:
+        return df
+    float32 = __ayarlar.deger("float32")
+    donusumler = []
+    for i, (ad, tip) in enumerate(df.dtypes.items()):
+        seri = df.iloc[:, i]
+        if isinstance(tip, (__pd.CategoricalDtype, __pd.SparseDtype)):
+            continue
+        if ad == "Saat" and __pd.api.types.is_integer_dtype(tip):
+            donusumler.append((i, seri.astype("int8")))
+        elif float32 and __pd.api.types.is_float_dtype(tip) and tip != "float32":
+            donusumler.append((i, seri.astype("float32")))
+        elif __pd.api.types.is_string_dtype(tip) and __kategorik(seri):
+            donusumler.append((i, seri.astype("category")))
+    if len(donusumler) == 0:
+        return df
+    df = df.copy(deep=False)
+    for i, seri in donusumler:
+        df.isetitem(i, seri)
+    return df
+
+
+def arrow_tablosu(df):
+    """
+    Sonuç tablosunu pyarrow.Table'a çevirir. ayarlar(arrow=True) ile alınan Arrow tabanlı sütunlar kopyalanmadan
+    aktarılır; tablo Polars, DuckDB gibi Arrow destekleyen kütüphanelere doğrudan verilebilir.
+
+    Parametreler
+    ------------
+    df : pandas.DataFrame
+
+    Geri Dönüş Değeri
+    -----------------
+    pyarrow.Table
+    """
+    import pyarrow as pa
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def __kategorik(seri):
+    try:
+        return seri.nunique() <= len(seri) * __kategori_orani
+    except TypeError:  # liste/sözlük içeren sütunlar
+        return False
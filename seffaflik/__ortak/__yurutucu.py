@@ -0,0 +1,125 @@
+import os as __os
+import collections as __collections
+import threading as __threading
+import concurrent.futures as __futures
+
+from seffaflik import _ayarlar as __ayarlar
+
+__kilit = __threading.Lock()
+__durum = {"yurutucu": None, "pid": None, "anahtar": None}
+__yerel = __threading.local()
+__yurutucu_turleri = ("thread", "process")
+
+
+def yurutucu():
+    """
+    Süreç genelinde paylaşılan ve ilk ihtiyaç duyulduğunda oluşturulan yürütücüyü (executor) vermektedir. Yürütücü
+    türü ve iş parçacığı/süreç sayısı ayarlar(executor=..., max_workers=...) ile belirlenir; bu ayarlar (ya da
+    max_workers girilmemişse host_basina_baglanti) değiştiğinde veya süreç fork edildiğinde yürütücü yeniden
+    oluşturulur.
+
+    Geri Dönüş Değeri
+    -----------------
+    concurrent.futures.Executor
+    """
+    pid = __os.getpid()
+    tur = __tur()
+    max_workers = __ayarlar.deger("max_workers") or \
+        (__os.cpu_count() if tur == "process" else __ayarlar.deger("host_basina_baglanti"))
+    anahtar = (tur, max_workers)
+    if __durum["yurutucu"] is not None and __durum["pid"] == pid and __durum["anahtar"] == anahtar:
+        return __durum["yurutucu"]
+    with __kilit:
+        if __durum["yurutucu"] is None or __durum["pid"] != pid or __durum["anahtar"] != anahtar:
+            # Eski yürütücü kapatılmaz; başka iş parçacıkları ona hâlâ görev gönderiyor olabilir. Referansı kalmadığında
+            # bekleyen görevleri bitirip kendiliğinden kapanır
+            if tur == "process":
+                # Süreç havuzu (multiprocessing) yalnızca kullanıldığında yüklenir
+                yeni = __futures.ProcessPoolExecutor(max_workers=max_workers, initializer=__isci_isaretle)
+            else:
+                yeni = __futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="seffaflik",
+                                                    initializer=__isci_isaretle)
+            __durum.update({"yurutucu": yeni, "pid": pid, "anahtar": anahtar})
+        return __durum["yurutucu"]
+
+
+def esle(f, liste):
+    """
+    İlgili fonksiyonu listedeki her eleman için paylaşılan yürütücüde eşzamanlı çalıştırır (Pool.map karşılığı).
+    Sonuçlar listedeki sırayla verilir. Yürütücü içinden yapılan iç içe çağrılar kilitlenmeyi önlemek için sırayla
+    çalıştırılır.
+
+    Parametreler
+    ------------
+    f     : çalıştırılacak fonksiyon
+    liste : fonksiyona sırayla verilecek argümanlar
+
+    Geri Dönüş Değeri
+    -----------------
+    Sonuç Listesi (list)
+    """
+    liste = list(liste)
+    if len(liste) <= 1 or getattr(__yerel, "isci", False):
+        return [f(x) for x in liste]
+    return list(yurutucu().map(f, liste))
+
+
+def coklu_esle(f, liste):
+    """
+    İlgili fonksiyonu listedeki her argüman grubu için paylaşılan yürütücüde eşzamanlı çalıştırır (Pool.starmap
+    karşılığı). Sonuçlar listedeki sırayla verilir.
+
+    Parametreler
+    ------------
+    f     : çalıştırılacak fonksiyon
+    liste : fonksiyona açılarak verilecek argüman grupları (list of list/tuple)
+
+    Geri Dönüş Değeri
+    -----------------
+    Sonuç Listesi (list)
+    """
+    liste = list(liste)
+    if len(liste) <= 1 or getattr(__yerel, "isci", False):
+        return [f(*x) for x in liste]
+    return list(yurutucu().map(f, *zip(*liste)))
+
+
+def sirali(f, liste, onden=2):
+    """
+    İlgili fonksiyonu listedeki her eleman için paylaşılan yürütücüde çalıştırır ve sonuçları listedeki sırayla, hazır
+    oldukça verir (generator). Aynı anda en fazla onden kadar sonuç bellekte tutulur.
+
+    Parametreler
+    ------------
+    f     : çalıştırılacak fonksiyon
+    liste : fonksiyona sırayla verilecek argümanlar
+    onden : önceden başlatılacak azami görev sayısı (Varsayılan: 2)
+
+    Geri Dönüş Değeri
+    -----------------
+    Sonuçlar (generator)
+    """
+    if getattr(__yerel, "isci", False) or onden < 1:
+        for x in liste:
+            yield f(x)
+        return
+    bekleyenler = __collections.deque()
+    try:
+        for x in liste:
+            bekleyenler.append(yurutucu().submit(f, x))
+            if len(bekleyenler) > onden:
+                yield bekleyenler.popleft().result()
+        while bekleyenler:
+            yield bekleyenler.popleft().result()
+    finally:
+        for s in bekleyenler:
+            s.cancel()
+
+
+def __tur():
+    tur = __ayarlar.deger("executor")
+    return tur if tur in __yurutucu_turleri else "thread"
+
+
+def __isci_isaretle():
+    __yerel.isci = True
@@ -0,0 +1,192 @@
+import logging as __logging
+import threading as __threading
+
+from seffaflik.__ortak import __parametreler as __param
+
+AYARLAR = {
+    "ana_url": __param.__ana_url,
+    "zaman_asimi": __param.__timeout,
+    "havuz_sayisi": __param.__havuz_sayisi,
+    "host_basina_baglanti": __param.__host_basina_baglanti,
+    "deneme_sayisi": __param.__deneme_sayisi,
+    "bekleme_katsayisi": __param.__bekleme_katsayisi,
+    "azami_bekleme": __param.__azami_bekleme,
+    "titreme": True,
+    "saniyede_istek": __param.__saniyede_istek,
+    "azami_eszamanli_istek": __param.__azami_eszamanli_istek,
+    "executor": __param.__executor,
+    "max_workers": __param.__max_workers,
+    "onbellek": __param.__onbellek,
+    "onbellek_dizini": None,
+    "onbellek_boyutu": __param.__onbellek_boyutu,
+    "bellek_suresi": __param.__bellek_suresi,
+    "kosullu_istek": True,
+    "veri_tipi": __param.__veri_tipi,
+    "float32": __param.__float32,
+    "arrow": False,
+    "json_cozucu": __param.__json_cozucu,
+    "json_alt_agac": __param.__json_alt_agac,
+    "kaset": None,
+    "kaset_modu": None,
+}
+__uc_nokta_ayarlari = {}
+
+__kilit = __threading.RLock()
+__surum = 0
+
+
+def ayarlar(**kwargs):
+    """
+    Kütüphanenin Şeffaflık Platformu ile haberleşme davranışını belirleyen ayarları günceller ve güncel ayarları
+    vermektedir. Parametre girilmediği taktirde yalnızca güncel ayarları vermektedir.
+
+    Parametreler
+    ------------
+    ana_url              : uç nokta adreslerinin ekleneceği servis adresi; yerel bir sahte sunucu ya da vekil sunucu
+                           (proxy) kullanmak için değiştirilebilir
+                           (Varsayılan: "https://seffaflik.epias.com.tr/transparency/service/")
+    zaman_asimi          : saniye cinsinden istek zaman aşımı (Varsayılan: 120)
+    havuz_sayisi         : bağlantı havuzunda tutulacak sunucu (host) sayısı (Varsayılan: 10)
+    host_basina_baglanti : sunucu başına açık tutulabilecek azami bağlantı sayısı (Varsayılan: 32)
+    deneme_sayisi        : geçici hatalarda (bağlantı hatası, zaman aşımı, 429, 5xx) bir isteğin toplam deneme sayısı
+                           (Varsayılan: 5)
+    bekleme_katsayisi    : saniye cinsinden üstel geri çekilme katsayısı; n. tekrar öncesi en fazla
+                           bekleme_katsayisi * 2^(n-1) saniye beklenir (Varsayılan: 0.5)
+    azami_bekleme        : saniye cinsinden iki deneme arasındaki azami bekleme, Retry-After başlığı dahil
+                           (Varsayılan: 60)
+    titreme              : bekleme süresinin [0, hesaplanan süre] aralığında rastgele seçilip seçilmeyeceği
+                           (Varsayılan: True)
+    saniyede_istek       : saniyede yapılabilecek azami istek sayısı; tüm iş parçacıkları (thread), asenkron görevler
+                           ve alt süreçler (process) arasında paylaşılır. None ise sınır uygulanmaz (Varsayılan: None)
+    azami_eszamanli_istek: aynı anda yanıt beklenen azami istek sayısı; saniyede_istek gibi tüm süreçler arasında
+                           paylaşılır. None ise sınır uygulanmaz (Varsayılan: None)
+    executor             : toplu (tum_*) fonksiyonlarda kullanılacak yürütücü türü: "thread" (G/Ç için iş parçacığı
+                           havuzu) ya da "process" (ayrıştırma yükü yüksek işler için süreç havuzu)
+                           (Varsayılan: "thread")
+    max_workers          : yürütücüdeki azami iş parçacığı/süreç sayısı. None ise iş parçacığı havuzu için
+                           host_basina_baglanti, süreç havuzu için işlemci sayısı kullanılır (Varsayılan: None)
+    onbellek             : kesinleşmiş geçmiş günlerin Parquet disk önbelleğinde saklanıp saklanmayacağı; pyarrow ya da
+                           fastparquet yüklü değilse önbellek kullanılmaz (Varsayılan: True)
+    onbellek_dizini      : önbellek dizini. None ise $SEFFAFLIK_DIR/onbellek kullanılır (Varsayılan: None)
+    onbellek_boyutu      : bayt cinsinden azami önbellek boyutu; aşıldığında en uzun süredir kullanılmayan günler
+                           silinir. None ise sınır uygulanmaz (Varsayılan: 2 GB)
+    bellek_suresi        : saniye cinsinden organizasyon, santral, dağıtım bölgesi gibi referans listelerinin bellekte
+                           (disk önbelleği etkinse diskte de) saklanma süresi. 0 ya da None ise listeler her çağrıda
+                           yeniden çekilir (Varsayılan: 3600)
+    kosullu_istek        : ETag/Last-Modified bilgisi veren yanıtların saklanıp sonraki isteklerde If-None-Match/
+                           If-Modified-Since ile doğrulanıp doğrulanmayacağı; yanıt değişmemişse (304) önceki sonuç
+                           yeniden kullanılır. Yalnızca tarih aralığı almayan (referans listeleri, dönemlik) uç
+                           noktaların yanıtları, toplamda en fazla 64 MB saklanır (Varsayılan: True)
+    veri_tipi            : sonuç tablolarının veri tipi politikası: "tam" (metinler object, sayılar int64/float64) ya
+                           da "kompakt" (tekrar eden metinler kategorik, Saat int8) (Varsayılan: "tam")
+    float32              : "kompakt" politikada ondalıklı değerlerin float32 olarak verilip verilmeyeceği
+                           (Varsayılan: False)
+    arrow                : yanıtların doğrudan Arrow dizilerine ayrıştırılıp Arrow tabanlı (pd.ArrowDtype) sütunlarla
+                           verilip verilmeyeceği; pyarrow paketi gereklidir (Varsayılan: False)
+    json_cozucu          : yanıtların JSON çözücüsü: "otomatik" (yüklü olan en hızlı çözücü), "orjson", "simdjson",
+                           "ujson" ya da "json" (Varsayılan: "otomatik")
+    json_alt_agac        : yanıtlardan yalnızca kayıt listesinin (body.<liste anahtarı>) çözülüp çözülmeyeceği;
+                           simdjson ile belgenin geri kalanı Python nesnelerine çevrilmez (Varsayılan: False)
+    kaset                : isteklerin kaydedileceği/oynatılacağı gzip ile sıkıştırılmış kaset dosyası (Varsayılan: None)
+    kaset_modu           : "kaydet" (her başarılı yanıt kasete eklenir; koşullu istek yapılmaz), "oynat" (yanıtlar ağa
+                           çıkılmadan kasetten verilir; kasette olmayan istekler hata verir), "ekle" (kasette olan
+                           yanıtlar oynatılır, olmayanlar platformdan çekilip kasete eklenir) ya da None (kaset
+                           kullanılmaz). Kaset kullanılırken disk ve bellek önbellekleri devre dışıdır
+                           (Varsayılan: None)
+
+    Geri Dönüş Değeri
+    -----------------
+    Güncel Ayarlar (dict)
+    """
+    global __surum
+    with __kilit:
+        for anahtar, deger_ in kwargs.items():
+            if anahtar not in AYARLAR:
+                __logging.warning("Geçersiz ayar: " + anahtar + ". Geçerli ayarlar: " + ", ".join(AYARLAR))
+                continue
+            AYARLAR[anahtar] = deger_
+        if kwargs:
+            __surum += 1
+        return dict(AYARLAR)
+
+
+def uc_nokta_ayarlari(onek, **kwargs):
+    """
+    İlgili uç nokta öneki (ör: "market/", "market/intra-day-trade-history") ile başlayan istekler için genel ayarları
+    ezen ayarları günceller ve öneke ait güncel ayarları vermektedir. Birden fazla önek eşleştiğinde en uzun önek
+    geçerlidir. Değer olarak None girilen ayar önekten kaldırılır.
+
+    Parametreler
+    ------------
+    onek   : metin formatında uç nokta öneki
+    kwargs : ayarlar() fonksiyonunda geçerli olan ayarlar
+
+    Geri Dönüş Değeri
+    -----------------
+    Öneke Ait Ayarlar (dict)
+    """
+    with __kilit:
+        onek_ayarlari = __uc_nokta_ayarlari.setdefault(onek, {})
+        for anahtar, deger_ in kwargs.items():
+            if anahtar not in AYARLAR:
+                __logging.warning("Geçersiz ayar: " + anahtar + ". Geçerli ayarlar: " + ", ".join(AYARLAR))
+            elif deger_ is None:
+                onek_ayarlari.pop(anahtar, None)
+            else:
+                onek_ayarlari[anahtar] = deger_
+        if not onek_ayarlari:
+            __uc_nokta_ayarlari.pop(onek)
+        return dict(onek_ayarlari)
+
+
+def deger(anahtar, uc_nokta=None):
+    """
+    İlgili ayarın güncel değerini vermektedir. Uç nokta girildiği taktirde o uç noktayı kapsayan en uzun önek için
+    tanımlanmış değer, yoksa genel değer verilir.
+
+    Parametreler
+    ------------
+    anahtar  : metin formatında ayar adı
+    uc_nokta : metin formatında uç nokta (ör: "market/day-ahead-mcp?startDate=...") (Varsayılan: None)
+
+    Geri Dönüş Değeri
+    -----------------
+    Ayar Değeri
+    """
+    onek_ = onek(anahtar, uc_nokta)
+    if onek_:
+        return __uc_nokta_ayarlari.get(onek_, {}).get(anahtar, AYARLAR[anahtar])
+    return AYARLAR[anahtar]
+
+
+def onek(anahtar, uc_nokta=None):
+    """
+    İlgili ayarın uç nokta için hangi önekten geldiğini vermektedir. Genel değer geçerliyse boş metin verilir.
+
+    Parametreler
+    ------------
+    anahtar  : metin formatında ayar adı
+    uc_nokta : metin formatında uç nokta (Varsayılan: None)
+
+    Geri Dönüş Değeri
+    -----------------
+    Önek (str)
+    """
+    if uc_nokta and __uc_nokta_ayarlari:
+        onekler = [onek_ for onek_, ayar in list(__uc_nokta_ayarlari.items())
+                   if anahtar in ayar and uc_nokta.startswith(onek_)]
+        if onekler:
+            return max(onekler, key=len)
+    return ""
+
+
+def surum():
+    """
+    Ayarlar her güncellendiğinde artan sayacı vermektedir. Ayarlara bağlı nesneleri (ör: bağlantı havuzu) yeniden
+    oluşturmak gerekip gerekmediğini anlamak için kullanılır.
+
+    Geri Dönüş Değeri
+    -----------------
+    Ayar Sürümü (int)
+    """
+    return __surum
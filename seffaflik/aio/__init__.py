@@ -0,0 +1,76 @@
+"""
+Kütüphanedeki tüm veri fonksiyonlarının asenkron (asyncio) karşılıklarını içermektedir. Modüller senkron modüllerle aynı
+adları taşır ve her fonksiyon aynı parametrelerle await edilerek çağrılır:
+
+    from seffaflik import aio
+    df = await aio.gop.ptf(baslangic_tarihi="2019-01-01", bitis_tarihi="2019-01-01")
+
+Bu modül asenkron bir HTTP istemcisi değil, senkron fonksiyonları iş parçacıklarına aktaran (thread-offload) bir
+sarmalayıcıdır: her çağrı senkron fonksiyonu (requests, tekrar deneme ve hız sınırlarıyla birlikte) host_basina_baglanti
+kadar iş parçacığı olan ayrı bir yürütücüde loop.run_in_executor ile çalıştırır. Olay döngüsü bloklanmaz; ancak
+eşzamanlılık iş parçacığı sayısıyla sınırlıdır ve her bekleyen çağrı bir iş parçacığı tutar. Senkron kodda toplu
+(tum_*) fonksiyonlar ve uzun aralıkların pencereleri zaten paylaşılan yürütücüde eşzamanlı çekilir (bkz. ayarlar(
+executor=..., max_workers=...)).
+"""
+import sys as __sys
+import types as __types
+import asyncio as __asyncio
+import inspect as __inspect
+import functools as __functools
+import threading as __threading
+from concurrent.futures import ThreadPoolExecutor as __ThreadPoolExecutor
+
+from seffaflik import _ayarlar as __ayarlar
+from seffaflik.dogalgaz import stp as __stp
+from seffaflik.elektrik import iletim as __iletim, santraller as __santraller, tuketim as __tuketim, \
+    uretim as __uretim, yekdem as __yekdem
+from seffaflik.elektrik.piyasalar import dengesizlik as __dengesizlik, dgp as __dgp, genel as __genel, gip as __gip, \
+    gop as __gop, ia as __ia, yanhizmetler as __yanhizmetler
+
+__kilit = __threading.Lock()
+__durum = {"yurutucu": None, "baglanti": None}
+
+
+def __yurutucu():
+    baglanti = __ayarlar.deger("host_basina_baglanti")
+    with __kilit:
+        if __durum["yurutucu"] is None or __durum["baglanti"] != baglanti:
+            # Eski yürütücü kapatılmaz; diğer görevler ona hâlâ iş gönderiyor olabilir. Referansı kalmadığında bekleyen
+            # işleri bitirip kendiliğinden kapanır
+            __durum.update({"yurutucu": __ThreadPoolExecutor(max_workers=baglanti, thread_name_prefix="seffaflik-aio"),
+                            "baglanti": baglanti})
+        return __durum["yurutucu"]
+
+
+def __asenkron(f):
+    @__functools.wraps(f)
+    async def asenkron_f(*args, **kwargs):
+        loop = __asyncio.get_running_loop()
+        return await loop.run_in_executor(__yurutucu(), __functools.partial(f, *args, **kwargs))
+
+    return asenkron_f
+
+
+def __asenkron_modul(modul):
+    ad = modul.__name__.rsplit(".", 1)[-1]
+    asenkron_modul = __types.ModuleType(__name__ + "." + ad, modul.__doc__)
+    for isim, f in __inspect.getmembers(modul, __inspect.isfunction):
+        if not isim.startswith("_") and not isim.endswith("_iter") and f.__module__ == modul.__name__:
+            setattr(asenkron_modul, isim, __asenkron(f))
+    __sys.modules[asenkron_modul.__name__] = asenkron_modul
+    return asenkron_modul
+
+
+stp = __asenkron_modul(__stp)
+iletim = __asenkron_modul(__iletim)
+santraller = __asenkron_modul(__santraller)
+tuketim = __asenkron_modul(__tuketim)
+uretim = __asenkron_modul(__uretim)
+yekdem = __asenkron_modul(__yekdem)
+dengesizlik = __asenkron_modul(__dengesizlik)
+dgp = __asenkron_modul(__dgp)
+genel = __asenkron_modul(__genel)
+gip = __asenkron_modul(__gip)
+gop = __asenkron_modul(__gop)
+ia = __asenkron_modul(__ia)
+yanhizmetler = __asenkron_modul(__yanhizmetler)
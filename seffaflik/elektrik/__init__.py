@@ -1 +1,15 @@
-from seffaflik.elektrik import (piyasalar, santraller, tuketim, uretim)
+import importlib as __importlib
+
+__alt_moduller = ("iletim", "piyasalar", "santraller", "tuketim", "uretim", "yekdem")
+__all__ = ["iletim", "piyasalar", "santraller", "tuketim", "uretim", "yekdem"]
+
+
+def __getattr__(ad):
+    # Alt modüller ilk erişildiklerinde yüklenir (PEP 562)
+    if ad in __alt_moduller:
+        return __importlib.import_module(__name__ + "." + ad)
+    raise AttributeError("module '" + __name__ + "' has no attribute '" + ad + "'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__alt_moduller))
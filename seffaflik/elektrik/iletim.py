@@ -1,11 +1,10 @@
 import pandas as __pd
 import datetime as __dt
 
-from seffaflik.__ortak.__araclar import make_requests as __make_requests
+from seffaflik.__ortak import __pencere
+from seffaflik.__ortak import __uc_noktalar
 from seffaflik.__ortak import __dogrulama as __dogrulama
 
-__first_part_url = "transmission/"
-
 
 def entso_kodlari(tarih=__dt.datetime.now().strftime("%Y-%m-%d")):
     """
@@ -21,17 +20,7 @@ def entso_kodlari(tarih=__dt.datetime.now().strftime("%Y-%m-%d")):
     ENTSO-E (X) Kodları (Adı, EIC Kodu, Kısa Adı)
     """
     if __dogrulama.__tarih_dogrulama(tarih):
-        try:
-            particular_url = __first_part_url + "ents-organization?organizationId=-1&period=" + tarih
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["entsOrganizationList"])
-            df.rename(index=str, columns={"organizationName": "Adı", "organizationShortName": "Kısa Adı",
-                                          "etsorganizationCode": "EIC Kodu"}, inplace=True)
-            df = df[["Adı", "EIC Kodu", "Kısa Adı"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("iletim.entso_kodlari", tarih)
 
 
 def sifir_bakiye(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -49,22 +38,10 @@ def sifir_bakiye(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Sıfır Bakiye Düzeltme Tutarı (TL)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "zero-balance" + "?startDate=" + baslangic_tarihi + \
-                             "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["zeroBalances"])
-            df = df.rename(columns={"date": "Tarih", "zeroBalanceAdjustment": "Toplam", "downRegulation": "YAT",
-                                    "upRegulation": "YAL", "manual": "Manuel",
-                                    "negativeImbalance": "Enerji Dengesizliği Tutarı", "kupst": "KÜPST",
-                                    "renewableImbalance": "YEK Enerji Dengesizliği Tutarı"})
-            df["Tarih"] = df["Tarih"].apply(lambda s: __pd.to_datetime(s[:10]))
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("iletim.sifir_bakiye", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def kayip_katsayisi(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                     bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -80,22 +57,7 @@ def kayip_katsayisi(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     ISKK
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "transmission-system-loss-factor" + "?startDate=" + baslangic_tarihi + \
-                             "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["transmissionSystemLossFactorList"])
-            df = df.rename(
-                columns={"date": "Tarih", "firstVersionValue": "İlk Versiyon", "lastVersionValue": "Son Versiyon",
-                         "firstVersionDate": "İlk Versiyon Tarihi", "lastVersionDate": "Son Versiyon Tarihi"})
-            df["Saat"] = df["Tarih"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["Tarih"].apply(lambda d: d[:10]))
-            df["İlk Versiyon Tarihi"] = df["İlk Versiyon Tarihi"].apply(lambda s: __pd.to_datetime(s[:10]))
-            df["Son Versiyon Tarihi"] = df["Son Versiyon Tarihi"].apply(lambda s: __pd.to_datetime(s[:10]))
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df[["Tarih", "Saat", "İlk Versiyon", "Son Versiyon", "İlk Versiyon Tarihi", "Son Versiyon Tarihi"]]
+        return __uc_noktalar.cek("iletim.kayip_katsayisi", baslangic_tarihi, bitis_tarihi)
 
 
 def kisit_maliyeti(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -115,22 +77,10 @@ def kisit_maliyeti(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Kısıt Miktar/Maliyet
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "congestion-rent" + "?startDate=" + baslangic_tarihi + \
-                             "&endDate=" + bitis_tarihi + "&orderType=" + talimat_tipi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["congestionRentList"])
-            df = df.rename(columns={"cityId": "Şehir Id", "cityName": "Şehir Adı", "mcpCost": "PTF Maliyeti",
-                                    "smpCost": "SMF Maliyeti", "orderCount": "Talimat Sayısı",
-                                    "upRegulationOrderCount": "YAL Talimat Miktarı",
-                                    "downRegulationOrderCount": "YAT Talimat Miktarı",
-                                    "totalOrderCount": "Toplam Talimat Miktarı"})
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("iletim.kisit_maliyeti", baslangic_tarihi, bitis_tarihi, talimat_tipi)
 
 
+@__pencere.pencereli(gun=31)
 def nomine_kapasite(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                     bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -147,20 +97,10 @@ def nomine_kapasite(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Nomine Kapasite
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "nominal-capacity" + "?startDate=" + baslangic_tarihi + \
-                             "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["nominalCapacitiyList"])
-            df["Saat"] = df["date"].apply(__pd.to_datetime).dt.hour
-            df["Tarih"] = df["date"].apply(__pd.to_datetime).dt.date.apply(str)
-            df = df.rename(columns={"offerQuantity": "İthalat (MWh)", "bidQuantity": "İhracat (MWh)"})
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df[["Tarih", "Saat", "İthalat (MWh)", "İhracat (MWh)"]]
+        return __uc_noktalar.cek("iletim.nomine_kapasite", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def kapasite_talepleri(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                        bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                        yonler=["TRGR", "GRTR", "TRBG", "BGTR"]):
@@ -179,23 +119,9 @@ def kapasite_talepleri(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
         try:
-            df_list = []
+            liste = []
             for yon in yonler:
-                particular_url = __first_part_url + "tcat-participant-capacity" + "?startDate=" + baslangic_tarihi + \
-                                 "&endDate=" + bitis_tarihi + "&td=" + yon
-                json = __make_requests(particular_url)
-                df_list.append(__pd.DataFrame(json["body"]["data"]))
-            df = __pd.concat(df_list)
-            df = df.rename(columns={"auctionCode": "İhale Numarası", "td": "Yön", "transferDatetime": "Transfer Zamanı",
-                                    "requestedCapacity": "Katılımcılar Tarafından Talep Edilen Kapasite(MW)",
-                                    "allocatedCapacity": "Tahsis Edilen Kapasite(MW)",
-                                    "clearancePrice": "Takas Fiyatı(EUR/MWh)",
-                                    "participantCount": "Katılımcı Sayısı",
-                                    "winnerCount": "Kazanan Katılımcı Sayısı",
-                                    "bidCount": "Teklif Sayısı"})
+                liste.extend(__uc_noktalar.kayitlar("iletim.kapasite_talepleri", baslangic_tarihi, bitis_tarihi, yon))
+            return __uc_noktalar.ayristir("iletim.kapasite_talepleri", liste)
         except (KeyError, TypeError):
             return __pd.DataFrame()
-        else:
-            return df[["Yön", "İhale Numarası", "Transfer Zamanı", "Katılımcılar Tarafından Talep Edilen Kapasite(MW)",
-                       "Tahsis Edilen Kapasite(MW)", "Takas Fiyatı(EUR/MWh)", "Katılımcı Sayısı",
-                       "Kazanan Katılımcı Sayısı", "Teklif Sayısı"]]
@@ -1 +1,15 @@
-from seffaflik.elektrik.piyasalar import dengesizlik, dgp, genel, gip, gop, ia, yanhizmetler
+import importlib as __importlib
+
+__alt_moduller = ("dengesizlik", "dgp", "genel", "gip", "gop", "ia", "yanhizmetler")
+__all__ = ["dengesizlik", "dgp", "genel", "gip", "gop", "ia", "yanhizmetler"]
+
+
+def __getattr__(ad):
+    # Alt modüller ilk erişildiklerinde yüklenir (PEP 562)
+    if ad in __alt_moduller:
+        return __importlib.import_module(__name__ + "." + ad)
+    raise AttributeError("module '" + __name__ + "' has no attribute '" + ad + "'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__alt_moduller))
@@ -1,13 +1,13 @@
 import pandas as __pd
 import datetime as __dt
-from multiprocessing import Pool as __Pool
-import multiprocessing as __mp
 from seffaflik.__ortak import __dogrulama
-from seffaflik.__ortak.__araclar import make_requests as __make_requests
-
-__first_part_url = "market/"
+from seffaflik.__ortak import __uc_noktalar
+from seffaflik.__ortak import __veri_tipi
+from seffaflik.__ortak import __pencere
+from seffaflik.__ortak import __yurutucu
 
 
+@__pencere.pencereli(gun=31)
 def dengesizlik(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                 bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -24,26 +24,10 @@ def dengesizlik(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Dengesizlik Miktarı ve Tutarı (MWh, TL)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "energy-imbalance-hourly" + "?startDate=" + baslangic_tarihi + \
-                             "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["energyImbalances"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"positiveImbalance": "Pozitif Dengesizlik Miktarı (MWh)",
-                                          "negativeImbalance": "Negatif Dengesizlik Miktarı (MWh)",
-                                          "positiveImbalanceIncome": "Pozitif Dengesizlik Tutarı (TL)",
-                                          "negativeImbalanceIncome": "Negatif Dengesizlik Tutarı (TL)"},
-                      inplace=True)
-            df = df[
-                ["Tarih", "Saat", "Pozitif Dengesizlik Miktarı (MWh)", "Negatif Dengesizlik Miktarı (MWh)",
-                 "Pozitif Dengesizlik Tutarı (TL)", "Negatif Dengesizlik Tutarı (TL)"]]
+        df = __uc_noktalar.cek("dengesizlik.dengesizlik", baslangic_tarihi, bitis_tarihi)
+        if len(df) > 0:
             df.dropna(subset=df.columns[2:], how="all", inplace=True)
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return df
 
 
 def dengeden_sorumlu_gruplar(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -61,19 +45,7 @@ def dengeden_sorumlu_gruplar(baslangic_tarihi=__dt.datetime.today().strftime("%Y
     Dengeden Sorumlu Gruplar
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "dsg-imbalance-quantity-orgaization-list" + "?startDate=" + \
-                             baslangic_tarihi + "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["orgList"])
-            df.rename(index=str, columns={"organizationId": "Id", "organizationName": "Adı",
-                                          "organizationStatus": "Durum", "organizationETSOCode": "EIC Kodu",
-                                          "organizationShortName": "Kısa Adı"},
-                      inplace=True)
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("dengesizlik.dengeden_sorumlu_gruplar", baslangic_tarihi, bitis_tarihi)
 
 
 def tum_dengeden_sorumlu_gruplar_dengesizlik(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -97,11 +69,10 @@ def tum_dengeden_sorumlu_gruplar_dengesizlik(baslangic_tarihi=__dt.datetime.toda
         list_organization = list(
             zip([baslangic_tarihi] * list_organization_len, [bitis_tarihi] * list_organization_len, list_organization))
         list_organization = list(map(list, list_organization))
-        with __Pool(__mp.cpu_count()) as p:
-            list_df_unit = p.starmap(__dengesizlik_dsg, list_organization, chunksize=1)
+        list_df_unit = __yurutucu.coklu_esle(__dengesizlik_dsg, list_organization)
         list_df_unit = list(filter(lambda x: len(x) > 0, list_df_unit))
         df_unit = __pd.concat(list_df_unit)
-        return df_unit.sort_values(["Tarih", "DST"])
+        return __veri_tipi.uygula(df_unit.sort_values(["Tarih", "DST"]))
 
 
 def __dengesizlik_dsg(baslangic_tarihi, bitis_tarihi, organization):
@@ -118,18 +89,7 @@ def __dengesizlik_dsg(baslangic_tarihi, bitis_tarihi, organization):
     -----------------
     DSG Dengesizlik Miktarı
     """
-    try:
-        particular_url = __first_part_url + "dsg-imbalance-quantity" + "?startDate=" + \
-                         baslangic_tarihi + "&endDate=" + bitis_tarihi + "&organizationId=" + \
-                         str(organization["Id"])
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["imbalanceQuantityList"])
-        df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-        df["DST"] = organization["Kısa Adı"]
-        df.rename(columns={"positiveImbalanceQuantity": "Pozitif Dengesizlik Miktarı (MWh)",
-                           "negativImbalanceQuantity": "Negatif Dengesizlik Miktarı (MWh)"}, inplace=True)
-        df = df[["Tarih", "DST", "Pozitif Dengesizlik Miktarı (MWh)", "Negatif Dengesizlik Miktarı (MWh)"]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    df = __uc_noktalar.cek("dengesizlik.dsg", baslangic_tarihi, bitis_tarihi, organization["Id"])
+    if len(df) > 0:
+        df.insert(loc=1, column="DST", value=organization["Kısa Adı"])
+    return df
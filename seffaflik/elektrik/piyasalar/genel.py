@@ -1,17 +1,16 @@
 import pandas as __pd
 import datetime as __dt
-from multiprocessing import Pool as __Pool
-import multiprocessing as __mp
 from dateutil import relativedelta as __rd
 from functools import reduce as __red
 import calendar as __calendar
 
-from seffaflik.__ortak.__araclar import make_requests as __make_requests
+from seffaflik.__ortak import __yurutucu
+from seffaflik.__ortak import __onbellek
 from seffaflik.elektrik.piyasalar import ia as __ia, gop as __gop, gip as __gip, dgp as __dgp
+from seffaflik.__ortak import __uc_noktalar
+from seffaflik.__ortak import __veri_tipi
 from seffaflik.__ortak import __dogrulama as __dogrulama
 
-__first_part_url = "market/"
-
 
 def katilimci_sayisi(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                      bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
@@ -35,11 +34,11 @@ def katilimci_sayisi(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")
         while ilk <= son:
             date_list.append(ilk.strftime("%Y-%m-%d"))
             ilk = ilk + __rd.relativedelta(months=+1)
-        with __Pool(__mp.cpu_count()) as p:
-            df_list = p.map(__katilimci_sayisi, date_list)
-        return __pd.concat(df_list, sort=False)
+        df_list = __yurutucu.esle(__katilimci_sayisi, date_list)
+        return __veri_tipi.uygula(__pd.concat(df_list, sort=False))
 
 
+@__onbellek.sureli("genel.piyasa_katilimcilari")
 def piyasa_katilimcilari():
     """
     Piyasa katılımcılarının GÖP, GİP, ve STP piyasalarına katılım durumunu belirtir. Ayrıca tüzel kişi olarak firmanın
@@ -52,18 +51,7 @@ def piyasa_katilimcilari():
     -----------------
     Organizasyonlar (Adı, GÖP Katılımı, GİP Katılımı, STP Katılımı, Tüzel Kişilik Durumu)
     """
-    try:
-        particular_url = __first_part_url + "market-participants"
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["marketParticipantList"])
-        df.rename(columns={"id": "Id", "orgName": "Adı", "damEntry": "GÖP Katılımı", "intraDayEntry": "GİP Katılımı",
-                           "naturalGasMarketEntry": "STP Katılımı", "legalStatus": "Tüzel Kişilik Durumu",
-                           "orgShortName": "Kısa Adı"}, inplace=True)
-        df = df[["Id", "Adı", "Kısa Adı", "GÖP Katılımı", "GİP Katılımı", "STP Katılımı", "Tüzel Kişilik Durumu"]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    return __uc_noktalar.cek("genel.piyasa_katilimcilari")
 
 
 def hacim(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -98,22 +86,7 @@ def hacim(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
             return df
         else:
             periods = {"gunluk": "DAILY", "aylik": "MONTHLY", "yillik": "YEAR"}
-            try:
-                particular_url = \
-                    __first_part_url + "market-volume" + "?startDate=" + baslangic_tarihi + "&endDate=" + \
-                    bitis_tarihi + "&period=" + periods[periyot.lower()]
-                json = __make_requests(particular_url)
-                df = __pd.DataFrame(json["body"]["marketVolumeList"])
-                df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-                df.rename(index=str,
-                          columns={"bilateralContractAmount": "İA Miktarı", "dayAheadMarketVolume": "GÖP Mİktarı",
-                                   "intradayVolume": "GİP Mİktarı", "balancedPowerMarketVolume": "DGP Miktarı"},
-                          inplace=True)
-                df = df[["Tarih", "İA Miktarı", "GÖP Mİktarı", "GİP Mİktarı", "DGP Miktarı"]]
-            except (KeyError, TypeError):
-                return __pd.DataFrame()
-            else:
-                return df
+            return __uc_noktalar.cek("genel.hacim", baslangic_tarihi, bitis_tarihi, periods[periyot.lower()])
 
 
 def fiyat(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -186,9 +159,7 @@ def __katilimci_sayisi(tarih):
     Katılımcı Sayısı
     """
     try:
-        particular_url = __first_part_url + "participant?period=" + tarih
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["participantList"])
+        df = __pd.DataFrame(__uc_noktalar.kayitlar("genel.katilimci_sayisi", tarih))
         columns = __pd.MultiIndex.from_product(
             [["Özel Sektör", "Kamu Kuruluşu"], list(df["licence"]) + ["Toplam"]], names=['', ''])
         df = __pd.DataFrame([list(df["privateSector"]) + list(
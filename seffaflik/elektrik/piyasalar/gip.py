@@ -1,12 +1,12 @@
 import pandas as __pd
 import datetime as __dt
 
-from seffaflik.__ortak.__araclar import make_requests as __make_requests
+from seffaflik.__ortak import __pencere
+from seffaflik.__ortak import __uc_noktalar
 from seffaflik.__ortak import __dogrulama as __dogrulama
 
-__first_part_url = "market/"
-
 
+@__pencere.pencereli(gun=31)
 def aof(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
         bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -22,21 +22,10 @@ def aof(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Saatlik Ağırlıklı Ortalama Fiyat (₺/MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "intra-day-aof" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["idmAofList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"price": "AOF"}, inplace=True)
-            df = df[["Tarih", "Saat", "AOF"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gip.aof", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def ozet(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
          bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), ):
     """
@@ -53,34 +42,10 @@ def ozet(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Min. Alış/Satış Fiyatları, Max. Alış/Satış Fiyatları, Min./Max. Eşleşme Fiyatları)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "intra-day-summary" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["intraDaySummaryList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"id": "Id", "contract": "Kontrat Adı",
-                               "quantityOfAsk": "Teklif Edilen Talep Miktarı",
-                               "quantityOfBid": "Teklif Edilen Arz Miktarı", "volume": "Eşleşme Miktarı",
-                               "tradingVolume": "İşlem Hacmi",
-                               "minAskPrice": "Min. Talep Fiyatı", "maxAskPrice": "Max. Talep Fiyatı",
-                               "minBidPrice": "Min. Arz Fiyatı", "maxBidPrice": "Max. Arz Fiyatı",
-                               "minMatchPrice": "Min. Eşleşme Fiyatı",
-                               "maxMatchPrice": "Max. Eşleşme Fiyatı"},
-                      inplace=True)
-            df = df[
-                ["Tarih", "Saat", "Id", "Kontrat Adı", "Teklif Edilen Talep Miktarı", "Teklif Edilen Arz Miktarı",
-                 "Eşleşme Miktarı", "İşlem Hacmi", "Min. Talep Fiyatı", "Max. Talep Fiyatı",
-                 "Min. Arz Fiyatı", "Max. Arz Fiyatı",
-                 "Min. Eşleşme Fiyatı", "Max. Eşleşme Fiyatı"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gip.ozet", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def hacim(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
           bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -96,26 +61,14 @@ def hacim(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     GİP Saatlik Hacim (MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "intra-day-volume" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["matchDetails"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"blockMatchQuantity": "Blok Eşleşme Miktarı",
-                               "hourlyMatchQuantity": "Saatlik Eşleşme Miktarı"},
-                      inplace=True)
+        df = __uc_noktalar.cek("gip.hacim", baslangic_tarihi, bitis_tarihi)
+        if len(df) > 0:
             df.fillna(0.0, inplace=True)
             df["Eşleşme Miktarı"] = df["Blok Eşleşme Miktarı"] + df["Saatlik Eşleşme Miktarı"]
-            df = df[["Tarih", "Saat", "Blok Eşleşme Miktarı", "Saatlik Eşleşme Miktarı", "Eşleşme Miktarı"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return df
 
 
+@__pencere.pencereli(gun=31)
 def islem_hacmi(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                 bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -131,21 +84,10 @@ def islem_hacmi(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Arz/Talep İşlem Hacmi (₺)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "intra-day-income" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["incomes"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"income": "İşlem Hacmi"}, inplace=True)
-            df = df[["Tarih", "Saat", "İşlem Hacmi"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gip.islem_hacmi", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=1)
 def islem_akisi(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                 bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -161,23 +103,29 @@ def islem_akisi(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     İşlem Akışları (Tarih, Saat, Id, Kontrat Adı, Fiyat, Miktar)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "intra-day-trade-history" + "?startDate=" + \
-                             baslangic_tarihi + "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["intraDayTradeHistoryList"])
-            df["Saat"] = __pd.to_timedelta(df["date"].apply(lambda d: d[11:18]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"id": "Id", "conract": "Kontrat Adı", "price": "Fiyat", "quantity": "Miktar"},
-                      inplace=True)
-            df = df[["Tarih", "Saat", "Id", "Kontrat Adı", "Fiyat", "Miktar"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gip.islem_akisi", baslangic_tarihi, bitis_tarihi)
+
 
+def islem_akisi_iter(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
+                     bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), pencere="1D"):
+    """
+    İlgili tarih aralığı için gün içi piyasası işlem akış bilgilerini tüm aralığı tek seferde belleğe almadan pencere
+    pencere vermektedir. Her pencerenin sonucu çekilir çekilmez verilir; bir sonraki pencere arka planda çekilir.
 
+    Parametreler
+    ------------
+    baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi (Varsayılan: bugün)
+    bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi (Varsayılan: bugün)
+    pencere          : gün ("1D"), hafta ("1W") yada ay ("1M") cinsinden pencere uzunluğu (Varsayılan: "1D")
+
+    Geri Dönüş Değeri
+    -----------------
+    İşlem Akışları (Tarih, Saat, Id, Kontrat Adı, Fiyat, Miktar) (generator of DataFrame)
+    """
+    return __pencere.parcali(islem_akisi, baslangic_tarihi, bitis_tarihi, pencere)
+
+
+@__pencere.pencereli(gun=31)
 def teklif_edilen_miktarlar(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                             bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -194,26 +142,10 @@ def teklif_edilen_miktarlar(baslangic_tarihi=__dt.datetime.today().strftime("%Y-
     GİP Teklif Edilen Saatlik/Blok Talep/Arz Miktarları
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "intra-day-quantity" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["offerQuantities"])
-            df["Saat"] = df["effectiveDate"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["effectiveDate"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"blockPurchaseQuantity": "Blok Talep Miktarı",
-                                          "blockSaleQuantity": "Blok Arz Miktarı",
-                                          "hourlyPurchaseQuantity": "Saatlik Talep Miktarı",
-                                          "hourlySaleQuantity": "Saatlik Arz Miktarı"},
-                      inplace=True)
-            df = df[["Tarih", "Saat", "Saatlik Talep Miktarı", "Blok Talep Miktarı",
-                     "Saatlik Arz Miktarı", "Blok Arz Miktarı"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gip.teklif_edilen_miktarlar", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def min_max_fiyatlar(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                      bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), teklif_tipi="SAATLIK"):
     """
@@ -231,23 +163,8 @@ def min_max_fiyatlar(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")
     GİP Teklif Edilen ve Eşleşen Tekliflerin Min./Max. Fiyat Değerleri (₺/MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            bid_types = {"saatlik": "HOURLY", "blok": "BLOCK"}
-            particular_url = \
-                __first_part_url + "intra-day-min-max-price" + "?startDate=" + baslangic_tarihi + "&endDate=" \
-                + bitis_tarihi + "&offerType=" + bid_types[teklif_tipi.lower()]
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["minMaxPriceList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"minAskPrice": "Min. Alış Fiyatı", "maxAskPrice": "Max. Alış Fiyatı",
-                                          "minBidPrice": "Min. Satış Fiyatı", "maxBidPrice": "Max. Satış Fiyatı",
-                                          "minMatchPrice": "Min. Eşleşme Fiyatı",
-                                          "maxMatchPrice": "Max. Eşleşme Fiyatı"},
-                      inplace=True)
-            df = df[["Tarih", "Saat", "Min. Alış Fiyatı", "Max. Alış Fiyatı", "Min. Satış Fiyatı",
-                     "Max. Satış Fiyatı", "Min. Eşleşme Fiyatı", "Max. Eşleşme Fiyatı"]]
-        except (KeyError, TypeError):
+        bid_types = {"saatlik": "HOURLY", "blok": "BLOCK"}
+        if teklif_tipi.lower() not in bid_types:
             return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gip.min_max_fiyatlar", baslangic_tarihi, bitis_tarihi,
+                                 bid_types[teklif_tipi.lower()])
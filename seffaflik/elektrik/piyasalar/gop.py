@@ -1,17 +1,17 @@
-import pandas as __pd
 import datetime as __dt
-from multiprocessing import Pool as __Pool
-import multiprocessing as __mp
-from functools import reduce as __red
 import logging as __logging
 
-from seffaflik.__ortak.__araclar import make_requests as __make_requests
+from seffaflik.__ortak.__araclar import birim_tablosu as __birim_tablosu
+from seffaflik.__ortak import __yurutucu
+from seffaflik.__ortak import __onbellek
+from seffaflik.__ortak import __pencere
+from seffaflik.__ortak import __uc_noktalar
 from seffaflik.__ortak import __dogrulama as __dogrulama
 from seffaflik.elektrik.uretim import organizasyonlar as __organizasyonlar
 
-__first_part_url = "market/"
-
 
+@__onbellek.gunluk(kesinlesme=1)
+@__pencere.pencereli(gun=31)
 def ptf(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
         bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -27,22 +27,10 @@ def ptf(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Saatlik PTF (₺/MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "day-ahead-mcp" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["dayAheadMCPList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"price": "PTF", "priceEur": "PTF (EUR/MWh)", "priceUsd": "PTF (USD/MWh)"},
-                      inplace=True)
-            df = df[["Tarih", "Saat", "PTF", "PTF (EUR/MWh)", "PTF (USD/MWh)"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gop.ptf", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def hacim(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
           bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), organizasyon_eic=""):
     """
@@ -64,37 +52,13 @@ def hacim(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Arz/Talep Saatlik GÖP Hacmi (MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_eic_dogrulama(baslangic_tarihi, bitis_tarihi, organizasyon_eic):
-        try:
-            particular_url = \
-                __first_part_url + "day-ahead-market-volume" + "?startDate=" + baslangic_tarihi + "&endDate=" + \
-                bitis_tarihi + "&eic=" + organizasyon_eic
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["dayAheadMarketVolumeList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"matchedBids": "Talep Eşleşme Miktarı", "matchedOffers": "Arz Eşleşme Miktarı",
-                               "volume": "Eşleşme Miktarı", "blockBid": "Arz Blok Teklif Eşleşme Miktarı",
-                               "blockOffer": "Talep Blok Teklif Eşleşme Miktarı",
-                               "priceIndependentBid": "Fiyattan Bağımsız Talep Miktarı",
-                               "priceIndependentOffer": "Fiyattan Bağımsız Arz Miktarı",
-                               "quantityOfAsk": "Maksimum Talep Miktarı",
-                               "quantityOfBid": "Maksimum Arz Miktarı"},
-                      inplace=True)
-            if organizasyon_eic == "":
-                df = df[["Tarih", "Saat", "Talep Eşleşme Miktarı", "Eşleşme Miktarı", "Arz Eşleşme Miktarı",
-                         "Fiyattan Bağımsız Talep Miktarı", "Fiyattan Bağımsız Arz Miktarı",
-                         "Maksimum Talep Miktarı", "Maksimum Arz Miktarı"]]
-            else:
-                df = df[["Tarih", "Saat", "Talep Eşleşme Miktarı", "Arz Eşleşme Miktarı"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        if organizasyon_eic == "":
+            return __uc_noktalar.cek("gop.hacim", baslangic_tarihi, bitis_tarihi, organizasyon_eic)
+        return __uc_noktalar.cek("gop.organizasyon_hacim", baslangic_tarihi, bitis_tarihi, organizasyon_eic)
 
 
 def tum_organizasyonlar_hacim(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
-                              bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), hacim_tipi="NET"):
+                              bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), hacim_tipi="NET", bicim="genis"):
     """
     İlgili tarih aralığı için tüm organizasyonların saatlik net hacim bilgilerini vermektedir.
 
@@ -103,34 +67,32 @@ def tum_organizasyonlar_hacim(baslangic_tarihi=__dt.datetime.today().strftime("%
     baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi (Varsayılan: bugün)
     bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi (Varsayılan: bugün)
     hacim_tipi       : metin formatında hacim tipi ("NET", "ARZ", yada "TALEP") (varsayılan: "NET")
+    bicim            : "genis", "uzun" yada "seyrek" sonuç biçimi (Varsayılan: "genis")
 
     Geri Dönüş Değeri
     -----------------
     Tüm Organizasyonların Saatlik GÖP Hacmi (Tarih, Saat, Hacim)
     """
-    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
+    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi) and \
+            __dogrulama.__bicim_dogrulama(bicim):
         org = __organizasyonlar()
         list_org = org[["EIC Kodu", "Kısa Adı"]].to_dict("records")
         org_len = len(list_org)
         list_date_org_eic = list(zip([baslangic_tarihi] * org_len, [bitis_tarihi] * org_len, list_org))
         list_date_org_eic = list(map(list, list_date_org_eic))
-        with __Pool(__mp.cpu_count()) as p:
-            if hacim_tipi.lower() == "net":
-                list_df_unit = p.starmap(__organizasyonel_net_hacim, list_date_org_eic, chunksize=1)
-            elif hacim_tipi.lower() == "arz":
-                list_df_unit = p.starmap(__organizasyonel_arz_hacim, list_date_org_eic, chunksize=1)
-            elif hacim_tipi.lower() == "talep":
-                list_df_unit = p.starmap(__organizasyonel_talep_hacim, list_date_org_eic, chunksize=1)
-            else:
-                __logging.error("Lütfen geçerli bir hacim tipi giriniz: Net, Arz, Talep", exc_info=False)
-        list_df_unit = list(filter(lambda x: len(x) > 0, list_df_unit))
-        df_unit = __red(lambda left, right: __pd.merge(left, right, how="outer", on=["Tarih", "Saat"], sort=True),
-                        list_df_unit)
-        return df_unit
+        if hacim_tipi.lower() == "net":
+            list_df_unit = __yurutucu.coklu_esle(__organizasyonel_net_hacim, list_date_org_eic)
+        elif hacim_tipi.lower() == "arz":
+            list_df_unit = __yurutucu.coklu_esle(__organizasyonel_arz_hacim, list_date_org_eic)
+        elif hacim_tipi.lower() == "talep":
+            list_df_unit = __yurutucu.coklu_esle(__organizasyonel_talep_hacim, list_date_org_eic)
+        else:
+            __logging.error("Lütfen geçerli bir hacim tipi giriniz: Net, Arz, Talep", exc_info=False)
+        return __birim_tablosu(list_df_unit, bicim=bicim)
 
 
 def tum_gorevli_tedarik_hacim(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
-                              bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), hacim_tipi="NET"):
+                              bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), hacim_tipi="NET", bicim="genis"):
     """
     İlgili tarih aralığı için tüm görevli tedarik şirketleri için saatlik net hacim bilgilerini vermektedir.
 
@@ -139,12 +101,14 @@ def tum_gorevli_tedarik_hacim(baslangic_tarihi=__dt.datetime.today().strftime("%
     baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi (Varsayılan: bugün)
     bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi (Varsayılan: bugün)
     hacim_tipi       : metin formatında hacim tipi ("NET", "ARZ", yada "TALEP") (varsayılan: "NET")
+    bicim            : "genis", "uzun" yada "seyrek" sonuç biçimi (Varsayılan: "genis")
 
     Geri Dönüş Değeri
     -----------------
     Tüm Organizasyonların Saatlik GÖP Hacmi (Tarih, Saat, Hacim)
     """
-    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
+    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi) and \
+            __dogrulama.__bicim_dogrulama(bicim):
         org = __organizasyonlar()
         org = org[(org["Adı"].str.contains("K1")) | (org["Adı"].str.contains("K2")) | (
             org["Adı"].str.contains("K3"))].reset_index(drop=True)
@@ -152,19 +116,15 @@ def tum_gorevli_tedarik_hacim(baslangic_tarihi=__dt.datetime.today().strftime("%
         org_len = len(list_org)
         list_date_org_eic = list(zip([baslangic_tarihi] * org_len, [bitis_tarihi] * org_len, list_org))
         list_date_org_eic = list(map(list, list_date_org_eic))
-        with __Pool(__mp.cpu_count()) as p:
-            if hacim_tipi.lower() == "net":
-                list_df_unit = p.starmap(__organizasyonel_net_hacim, list_date_org_eic, chunksize=1)
-            elif hacim_tipi.lower() == "arz":
-                list_df_unit = p.starmap(__organizasyonel_arz_hacim, list_date_org_eic, chunksize=1)
-            elif hacim_tipi.lower() == "talep":
-                list_df_unit = p.starmap(__organizasyonel_talep_hacim, list_date_org_eic, chunksize=1)
-            else:
-                __logging.error("Lütfen geçerli bir hacim tipi giriniz: Net, Arz, Talep", exc_info=False)
-        list_df_unit = list(filter(lambda x: len(x) > 0, list_df_unit))
-        df_unit = __red(lambda left, right: __pd.merge(left, right, how="outer", on=["Tarih", "Saat"], sort=True),
-                        list_df_unit)
-        return df_unit
+        if hacim_tipi.lower() == "net":
+            list_df_unit = __yurutucu.coklu_esle(__organizasyonel_net_hacim, list_date_org_eic)
+        elif hacim_tipi.lower() == "arz":
+            list_df_unit = __yurutucu.coklu_esle(__organizasyonel_arz_hacim, list_date_org_eic)
+        elif hacim_tipi.lower() == "talep":
+            list_df_unit = __yurutucu.coklu_esle(__organizasyonel_talep_hacim, list_date_org_eic)
+        else:
+            __logging.error("Lütfen geçerli bir hacim tipi giriniz: Net, Arz, Talep", exc_info=False)
+        return __birim_tablosu(list_df_unit, bicim=bicim)
 
 
 def arz_talep_egrisi(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
@@ -181,20 +141,10 @@ def arz_talep_egrisi(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
     Arz-Talep Eğrisi Fiyat ve Alış/Satış Miktarı (₺/MWh, MWh)
     """
     if __dogrulama.__tarih_dogrulama(tarih):
-        try:
-            particular_url = \
-                __first_part_url + "supply-demand-curve" + "?period=" + tarih
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["supplyDemandCurves"])
-            df["Saat"] = df["date"].apply(lambda x: int(x[11:13]))
-            df.rename(index=str, columns={"demand": "Talep", "supply": "Arz", "price": "Fiyat"}, inplace=True)
-            df = df[["Saat", "Talep", "Fiyat", "Arz"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gop.arz_talep_egrisi", tarih)
 
 
+@__pencere.pencereli(gun=31)
 def islem_hacmi(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                 bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -213,24 +163,10 @@ def islem_hacmi(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Arz/Talep İşlem Hacmi (₺)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "day-ahead-market-trade-volume" + "?startDate=" + baslangic_tarihi + "&endDate=" + \
-                bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["dayAheadMarketTradeVolumeList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"volumeOfBid": "Talep İşlem Hacmi", "volumeOfAsk": "Arz İşlem Hacmi"},
-                      inplace=True)
-            df = df[["Tarih", "Saat", "Talep İşlem Hacmi", "Arz İşlem Hacmi"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gop.islem_hacmi", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def blok_miktari(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                  bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -247,27 +183,10 @@ def blok_miktari(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Teklif Edilen ve Eşleşen Blok Teklif Miktarları (MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "amount-of-block" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["amountOfBlockList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"amountOfPurchasingTowardsBlock": "Talep Blok Teklif Miktarı",
-                               "amountOfPurchasingTowardsMatchBlock": "Eşleşen Talep Blok Teklif Miktarı",
-                               "amountOfSalesTowardsBlock": "Arz Blok Teklif Miktarı",
-                               "amountOfSalesTowardsMatchBlock": "Eşleşen Arz Blok Teklif Miktarı"},
-                      inplace=True)
-            df = df[["Tarih", "Saat", "Talep Blok Teklif Miktarı", "Eşleşen Talep Blok Teklif Miktarı",
-                     "Arz Blok Teklif Miktarı", "Eşleşen Arz Blok Teklif Miktarı"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gop.blok_miktari", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def esnek_eslesme_miktari(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                           bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -284,24 +203,10 @@ def esnek_eslesme_miktari(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m
     Saatlik Eşleşen Esnek Teklif Miktarları (MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "flexible-offer-amount-hourly" + "?startDate=" + baslangic_tarihi + \
-                             "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["getDamFlexibleOffer"])
-            df["Saat"] = df["day"].apply(__pd.to_datetime).dt.hour
-            df["Tarih"] = df["day"].apply(__pd.to_datetime).dt.date.apply(str)
-            df.rename(index=str,
-                      columns={"matchedBuyingFlexibleOfferQuantity": "Esnek Alış Teklif Eşleşme Miktarı",
-                               "matchedSellingFlexibleOfferQuantity": "Esnek Satış Teklif Eşleşme Miktarı"},
-                      inplace=True)
-            df = df[["Tarih", "Saat", "Esnek Alış Teklif Eşleşme Miktarı", "Esnek Satış Teklif Eşleşme Miktarı"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gop.esnek_eslesme_miktari", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def esnek_miktari(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                   bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -318,28 +223,10 @@ def esnek_miktari(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Günlük Teklif Edilen ve Eşleşen Esnek Teklif Miktarları (MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "flexible-offer-amount" + "?startDate=" + baslangic_tarihi + \
-                             "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["getDamFlexibleOffer"])
-            df["Tarih"] = df["day"].apply(__pd.to_datetime).dt.date.apply(str)
-            df.rename(index=str,
-                      columns={"totalBuyingFlexibleOfferQuantity": "Toplam Esnek Alış Teklif Miktarı",
-                               "matchedBuyingFlexibleOfferQuantity": "Esnek Alış Teklif Eşleşme Miktarı",
-                               "unmatchedBuyingFlexibleOfferQuantity": "Eşleşmeyen Esnek Alış Teklif Miktarı",
-                               "totalSellingFlexibleOfferQuantity": "Toplam Esnek Satış Teklif Miktarı",
-                               "matchedSellingFlexibleOfferQuantity": "Esnek Satış Teklif Eşleşme Miktarı",
-                               "unmatchedSellingFlexibleOfferQuantity": "Eşleşmeyen Esnek Satış Teklif Miktarı"},
-                      inplace=True)
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df[["Tarih", "Toplam Esnek Alış Teklif Miktarı", "Esnek Alış Teklif Eşleşme Miktarı",
-                       "Eşleşmeyen Esnek Alış Teklif Miktarı", "Toplam Esnek Satış Teklif Miktarı",
-                       "Esnek Satış Teklif Eşleşme Miktarı", "Eşleşmeyen Esnek Satış Teklif Miktarı"]]
+        return __uc_noktalar.cek("gop.esnek_miktari", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def fark_tutari(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                 bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -356,21 +243,7 @@ def fark_tutari(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Arz, Talep, Yuvarlama Kaynaklı Fark Tutarı (₺)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "day-ahead-diff-funds" + \
-                             "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["diffFundList"])
-            df["date"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"originatingFromBids": "Talep",
-                                          "originatingFromOffers": "Arz",
-                                          "originatingFromRounding": "Yuvarlama",
-                                          "date": "Tarih", "total": "Toplam"}, inplace=True)
-            df = df[["Tarih", "Talep", "Arz", "Yuvarlama", "Toplam"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gop.fark_tutari", baslangic_tarihi, bitis_tarihi)
 
 
 def kptf(tarih=(__dt.datetime.today() + __dt.timedelta(days=1)).strftime("%Y-%m-%d")):
@@ -386,17 +259,7 @@ def kptf(tarih=(__dt.datetime.today() + __dt.timedelta(days=1)).strftime("%Y-%m-
     Kesinleşmemiş Piyasa Takas Fiyatı (₺/MWh)
     """
     if __dogrulama.__tarih_dogrulama(tarih):
-        try:
-            particular_url = __first_part_url + "day-ahead-interim-mcp" + "?period=" + tarih
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["interimMCPList"])
-            df["Saat"] = df["date"].apply(lambda x: int(x[11:13]))
-            df.rename(index=str, columns={"marketTradePrice": "KPTF"}, inplace=True)
-            df = df[["Saat", "KPTF"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("gop.kptf", tarih)
 
 
 def __organizasyonel_net_hacim(baslangic_tarihi, bitis_tarihi, org):
@@ -413,22 +276,11 @@ def __organizasyonel_net_hacim(baslangic_tarihi, bitis_tarihi, org):
     -----------------
     Organizasyonel Net Eşleşme Miktarı (MWh)
     """
-    try:
-        particular_url = __first_part_url + "day-ahead-market-volume" + "?startDate=" + baslangic_tarihi + \
-                         "&endDate=" + bitis_tarihi + "&eic=" + org["EIC Kodu"]
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["dayAheadMarketVolumeList"])
-        df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-        df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-        df.rename(index=str,
-                  columns={"matchedBids": "Talep Eşleşme Miktarı", "matchedOffers": "Arz Eşleşme Miktarı"},
-                  inplace=True)
+    df = __uc_noktalar.cek("gop.organizasyon_hacim", baslangic_tarihi, bitis_tarihi, org["EIC Kodu"])
+    if len(df) > 0:
         df[org["Kısa Adı"]] = df["Talep Eşleşme Miktarı"] - df["Arz Eşleşme Miktarı"]
         df = df[["Tarih", "Saat", org["Kısa Adı"]]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    return df
 
 
 def __organizasyonel_arz_hacim(baslangic_tarihi, bitis_tarihi, org):
@@ -445,23 +297,10 @@ def __organizasyonel_arz_hacim(baslangic_tarihi, bitis_tarihi, org):
     -----------------
     Organizasyonel Arz Eşleşme Miktarı (MWh)
     """
-    try:
-        particular_url = __first_part_url + "day-ahead-market-volume" + "?startDate=" + baslangic_tarihi + \
-                         "&endDate=" + bitis_tarihi + "&eic=" + org["EIC Kodu"]
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["dayAheadMarketVolumeList"])
-        df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-        df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-        df.drop("date", axis=1, inplace=True)
-        df.rename(index=str,
-                  columns={"matchedOffers": "Arz Eşleşme Miktarı"},
-                  inplace=True)
-        df[org["Kısa Adı"]] = df["Arz Eşleşme Miktarı"]
-        df = df[["Tarih", "Saat", org["Kısa Adı"]]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    df = __uc_noktalar.cek("gop.organizasyon_hacim", baslangic_tarihi, bitis_tarihi, org["EIC Kodu"])
+    if len(df) > 0:
+        df = df.rename(columns={"Arz Eşleşme Miktarı": org["Kısa Adı"]})[["Tarih", "Saat", org["Kısa Adı"]]]
+    return df
 
 
 def __organizasyonel_talep_hacim(baslangic_tarihi, bitis_tarihi, org):
@@ -478,19 +317,7 @@ def __organizasyonel_talep_hacim(baslangic_tarihi, bitis_tarihi, org):
     -----------------
     Organizasyonel Talep Eşleşme Miktarı (MWh)
     """
-    try:
-        particular_url = __first_part_url + "day-ahead-market-volume" + "?startDate=" + baslangic_tarihi + \
-                         "&endDate=" + bitis_tarihi + "&eic=" + org["EIC Kodu"]
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["dayAheadMarketVolumeList"])
-        df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-        df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-        df.rename(index=str,
-                  columns={"matchedBids": "Talep Eşleşme Miktarı"},
-                  inplace=True)
-        df[org["Kısa Adı"]] = df["Talep Eşleşme Miktarı"]
-        df = df[["Tarih", "Saat", org["Kısa Adı"]]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    df = __uc_noktalar.cek("gop.organizasyon_hacim", baslangic_tarihi, bitis_tarihi, org["EIC Kodu"])
+    if len(df) > 0:
+        df = df.rename(columns={"Talep Eşleşme Miktarı": org["Kısa Adı"]})[["Tarih", "Saat", org["Kısa Adı"]]]
+    return df
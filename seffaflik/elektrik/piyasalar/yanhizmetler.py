@@ -1,11 +1,10 @@
 import pandas as __pd
 import datetime as __dt
-from seffaflik.__ortak.__araclar import make_requests as __make_requests
+from seffaflik.__ortak import __pencere
+from seffaflik.__ortak import __uc_noktalar
 from seffaflik.__ortak import __dogrulama as __dogrulama
 from functools import reduce as __red
 
-__first_part_url = "market/"
-
 
 def primer_sekonder_fiyat_miktar(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                                  bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
@@ -35,6 +34,7 @@ def primer_sekonder_fiyat_miktar(baslangic_tarihi=__dt.datetime.today().strftime
             return df
 
 
+@__pencere.pencereli(gun=31)
 def primer_frekans_rezerv_miktari(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                                   bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -50,21 +50,10 @@ def primer_frekans_rezerv_miktari(baslangic_tarihi=__dt.datetime.today().strftim
     PFK Yükümlülük (MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "pfc-amount" + "?startDate=" + baslangic_tarihi + "&endDate=" + \
-                             bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["frequencyReservePriceList"])
-            df["Saat"] = df["effectiveDate"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["effectiveDate"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"totalAmount": "PFK Yükümlülük (MWh)"}, inplace=True)
-            df = df[["Tarih", "Saat", "PFK Yükümlülük (MWh)"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("yanhizmetler.primer_frekans_rezerv_miktari", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def sekonder_frekans_rezerv_miktari(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                                     bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -80,21 +69,10 @@ def sekonder_frekans_rezerv_miktari(baslangic_tarihi=__dt.datetime.today().strft
     SFK Yükümlülük (MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "sfc-amount" + "?startDate=" + baslangic_tarihi + "&endDate=" + \
-                             bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["frequencyReservePriceList"])
-            df["Saat"] = df["effectiveDate"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["effectiveDate"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"totalAmount": "SFK Yükümlülük (MWh)"}, inplace=True)
-            df = df[["Tarih", "Saat", "SFK Yükümlülük (MWh)"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("yanhizmetler.sekonder_frekans_rezerv_miktari", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def primer_rezerv_fiyati(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                          bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -110,21 +88,10 @@ def primer_rezerv_fiyati(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-
     PFK Fiyat (TL/MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "pfc-price" + "?startDate=" + baslangic_tarihi + "&endDate=" + \
-                             bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["frequencyReservePriceList"])
-            df["Saat"] = df["effectiveDate"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["effectiveDate"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"price": "PFK Fiyat (TL/MWh)"}, inplace=True)
-            df = df[["Tarih", "Saat", "PFK Fiyat (TL/MWh)"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("yanhizmetler.primer_rezerv_fiyati", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def sekonder_rezerv_fiyati(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                            bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -140,16 +107,4 @@ def sekonder_rezerv_fiyati(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%
     SFK Fiyat (TL/MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "sfc-price" + "?startDate=" + baslangic_tarihi + "&endDate=" + \
-                             bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["frequencyReservePriceList"])
-            df["Saat"] = df["effectiveDate"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["effectiveDate"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"price": "SFK Fiyat (TL/MWh)"}, inplace=True)
-            df = df[["Tarih", "Saat", "SFK Fiyat (TL/MWh)"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("yanhizmetler.sekonder_rezerv_fiyati", baslangic_tarihi, bitis_tarihi)
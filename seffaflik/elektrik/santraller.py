@@ -1,18 +1,18 @@
 import pandas as __pd
 import datetime as __dt
 from dateutil import relativedelta as __rd
-from multiprocessing import Pool as __Pool
-import multiprocessing as __mp
-import requests as __requests
-from bs4 import BeautifulSoup as __BeautifulSoup
 
-from seffaflik.__ortak.__araclar import make_requests as __make_requests
+from seffaflik.__ortak import __onbellek
+from seffaflik.__ortak import __pencere
+from seffaflik.__ortak import __yurutucu
+from seffaflik.__ortak import __oturum
+from seffaflik.__ortak import __uc_noktalar
+from seffaflik.__ortak import __veri_tipi
 from seffaflik.__ortak import __dogrulama as __dogrulama
 from seffaflik.__ortak.__dogrulama import __bugunden_kucuk_tarih_dogrulama
 
-__first_part_url = "production/"
-
 
+@__onbellek.sureli("santraller.santraller")
 def santraller(tarih=__dt.datetime.now().strftime("%Y-%m-%d")):
     """
     İlgili tarihte EPİAŞ sistemine kayıtlı santrallerin bilgilerini vermektedir.
@@ -26,17 +26,7 @@ def santraller(tarih=__dt.datetime.now().strftime("%Y-%m-%d")):
     Santral Bilgileri(Id, Adı, EIC Kodu, Kısa Adı)
     """
     if __dogrulama.__tarih_dogrulama(tarih):
-        try:
-            particular_url = __first_part_url + "power-plant?period=" + tarih
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["powerPlantList"])
-            df.rename(index=str, columns={"id": "Id", "name": "Adı", "eic": "EIC Kodu",
-                                          "shortName": "Kısa Adı"}, inplace=True)
-            df = df[["Id", "Adı", "EIC Kodu", "Kısa Adı"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("santraller.santraller", tarih)
 
 
 def santral_veris_cekis_birimleri(tarih=__dt.datetime.today().strftime("%Y-%m-%d"), santral_id=""):
@@ -53,18 +43,8 @@ def santral_veris_cekis_birimleri(tarih=__dt.datetime.today().strftime("%Y-%m-%d
     -----------------
     İlgili  UEVÇB Bilgileri(Id, Adı, EIC Kodu)
     """
-
     if __dogrulama.__tarih_id_dogrulama(tarih, santral_id):
-        try:
-            particular_url = __first_part_url + "uevcb?period=" + tarih + "&powerPlantId=" + str(santral_id)
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["uevcbList"])
-            df.rename(index=str, columns={"id": "Id", "name": "Adı", "eic": "EIC Kodu"}, inplace=True)
-            df = df[["Id", "Adı", "EIC Kodu"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("santraller.santral_veris_cekis_birimleri", tarih, santral_id)
 
 
 def tum_santraller_veris_cekis_birimleri(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
@@ -86,11 +66,11 @@ def tum_santraller_veris_cekis_birimleri(tarih=__dt.datetime.today().strftime("%
         santral_len = len(list_santral)
         list_date_santral_id = list(zip([tarih] * santral_len, list_santral))
         list_date_santral_id = list(map(list, list_date_santral_id))
-        with __Pool(__mp.cpu_count()) as p:
-            list_df_unit = p.starmap(__santral_veris_cekis_birimleri, list_date_santral_id, chunksize=1)
-        return __pd.concat(list_df_unit).reset_index(drop=True)
+        list_df_unit = __yurutucu.coklu_esle(__santral_veris_cekis_birimleri, list_date_santral_id)
+        return __veri_tipi.uygula(__pd.concat(list_df_unit).reset_index(drop=True))
 
 
+@__onbellek.sureli("santraller.gercek_zamanli_uretim_yapan_santraller")
 def gercek_zamanli_uretim_yapan_santraller():
     """
     İsteğin yapıldığı tarihte gerçek zamanlı üretim yapan UEVÇB bazında santral bilgilerini vermektedir.
@@ -102,17 +82,7 @@ def gercek_zamanli_uretim_yapan_santraller():
     -----------------
     Santral Bilgileri(Id, Adı, EIC Kodu, Kısa Adı)
     """
-    try:
-        particular_url = __first_part_url + "real-time-generation-power-plant-list"
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["powerPlantList"])
-        df.rename(index=str, columns={"id": "Id", "name": "Adı", "eic": "EIC Kodu",
-                                      "shortName": "Kısa Adı"}, inplace=True)
-        df = df[["Id", "Adı", "EIC Kodu", "Kısa Adı"]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    return __uc_noktalar.cek("santraller.gercek_zamanli_uretim_yapan_santraller")
 
 
 def kurulu_guc(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -137,9 +107,8 @@ def kurulu_guc(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
         while ilk <= son:
             date_list.append(ilk.strftime("%Y-%m-%d"))
             ilk = ilk + __rd.relativedelta(months=+1)
-        with __Pool(__mp.cpu_count()) as p:
-            df_list = p.map(__kurulu_guc, date_list)
-        return __pd.concat(df_list, sort=False)
+        df_list = __yurutucu.esle(__kurulu_guc, date_list)
+        return __veri_tipi.uygula(__pd.concat(df_list, sort=False))
 
 
 def kurulu_guc_kaynak_bazli(baslangic_tarihi=(__dt.datetime.today() - __dt.timedelta(days=1)).strftime("%Y-%m-%d"),
@@ -171,8 +140,7 @@ def kurulu_guc_kaynak_bazli(baslangic_tarihi=(__dt.datetime.today() - __dt.timed
         while ilk <= son and ilk.date() < __dt.datetime.today().date():
             date_list.append(ilk.strftime("%Y-%m-%d"))
             ilk = ilk + __rd.relativedelta(months=months, years=years, days=days)
-        with __Pool(__mp.cpu_count()) as p:
-            df_list = p.map(__ytbs_kurulu_guc, date_list)
+        df_list = __yurutucu.esle(__ytbs_kurulu_guc, date_list)
         df = __pd.concat(df_list, sort=False)
         if detay:
             return df.pivot(index="Tarih", values="Miktar", columns=["Kaynak", "KURULUŞ"])
@@ -181,6 +149,7 @@ def kurulu_guc_kaynak_bazli(baslangic_tarihi=(__dt.datetime.today() - __dt.timed
             return df.pivot(index="Tarih", columns="Kaynak", values="Miktar").reset_index()
 
 
+@__pencere.pencereli(gun=31)
 def ariza_bakim_bildirimleri(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                              bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -198,30 +167,7 @@ def ariza_bakim_bildirimleri(baslangic_tarihi=__dt.datetime.today().strftime("%Y
                  Gerekçe Tipi)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "urgent-market-message" + "?startDate=" + baslangic_tarihi + \
-                             "&endDate=" + bitis_tarihi + "&regionId=1"
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["urgentMarketMessageList"])
-            df["caseAddDate"] = __pd.to_datetime(df["caseAddDate"])
-            df["caseStartDate"] = __pd.to_datetime(df["caseStartDate"])
-            df["caseEndDate"] = __pd.to_datetime(df["caseEndDate"])
-            df["Gerekçe Tipi"] = df["messageType"].map({0: "Arıza", 2: "Bakım"})
-            df.rename(index=str,
-                      columns={"capacityAtCaseTime": "Olay Sırasında Kapasite",
-                               "powerPlantName": "Santral Adı", "city": "Şehir",
-                               "operatorPower": "İşletmedeki Kurulu Güç", "uevcbName": "UEVCB Adı",
-                               "reason": "Gerekçe", "caseStartDate": "Olay Balangıç Tarihi",
-                               "caseEndDate": "Olay Bitiş Tarihi", "caseAddDate": "Olay Bildirim Tarihi",
-                               "fuelType": "Yakıt Tipi"}, inplace=True)
-            df = df[
-                ["Olay Bildirim Tarihi", "Santral Adı", "UEVCB Adı", "Şehir", "Olay Balangıç Tarihi",
-                 "Olay Bitiş Tarihi", "İşletmedeki Kurulu Güç", "Olay Sırasında Kapasite", "Yakıt Tipi", "Gerekçe",
-                 "Gerekçe Tipi"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("santraller.ariza_bakim_bildirimleri", baslangic_tarihi, bitis_tarihi)
 
 
 def __kurulu_guc(tarih):
@@ -237,9 +183,7 @@ def __kurulu_guc(tarih):
     Kurulu Güç Bilgisi (Tarih, Kurulu Güç)
     """
     try:
-        particular_url = __first_part_url + "installed-capacity?period=" + tarih
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["installedCapacityList"])
+        df = __pd.DataFrame(__uc_noktalar.kayitlar("santraller.kurulu_guc", tarih))
         df = df[df["capacityType"] == "ALL"]
         df.insert(loc=0, column="Tarih", value=__pd.to_datetime(tarih))
         df.rename(index=str, columns={"capacity": "Kurulu Güç"}, inplace=True)
@@ -266,43 +210,35 @@ def __santral_veris_cekis_birimleri(tarih, santral):
                            UEVÇB Adı, UEVÇB EIC Kodu)
    """
 
-    try:
-        particular_url = __first_part_url + "uevcb?period=" + tarih + "&powerPlantId=" + str(santral["Id"])
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["uevcbList"])
-        df["Santral Id"] = santral["Id"]
-        df["Santral Adı"] = santral["Adı"]
-        df["Santral EIC Kodu"] = santral["EIC Kodu"]
-        df["Santral Kısa Adı"] = santral["Kısa Adı"]
-        df.rename(index=str,
-                  columns={"id": "UEVÇB Id", "name": "UEVÇB Adı", "eic": "UEVÇB EIC Kodu"},
+    df = __uc_noktalar.cek("santraller.santral_veris_cekis_birimleri", tarih, santral["Id"])
+    if len(df) > 0:
+        df.rename(index=str, columns={"Id": "UEVÇB Id", "Adı": "UEVÇB Adı", "EIC Kodu": "UEVÇB EIC Kodu"},
                   inplace=True)
-        df = df[["Santral Id", "Santral Adı", "Santral EIC Kodu", "Santral Kısa Adı", "UEVÇB Id",
-                 "UEVÇB Adı", "UEVÇB EIC Kodu"]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+        for i, sutun in enumerate(["Id", "Adı", "EIC Kodu", "Kısa Adı"]):
+            df.insert(loc=i, column="Santral " + sutun, value=santral[sutun])
+    return df
 
 
 def __ytbs_kurulu_guc(tarih):
+    from bs4 import BeautifulSoup as __BeautifulSoup
     url = "https://ytbsbilgi.teias.gov.tr/ytbsbilgi/frm_istatistikler.jsf"
-    r = __requests.get(url)
-    j_session_id = r.cookies.get_dict()["JSESSIONID"]
-    javax_faces_viewstate = \
-        __BeautifulSoup(r.text, features="html.parser").find("input", {"name": "javax.faces.ViewState"})["value"]
-    headers = {
-        "content-type": "application/x-www-form-urlencoded",
-        "cookie": "primefaces.download=true; JSESSIONID={};".format(j_session_id)
-    }
-
-    params = {
-        "formdash": "formdash",
-        "formdash:bitisTarihi2_input": tarih,
-        "formdash:j_idt42.x": 0, "formdash:j_idt42.y": 0,
-        "javax.faces.ViewState": javax_faces_viewstate
-    }
-    r = __requests.post(url=url, params=params, headers=headers)
+    # JSF oturum çerezi ve ViewState eşzamanlı çekilen tarihler arasında paylaşılmaması için her tarih ayrı oturumda
+    # çekilir
+    with __oturum.yeni_oturum() as s:
+        s.cookies.set("primefaces.download", "true")
+        r = __oturum.istek("GET", url, ayri_oturum=s)
+        javax_faces_viewstate = \
+            __BeautifulSoup(r.text, features="html.parser").find("input", {"name": "javax.faces.ViewState"})["value"]
+        headers = {"content-type": "application/x-www-form-urlencoded"}
+
+        params = {
+            "formdash": "formdash",
+            "formdash:bitisTarihi2_input": tarih,
+            "formdash:j_idt42.x": 0, "formdash:j_idt42.y": 0,
+            "javax.faces.ViewState": javax_faces_viewstate
+        }
+        # Rapor indirme formu veri değiştirmediğinden tekrar denenebilir
+        r = __oturum.istek("POST", url, ayri_oturum=s, tekrar_denenebilir=True, params=params, headers=headers)
     df = __pd.read_excel(io=r.content, sheet_name=None, engine="xlrd")
 
     capacity = df["Rapor327 2"].iloc[3:]
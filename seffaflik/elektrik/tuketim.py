@@ -1,15 +1,15 @@
 import pandas as __pd
 import datetime as __dt
 from dateutil import relativedelta as __rd
-from multiprocessing import Pool as __Pool
-import multiprocessing as __mp
-from functools import reduce as __red
 
-from seffaflik.__ortak.__araclar import make_requests as __make_requests
+from seffaflik.__ortak.__araclar import tarih as __tarih, birim_tablosu as __birim_tablosu
+from seffaflik.__ortak import __yurutucu
+from seffaflik.__ortak import __onbellek
+from seffaflik.__ortak import __pencere
+from seffaflik.__ortak import __uc_noktalar
+from seffaflik.__ortak import __veri_tipi
 from seffaflik.__ortak import __dogrulama as __dogrulama
 
-__first_part_url = "consumption/"
-
 
 def sehir():
     """
@@ -23,18 +23,12 @@ def sehir():
     Şehir ve Şehirlere Ait İlçeler (Şehir Id, İlçe Id, Şehir İsmi, İlçe İsmi)
 
     """
-    try:
-        particular_url = __first_part_url + "city"
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["cityList"])
-        df.rename(index=str, columns={"cityId": "Şehir Id", "districtId": "İlçe Id", "cityName": "Şehir İsmi",
-                                      "districtName": "İlçe İsmi"}, inplace=True)
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df.drop_duplicates().reset_index(drop=True)
+    df = __uc_noktalar.cek("tuketim.sehir")
+    return df.drop_duplicates().reset_index(drop=True)
 
 
+@__onbellek.gunluk(kesinlesme=2)
+@__pencere.pencereli(gun=31)
 def gerceklesen(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                 bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -51,21 +45,11 @@ def gerceklesen(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
 
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "real-time-consumption" + "?startDate=" + baslangic_tarihi + \
-                             "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["hourlyConsumptions"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"consumption": "Tüketim"}, inplace=True)
-            df = df[["Tarih", "Saat", "Tüketim"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("tuketim.gerceklesen", baslangic_tarihi, bitis_tarihi)
 
 
+@__onbellek.gunluk(kesinlesme=90)
+@__pencere.pencereli(gun=31)
 def uecm(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
          bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -82,18 +66,7 @@ def uecm(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
 
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "swv" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["swvList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"swv": "UEÇM"}, inplace=True)
-            df = df[["Tarih", "Saat", "UEÇM"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("tuketim.uecm", baslangic_tarihi, bitis_tarihi)
 
 
 def uecm_donemlik(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -120,9 +93,8 @@ def uecm_donemlik(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
         while ilk <= son:
             date_list.append(ilk.strftime("%Y-%m-%d"))
             ilk = ilk + __rd.relativedelta(months=+1)
-        with __Pool(__mp.cpu_count()) as p:
-            df_list = p.map(__uecm_donemlik, date_list, chunksize=1)
-        return __pd.concat(df_list, sort=False)
+        df_list = __yurutucu.esle(__uecm_donemlik, date_list)
+        return __veri_tipi.uygula(__pd.concat(df_list, sort=False))
 
 
 def uecm_serbest_tuketici(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -147,9 +119,8 @@ def uecm_serbest_tuketici(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m
         while ilk <= son:
             date_list.append(ilk.strftime("%Y-%m-%d"))
             ilk = ilk + __rd.relativedelta(months=+1)
-        with __Pool(__mp.cpu_count()) as p:
-            df_list = p.map(__uecm_serbest_tuketici, date_list, chunksize=1)
-        return __pd.concat(df_list, sort=False)
+        df_list = __yurutucu.esle(__uecm_serbest_tuketici, date_list)
+        return __veri_tipi.uygula(__pd.concat(df_list, sort=False))
 
 
 def uecm_donemlik_tedarik(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -174,11 +145,11 @@ def uecm_donemlik_tedarik(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m
         while ilk <= son:
             date_list.append(ilk.strftime("%Y-%m-%d"))
             ilk = ilk + __rd.relativedelta(months=+1)
-        with __Pool(__mp.cpu_count()) as p:
-            df_list = p.map(__uecm_tedarik, date_list, chunksize=1)
-        return __pd.concat(df_list, sort=False)
+        df_list = __yurutucu.esle(__uecm_tedarik, date_list)
+        return __veri_tipi.uygula(__pd.concat(df_list, sort=False))
 
 
+@__pencere.pencereli(gun=31)
 def tahmin(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
            bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -195,19 +166,7 @@ def tahmin(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
 
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "load-estimation-plan" + "?startDate=" + baslangic_tarihi + \
-                             "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["loadEstimationPlanList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"lep": "Tüketim"}, inplace=True)
-            df = df[["Tarih", "Saat", "Tüketim"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("tuketim.tahmin", baslangic_tarihi, bitis_tarihi)
 
 
 def serbest_tuketici_sayisi(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -233,11 +192,10 @@ def serbest_tuketici_sayisi(baslangic_tarihi=__dt.datetime.today().strftime("%Y-
         while ilk <= son:
             date_list.append(ilk.strftime("%Y-%m-%d"))
             ilk = ilk + __rd.relativedelta(months=+1)
-        with __Pool(__mp.cpu_count()) as p:
-            df_list = p.map(__profil_serbest_tuketici_sayisi, date_list, chunksize=1)
+        df_list = __yurutucu.esle(__profil_serbest_tuketici_sayisi, date_list)
         df_st = __pd.concat(df_list, sort=False)
         df_toplam = __serbest_tuketici_sayisi()
-        return __pd.merge(df_st, df_toplam, how="left", on=["Dönem"])
+        return __veri_tipi.uygula(__pd.merge(df_st, df_toplam, how="left", on=["Dönem"]))
 
 
 def sayac_okuyan_kurum(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
@@ -252,19 +210,10 @@ def sayac_okuyan_kurum(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
     Serbest Tüketici Sayısı (Tarih, Serbest Tüketici Sayısı, Artış Oranı)
     """
     if __dogrulama.__tarih_dogrulama(tarih):
-        try:
-            particular_url = __first_part_url + "meter-reading-company" + "?period=" + tarih
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["meterReadingCompanyList"])
-            df.rename(index=str,
-                      columns={"id": "Id", "name": "Şirket Adı", "status": "Durum"},
-                      inplace=True)
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("tuketim.sayac_okuyan_kurum", tarih)
 
 
+@__onbellek.sureli("tuketim.dagitim_bolgeleri")
 def dagitim_bolgeleri():
     """
     Dağıtım bölgelerine dair bilgileri vermektedir.
@@ -276,15 +225,7 @@ def dagitim_bolgeleri():
     -----------------
     Dağıtım Bölgeleri (Id, Dağıtım Bölgesi)
     """
-    try:
-        particular_url = __first_part_url + "distribution"
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["distributionList"])
-        df.rename(index=str, columns={"id": "Id", "name": "Dağıtım Şirket Adı"}, inplace=True)
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    return __uc_noktalar.cek("tuketim.dagitim_bolgeleri")
 
 
 def profil_abone_grubu(tarih=__dt.datetime.today().strftime("%Y-%m-%d"), distribution_id=""):
@@ -302,19 +243,10 @@ def profil_abone_grubu(tarih=__dt.datetime.today().strftime("%Y-%m-%d"), distrib
 
     """
     if __dogrulama.__tarih_dogrulama(tarih):
-        try:
-            particular_url = __first_part_url + "subscriber-profile-group" + "?period=" + tarih + "&distributionId=" \
-                             + str(distribution_id)
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["subscriberProfileGroupList"])
-            df.rename(index=str, columns={"id": "Id", "name": "Profil Adı"}, inplace=True)
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("tuketim.profil_abone_grubu", tarih, distribution_id)
 
 
-def tum_dagitimlar_profil_gruplari(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
+def tum_dagitimlar_profil_gruplari(tarih=__dt.datetime.today().strftime("%Y-%m-%d"), bicim="genis"):
     """
     İlgili tarih aralığı için Kesinleşmiş Gün Öncesi Üretim Planı (KGÜP) girebilecek olan tüm organizasyonların saatlik
     KGUP bilgilerini vermektedir.
@@ -323,24 +255,22 @@ def tum_dagitimlar_profil_gruplari(tarih=__dt.datetime.today().strftime("%Y-%m-%
     ------------
     baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi (Varsayılan: bugün)
     bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi (Varsayılan: bugün)
+    bicim            : "genis", "uzun" yada "seyrek" sonuç biçimi (Varsayılan: "genis")
 
     Geri Dönüş Değeri
     -----------------
     KGÜP Girebilen Organizasyonların KGUP Değerleri (Tarih, Saat, KGUP)
     """
-    if __dogrulama.__tarih_dogrulama(tarih):
+    if __dogrulama.__tarih_dogrulama(tarih) and __dogrulama.__bicim_dogrulama(bicim):
         dist = dagitim_bolgeleri()
         list_dist = list(dist["Id"])
         org_len = len(list_dist)
         list_date_dist = list(zip([tarih] * org_len, list_dist))
         list_date_dist = list(map(list, list_date_dist))
-        with __Pool(__mp.cpu_count()) as p:
-            list_df_unit = p.starmap(profil_abone_grubu, list_date_dist, chunksize=1)
-        list_df_unit = list(filter(lambda x: len(x) > 0, list_df_unit))
-        df_unit = __red(lambda left, right: __pd.merge(left, right, how="outer", on=["Id"], sort=True),
-                        list_df_unit)
-        df_unit.columns = ["Id"] + list(dist["Dağıtım Şirket Adı"])
-        return df_unit
+        list_df_unit = __yurutucu.coklu_esle(profil_abone_grubu, list_date_dist)
+        list_df_unit = [df.rename(columns={"Profil Adı": ad})
+                        for df, ad in zip(list_df_unit, dist["Dağıtım Şirket Adı"])]
+        return __birim_tablosu(list_df_unit, anahtar=["Id"], bicim=bicim)
 
 
 def sayac_okuma_tipi():
@@ -354,15 +284,7 @@ def sayac_okuma_tipi():
     -----------------
     Sayaç Okuma Tipleri (Id, Dağıtım Bölgesi)
     """
-    try:
-        particular_url = __first_part_url + "meter-reading-type"
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["meterReadingTypeList"])
-        df.rename(index=str, columns={"id": "Id", "name": "Sayaç Tipi"}, inplace=True)
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    return __uc_noktalar.cek("tuketim.sayac_okuma_tipi")
 
 
 def __uecm_donemlik(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
@@ -381,20 +303,7 @@ def __uecm_donemlik(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
 
     """
     if __dogrulama.__tarih_dogrulama(tarih):
-        try:
-            particular_url = __first_part_url + "consumption" + "?period=" + tarih
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["consumptions"])
-            df["Dönem"] = df["period"].apply(lambda d: d[:7])
-            df.rename(index=str,
-                      columns={"consumption": "UEÇM", "eligibleCustomerConsumption": "Serbest Tüketici UEÇM",
-                               "underSupplyLiabilityConsumption": "Tedarik Yükümlülüğü Kapsamındaki UEÇM"},
-                      inplace=True)
-            df = df[["Dönem", "UEÇM", "Serbest Tüketici UEÇM", "Tedarik Yükümlülüğü Kapsamındaki UEÇM"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("tuketim.uecm_donemlik", tarih)
 
 
 def __uecm_serbest_tuketici(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
@@ -412,18 +321,7 @@ def __uecm_serbest_tuketici(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
 
     """
     if __dogrulama.__tarih_dogrulama(tarih):
-        try:
-            particular_url = __first_part_url + "swv-v2" + "?period=" + tarih
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["swvV2List"])
-            df["Saat"] = df["vc_gec_trh"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["vc_gec_trh"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"st": "Serbest Tüketici UEÇM"}, inplace=True)
-            df = df[["Tarih", "Saat", "Serbest Tüketici UEÇM"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("tuketim.uecm_serbest_tuketici", tarih)
 
 
 def __uecm_tedarik(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
@@ -442,18 +340,7 @@ def __uecm_tedarik(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
 
     """
     if __dogrulama.__tarih_dogrulama(tarih):
-        try:
-            particular_url = __first_part_url + "under-supply-liability-consumption" + "?startDate=" + tarih + \
-                             "&endDate=" + tarih
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["swvList"])
-            df["Dönem"] = df["date"].apply(lambda d: d[:7])
-            df.rename(index=str, columns={"swv": "Tedarik Yükümlülüğü Kapsamındaki UEÇM"}, inplace=True)
-            df = df[["Dönem", "Tedarik Yükümlülüğü Kapsamındaki UEÇM"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("tuketim.uecm_tedarik", tarih, tarih)
 
 
 def __serbest_tuketici_sayisi():
@@ -468,19 +355,7 @@ def __serbest_tuketici_sayisi():
     -----------------
     Serbest Tüketici Sayısı (Tarih, Serbest Tüketici Sayısı, Artış Oranı)
     """
-    try:
-        particular_url = __first_part_url + "eligible-consumer-quantity"
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["eligibleConsumerQuantityList"])
-        df["Dönem"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-        df.rename(index=str,
-                  columns={"meterQuantity": "Serbest Tüketici Sayısı", "meterIncreaseRate": "Artış Oranı"},
-                  inplace=True)
-        df = df[["Dönem", "Serbest Tüketici Sayısı", "Artış Oranı"]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    return __uc_noktalar.cek("tuketim.serbest_tuketici_sayisi")
 
 
 def __profil_serbest_tuketici_sayisi(tarih=__dt.datetime.today().strftime("%Y-%m-%d")):
@@ -500,11 +375,9 @@ def __profil_serbest_tuketici_sayisi(tarih=__dt.datetime.today().strftime("%Y-%m
 
     """
     try:
-        particular_url = __first_part_url + "st" + "?startDate=" + tarih + "&endDate=" + tarih
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["stList"])
-        df["Profil"] = df["id"].apply(lambda x: x["profilAboneGrupAdi"])
-        df["Dönem"] = df["id"].apply(lambda x: __pd.to_datetime(x["date"][:10]))
+        df = __pd.DataFrame(__uc_noktalar.kayitlar("tuketim.profil_serbest_tuketici_sayisi", tarih, tarih))
+        df["Profil"] = df["id"].str.get("profilAboneGrupAdi")
+        df["Dönem"] = __tarih(df["id"].str.get("date"))
         df = df.pivot(index='Dönem', columns='Profil', values='stCount').reset_index()
         df.columns.name = None
         df.columns = df.columns.str.title()
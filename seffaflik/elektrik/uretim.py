@@ -1,16 +1,17 @@
 import pandas as __pd
 import datetime as __dt
-from multiprocessing import Pool as __Pool
-import multiprocessing as __mp
-from functools import reduce as __red
 
-from seffaflik.__ortak.__araclar import make_requests as __make_requests
+from seffaflik.__ortak.__araclar import birim_tablosu as __birim_tablosu
+from seffaflik.__ortak import __yurutucu
+from seffaflik.__ortak import __onbellek
+from seffaflik.__ortak import __pencere
+from seffaflik.__ortak import __uc_noktalar
+from seffaflik.__ortak import __veri_tipi
 from seffaflik.__ortak import __dogrulama as __dogrulama
 from seffaflik.elektrik import santraller as __santraller
 
-__first_part_url = "production/"
-
 
+@__onbellek.sureli("uretim.organizasyonlar")
 def organizasyonlar():
     """
     Kesinleşmiş Gün Öncesi Üretim Planı (KGÜP) girebilecek olan organizasyon bilgilerini vermektedir.
@@ -22,20 +23,7 @@ def organizasyonlar():
     -----------------
     KGÜP Girebilen Organizasyon Bilgileri(Id, Adı, EIC Kodu, Kısa Adı, Durum)
     """
-    try:
-        particular_url = __first_part_url + "dpp-organization"
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["organizations"])
-        df.rename(index=str,
-                  columns={"organizationId": "Id", "organizationName": "Adı",
-                           "organizationETSOCode": "EIC Kodu", "organizationShortName": "Kısa Adı",
-                           "organizationStatus": "Durum"},
-                  inplace=True)
-        df = df[["Id", "Adı", "EIC Kodu", "Kısa Adı", "Durum"]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    return __uc_noktalar.cek("uretim.organizasyonlar")
 
 
 def organizasyon_veris_cekis_birimleri(eic):
@@ -51,18 +39,8 @@ def organizasyon_veris_cekis_birimleri(eic):
     -----------------
     KGÜP Girebilen Organizasyonun UEVÇB Bilgileri(Id, Adı, EIC Kodu)
     """
-
     if __dogrulama.__kgup_girebilen_organizasyon_dogrulama(eic):
-        try:
-            particular_url = __first_part_url + "dpp-injection-unit-name?organizationEIC=" + eic
-            json = __make_requests(particular_url)
-            df_unit = __pd.DataFrame(json["body"]["injectionUnitNames"])
-            df_unit.rename(index=str, columns={"id": "Id", "name": "Adı", "eic": "EIC Kodu"}, inplace=True)
-            df_unit = df_unit[["Id", "Adı", "EIC Kodu"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df_unit
+        return __uc_noktalar.cek("uretim.organizasyon_veris_cekis_birimleri", eic)
 
 
 def tum_organizasyonlar_veris_cekis_birimleri():
@@ -79,11 +57,11 @@ def tum_organizasyonlar_veris_cekis_birimleri():
     UEVÇB Adı, UEVÇB EIC Kodu)
     """
     list_org = organizasyonlar()[["Id", "Adı", "EIC Kodu", "Kısa Adı", "Durum"]].to_dict("records")
-    with __Pool(__mp.cpu_count()) as p:
-        list_df_unit = p.map(__organizasyon_cekis_birimleri, list_org, chunksize=1)
-    return __pd.concat(list_df_unit).reset_index(drop=True)
+    list_df_unit = __yurutucu.esle(__organizasyon_cekis_birimleri, list_org)
+    return __veri_tipi.uygula(__pd.concat(list_df_unit).reset_index(drop=True))
 
 
+@__pencere.pencereli(gun=31)
 def kgup(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
          bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), organizasyon_eic="", uevcb_eic=""):
     """
@@ -105,28 +83,11 @@ def kgup(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     ,Nafta, Diğer, Toplam)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "dpp" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi \
-                             + "&organizationEIC=" + organizasyon_eic + "&uevcbEIC=" + uevcb_eic
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["dppList"])
-            df["Saat"] = df["tarih"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["tarih"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"akarsu": "Akarsu", "barajli": "Barajlı", "biokutle": "Biyokütle", "diger": "Diğer",
-                               "dogalgaz": "Doğalgaz", "fuelOil": "Fuel Oil", "ithalKomur": "İthal Kömür",
-                               "jeotermal": "Jeo Termal", "linyit": "Linyit", "nafta": "Nafta",
-                               "ruzgar": "Rüzgar", "tasKomur": "Taş Kömür", "toplam": "Toplam"}, inplace=True)
-            df = df[["Tarih", "Saat", "Doğalgaz", "Barajlı", "Linyit", "Akarsu", "İthal Kömür", "Rüzgar",
-                     "Fuel Oil", "Jeo Termal", "Taş Kömür", "Biyokütle", "Nafta", "Diğer", "Toplam"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("uretim.kgup", baslangic_tarihi, bitis_tarihi, organizasyon_eic, uevcb_eic)
 
 
 def tum_organizasyonlar_kgup(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
-                             bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
+                             bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), bicim="genis"):
     """
     İlgili tarih aralığı için Kesinleşmiş Gün Öncesi Üretim Planı (KGÜP) girebilecek olan tüm organizasyonların saatlik
     KGUP bilgilerini vermektedir.
@@ -135,27 +96,25 @@ def tum_organizasyonlar_kgup(baslangic_tarihi=__dt.datetime.today().strftime("%Y
     ------------
     baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi (Varsayılan: bugün)
     bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi (Varsayılan: bugün)
+    bicim            : "genis", "uzun" yada "seyrek" sonuç biçimi (Varsayılan: "genis")
 
     Geri Dönüş Değeri
     -----------------
     KGÜP Girebilen Organizasyonların KGUP Değerleri (Tarih, Saat, KGUP)
     """
-    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
+    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi) and \
+            __dogrulama.__bicim_dogrulama(bicim):
         org = organizasyonlar()
         list_org = org[["EIC Kodu", "Kısa Adı"]].to_dict("records")
         org_len = len(list_org)
         list_date_org_eic = list(zip([baslangic_tarihi] * org_len, [bitis_tarihi] * org_len, list_org))
         list_date_org_eic = list(map(list, list_date_org_eic))
-        with __Pool(__mp.cpu_count()) as p:
-            list_df_unit = p.starmap(__kgup, list_date_org_eic, chunksize=1)
-        list_df_unit = list(filter(lambda x: len(x) > 0, list_df_unit))
-        df_unit = __red(lambda left, right: __pd.merge(left, right, how="outer", on=["Tarih", "Saat"], sort=True),
-                        list_df_unit)
-        return df_unit
+        list_df_unit = __yurutucu.coklu_esle(__kgup, list_date_org_eic)
+        return __birim_tablosu(list_df_unit, bicim=bicim)
 
 
 def tum_uevcb_kgup(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
-                   bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
+                   bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), bicim="genis"):
     """
     İlgili tarih aralığı için Kesinleşmiş Gün Öncesi Üretim Planı (KGÜP) girebilecek olan tüm organizasyonların
     uzlaştırmaya esas veriş-çekiş birimlerinin saatlik KGUP bilgilerini vermektedir.
@@ -164,26 +123,25 @@ def tum_uevcb_kgup(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     ------------
     baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi (Varsayılan: bugün)
     bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi (Varsayılan: bugün)
+    bicim            : "genis", "uzun" yada "seyrek" sonuç biçimi (Varsayılan: "genis")
 
     Geri Dönüş Değeri
     -----------------
     KGÜP Girebilen Organizasyonların UEVCB KGUP Değerleri (Tarih, Saat, KGUP)
     """
-    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
+    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi) and \
+            __dogrulama.__bicim_dogrulama(bicim):
         org_uevcb = tum_organizasyonlar_veris_cekis_birimleri()
         list_org_uevcb = org_uevcb[["Org EIC Kodu", "UEVÇB EIC Kodu", "UEVÇB Adı"]].to_dict("records")
         list_org_uevcb_len = len(list_org_uevcb)
         list_date_org_uevcb_eic = list(
             zip([baslangic_tarihi] * list_org_uevcb_len, [bitis_tarihi] * list_org_uevcb_len, list_org_uevcb))
         list_date_org_uevcb_eic = list(map(list, list_date_org_uevcb_eic))
-        with __Pool(__mp.cpu_count()) as p:
-            list_df_unit = p.starmap(__kgup_uevcb, list_date_org_uevcb_eic, chunksize=1)
-        list_df_unit = list(filter(lambda x: len(x) > 0, list_df_unit))
-        df_unit = __red(lambda left, right: __pd.merge(left, right, how="outer", on=["Tarih", "Saat"], sort=True),
-                        list_df_unit)
-        return df_unit
+        list_df_unit = __yurutucu.coklu_esle(__kgup_uevcb, list_date_org_uevcb_eic)
+        return __birim_tablosu(list_df_unit, bicim=bicim)
 
 
+@__pencere.pencereli(gun=31)
 def eak(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
         bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), organizasyon_eic="", uevcb_eic=""):
     """
@@ -205,28 +163,11 @@ def eak(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Nafta, Diğer, Toplam)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "aic" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi \
-                             + "&organizationEIC=" + organizasyon_eic + "&uevcbEIC=" + uevcb_eic
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["aicList"])
-            df["Saat"] = df["tarih"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["tarih"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"akarsu": "Akarsu", "barajli": "Barajlı", "biokutle": "Biyokütle", "diger": "Diğer",
-                               "dogalgaz": "Doğalgaz", "fuelOil": "Fuel Oil", "ithalKomur": "İthal Kömür",
-                               "jeotermal": "Jeo Termal", "linyit": "Linyit", "nafta": "Nafta",
-                               "ruzgar": "Rüzgar", "tasKomur": "Taş Kömür", "toplam": "Toplam"}, inplace=True)
-            df = df[["Tarih", "Saat", "Doğalgaz", "Barajlı", "Linyit", "Akarsu", "İthal Kömür", "Rüzgar",
-                     "Fuel Oil", "Jeo Termal", "Taş Kömür", "Biyokütle", "Nafta", "Diğer", "Toplam"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("uretim.eak", baslangic_tarihi, bitis_tarihi, organizasyon_eic, uevcb_eic)
 
 
 def tum_organizasyonlar_eak(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
-                            bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
+                            bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), bicim="genis"):
     """
     İlgili tarih aralığı için Emre Amade Kapasite (EAK) girebilecek olan tüm organizasyonların saatlik EAK bilgilerini
     vermektedir.
@@ -235,27 +176,25 @@ def tum_organizasyonlar_eak(baslangic_tarihi=__dt.datetime.today().strftime("%Y-
     ------------
     baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi (Varsayılan: bugün)
     bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi (Varsayılan: bugün)
+    bicim            : "genis", "uzun" yada "seyrek" sonuç biçimi (Varsayılan: "genis")
 
     Geri Dönüş Değeri
     -----------------
     EAK Girebilen Organizasyonların EAK Değerleri (Tarih, Saat, EAK)
     """
-    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
+    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi) and \
+            __dogrulama.__bicim_dogrulama(bicim):
         org = organizasyonlar()
         list_org = org[["EIC Kodu", "Kısa Adı"]].to_dict("records")
         org_len = len(list_org)
         list_date_org_eic = list(zip([baslangic_tarihi] * org_len, [bitis_tarihi] * org_len, list_org))
         list_date_org_eic = list(map(list, list_date_org_eic))
-        with __Pool(__mp.cpu_count()) as p:
-            list_df_unit = p.starmap(__eak, list_date_org_eic, chunksize=1)
-        list_df_unit = list(filter(lambda x: len(x) > 0, list_df_unit))
-        df_unit = __red(lambda left, right: __pd.merge(left, right, how="outer", on=["Tarih", "Saat"], sort=True),
-                        list_df_unit)
-        return df_unit
+        list_df_unit = __yurutucu.coklu_esle(__eak, list_date_org_eic)
+        return __birim_tablosu(list_df_unit, bicim=bicim)
 
 
 def tum_uevcb_eak(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
-                  bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
+                  bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), bicim="genis"):
     """
     İlgili tarih aralığı için Emre Amade Kapasite (EAK) girebilecek olan tüm organizasyonların uzlaştırmaya esas
     veriş-çekiş birimlerinin saatlik KGUP bilgilerini vermektedir.
@@ -264,26 +203,25 @@ def tum_uevcb_eak(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     ------------
     baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi (Varsayılan: bugün)
     bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi (Varsayılan: bugün)
+    bicim            : "genis", "uzun" yada "seyrek" sonuç biçimi (Varsayılan: "genis")
 
     Geri Dönüş Değeri
     -----------------
     KGÜP Girebilen Organizasyonların UEVCB KGUP Değerleri (Tarih, Saat, KGUP)
     """
-    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
+    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi) and \
+            __dogrulama.__bicim_dogrulama(bicim):
         org_uevcb = tum_organizasyonlar_veris_cekis_birimleri()
         list_org_uevcb = org_uevcb[["Org EIC Kodu", "UEVÇB EIC Kodu", "UEVÇB Adı"]].to_dict("records")
         list_org_uevcb_len = len(list_org_uevcb)
         list_date_org_uevcb_eic = list(
             zip([baslangic_tarihi] * list_org_uevcb_len, [bitis_tarihi] * list_org_uevcb_len, list_org_uevcb))
         list_date_org_uevcb_eic = list(map(list, list_date_org_uevcb_eic))
-        with __Pool(__mp.cpu_count()) as p:
-            list_df_unit = p.starmap(__eak_uevcb, list_date_org_uevcb_eic, chunksize=1)
-        list_df_unit = list(filter(lambda x: len(x) > 0, list_df_unit))
-        df_unit = __red(lambda left, right: __pd.merge(left, right, how="outer", on=["Tarih", "Saat"], sort=True),
-                        list_df_unit)
-        return df_unit
+        list_df_unit = __yurutucu.coklu_esle(__eak_uevcb, list_date_org_uevcb_eic)
+        return __birim_tablosu(list_df_unit, bicim=bicim)
 
 
+@__pencere.pencereli(gun=31)
 def kudup(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
           bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), organizasyon_id="", uevcb_id=""):
     """
@@ -306,26 +244,11 @@ def kudup(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Biyokütle, Nafta, Diğer, Toplam)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "sbfgp" + "?startDate=" + baslangic_tarihi + "&endDate=" + \
-                             bitis_tarihi + "&organizationId=" + str(organizasyon_id) + "&uevcbId=" + str(uevcb_id)
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["dppList"])
-            df["Saat"] = df["tarih"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["tarih"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"akarsu": "Akarsu", "barajli": "Barajlı", "biokutle": "Biyokütle", "diger": "Diğer",
-                               "dogalgaz": "Doğalgaz", "fuelOil": "Fuel Oil", "ithalKomur": "İthal Kömür",
-                               "jeotermal": "Jeo Termal", "linyit": "Linyit", "nafta": "Nafta",
-                               "ruzgar": "Rüzgar", "tasKomur": "Taş Kömür", "toplam": "Toplam"}, inplace=True)
-            df = df[["Tarih", "Saat", "Doğalgaz", "Barajlı", "Linyit", "Akarsu", "İthal Kömür", "Rüzgar",
-                     "Fuel Oil", "Jeo Termal", "Taş Kömür", "Biyokütle", "Nafta", "Diğer", "Toplam"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("uretim.kudup", baslangic_tarihi, bitis_tarihi, organizasyon_id, uevcb_id)
 
 
+@__onbellek.gunluk(kesinlesme=90)
+@__pencere.pencereli(gun=31)
 def uevm(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
          bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -342,30 +265,11 @@ def uevm(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
 
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "ssv-categorized" + "?startDate=" + baslangic_tarihi + "&endDate=" + \
-                             bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["ssvList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"asphaltite": "Asfaltit Kömür", "river": "Akarsu", "dam": "Barajlı",
-                               "biomass": "Biyokütle", "naturalGas": "Doğalgaz", "fueloil": "Fuel Oil",
-                               "importedCoal": "İthal Kömür", "geothermal": "Jeo Termal", "lignite": "Linyit",
-                               "naphtha": "Nafta", "lng": "LNG", "wind": "Rüzgar", "stonecoal": "Taş Kömür",
-                               "international": "Uluslararası", "total": "Toplam", "other": "Diğer"},
-                      inplace=True)
-            df = df[
-                ["Tarih", "Saat", "Doğalgaz", "Barajlı", "Linyit", "Akarsu", "İthal Kömür", "Rüzgar",
-                 "Fuel Oil", "Jeo Termal", "Asfaltit Kömür", "Taş Kömür", "Biyokütle", "Nafta", "LNG", "Uluslararası",
-                 "Diğer", "Toplam"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("uretim.uevm", baslangic_tarihi, bitis_tarihi)
 
 
+@__onbellek.gunluk(kesinlesme=2)
+@__pencere.pencereli(gun=31)
 def gerceklesen(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                 bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), santral_id=""):
     """
@@ -393,7 +297,7 @@ def gerceklesen(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
 
 
 def tum_santraller_gerceklesen(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
-                               bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
+                               bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), bicim="genis"):
     """
     İlgili tarih aralığı için tüm lisanslı santrallerin gerçek zamanlı üretim bilgisini vermektedir.
 
@@ -401,24 +305,22 @@ def tum_santraller_gerceklesen(baslangic_tarihi=__dt.datetime.today().strftime("
     ------------
     baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi (Varsayılan: bugün)
     bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi (Varsayılan: bugün)
+    bicim            : "genis", "uzun" yada "seyrek" sonuç biçimi (Varsayılan: "genis")
 
     Geri Dönüş Değeri
     -----------------
     Tüm lisanslı santrallerin gerçek zamanlı üretim Değerleri (Tarih, Saat, Santral Üretimleri)
     """
-    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
+    if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi) and \
+            __dogrulama.__bicim_dogrulama(bicim):
         sant = __santraller.gercek_zamanli_uretim_yapan_santraller()
         list_sant = sant[["Id", "Kısa Adı"]].to_dict("records")
         list_sant_len = len(list_sant)
         list_sant = list(
             zip([baslangic_tarihi] * list_sant_len, [bitis_tarihi] * list_sant_len, list_sant))
         list_sant = list(map(list, list_sant))
-        with __Pool(__mp.cpu_count()) as p:
-            list_df_unit = p.starmap(__gerceklesen_santral, list_sant, chunksize=1)
-        list_df_unit = list(filter(lambda x: len(x) > 0, list_df_unit))
-        df_unit = __red(lambda left, right: __pd.merge(left, right, how="outer", on=["Tarih", "Saat"], sort=True),
-                        list_df_unit)
-        return df_unit
+        list_df_unit = __yurutucu.coklu_esle(__gerceklesen_santral, list_sant)
+        return __birim_tablosu(list_df_unit, bicim=bicim)
 
 
 def gddk(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -436,25 +338,7 @@ def gddk(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Dönemlik GDDK (₺)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "gddk-amount" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["gddkAmountList"])
-            df["Dönem"] = df["id"].apply(
-                lambda x: str(__pd.to_datetime(x["date"][:10]).month_name(locale='tr_TR.UTF-8')) + "-" + str(
-                    __pd.to_datetime(x["date"][:10]).year))
-            df["Versiyon"] = df["id"].apply(
-                lambda x: str(__pd.to_datetime(x["version"][:10]).month_name(locale='tr_TR.UTF-8')) + "-" + str(
-                    __pd.to_datetime(x["version"][:10]).year))
-            df.rename(index=str,
-                      columns={"gddkCreditAmount": "Alacak GDDK Tutarı (TL)", "gddkDebtAmount": "Borç GDDK Tutarı (TL)",
-                               "gddkNetAmount": "Net GDDK Tutarı (TL)"}, inplace=True)
-            df = df[["Dönem", "Versiyon", "Alacak GDDK Tutarı (TL)", "Borç GDDK Tutarı (TL)", "Net GDDK Tutarı (TL)"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("uretim.gddk", baslangic_tarihi, bitis_tarihi)
 
 
 def __gerceklesen(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -473,29 +357,7 @@ def __gerceklesen(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                  "Fuel Oil", "Jeo Termal", "Asfaltit Kömür", "Taş Kömür", "Biokütle", "Nafta", "LNG", "Uluslararası",
                  "Toplam")
     """
-    try:
-        particular_url = __first_part_url + "real-time-generation" + "?startDate=" + baslangic_tarihi + "&endDate=" \
-                         + bitis_tarihi
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["hourlyGenerations"])
-        df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-        df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-        df.rename(index=str,
-                  columns={"asphaltiteCoal": "Asfaltit Kömür", "river": "Akarsu", "dammedHydro": "Barajlı",
-                           "biomass": "Biyokütle", "sun": "Güneş", "naturalGas": "Doğalgaz",
-                           "fueloil": "Fuel Oil", "importCoal": "İthal Kömür", "geothermal": "Jeo Termal",
-                           "lignite": "Linyit", "naphta": "Nafta", "lng": "LNG", "wind": "Rüzgar",
-                           "blackCoal": "Taş Kömür", "importExport": "Uluslararası", "total": "Toplam",
-                           "wasteheat": "Atık Isı"},
-                  inplace=True)
-        df = df[
-            ["Tarih", "Saat", "Doğalgaz", "Barajlı", "Linyit", "Akarsu", "İthal Kömür", "Rüzgar", "Güneş",
-             "Fuel Oil", "Jeo Termal", "Asfaltit Kömür", "Taş Kömür", "Biyokütle", "Nafta", "LNG", "Uluslararası",
-             "Atık Isı", "Toplam"]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    return __uc_noktalar.cek("uretim.gerceklesen", baslangic_tarihi, bitis_tarihi)
 
 
 def __santral_bazli_gerceklesen(baslangic_tarihi, bitis_tarihi, santral_id):
@@ -514,31 +376,10 @@ def __santral_bazli_gerceklesen(baslangic_tarihi, bitis_tarihi, santral_id):
                 "Rüzgar", "Güneş", "Fuel Oil", "Jeo Termal", "Asfaltit Kömür", "Taş Kömür", "Biokütle", "Nafta", "LNG",
                 "Uluslararası", "Toplam")
     """
-    try:
-        particular_url = __first_part_url + "real-time-generation_with_powerplant" + "?startDate=" + \
-                         baslangic_tarihi + "&endDate=" + bitis_tarihi + "&powerPlantId=" + str(santral_id)
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["hourlyGenerations"])
-        df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-        df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-        df.rename(index=str,
-                  columns={"asphaltiteCoal": "Asfaltit Kömür", "river": "Akarsu", "dammedHydro": "Barajlı",
-                           "biomass": "Biyokütle", "sun": "Güneş", "naturalGas": "Doğalgaz",
-                           "fueloil": "Fuel Oil", "importCoal": "İthal Kömür", "geothermal": "Jeo Termal",
-                           "lignite": "Linyit", "naphta": "Nafta", "lng": "LNG", "wind": "Rüzgar",
-                           "blackCoal": "Taş Kömür", "importExport": "Uluslararası", "total": "Toplam",
-                           "wasteheat": "Atık Isı"},
-                  inplace=True)
-        df = df[
-            ["Tarih", "Saat", "Doğalgaz", "Barajlı", "Linyit", "Akarsu", "İthal Kömür", "Rüzgar", "Güneş",
-             "Fuel Oil", "Jeo Termal", "Asfaltit Kömür", "Taş Kömür", "Biyokütle", "Nafta", "LNG", "Uluslararası",
-             "Atık Isı", "Toplam"]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    return __uc_noktalar.cek("uretim.santral_bazli_gerceklesen", baslangic_tarihi, bitis_tarihi, santral_id)
 
 
+@__pencere.pencereli(gun=31)
 def __gerceklesen_santral(baslangic_tarihi, bitis_tarihi, santral):
     """
     İlgili tarih aralığı ve santral için gerçek zamanlı üretim bilgisini vermektedir.
@@ -553,19 +394,10 @@ def __gerceklesen_santral(baslangic_tarihi, bitis_tarihi, santral):
     -----------------
     Santral Bazlı Gerçek Zamanlı Üretim("Tarih", "Saat", "Toplam")
     """
-    try:
-        particular_url = __first_part_url + "real-time-generation_with_powerplant" + "?startDate=" + \
-                         baslangic_tarihi + "&endDate=" + bitis_tarihi + "&powerPlantId=" + str(santral["Id"])
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["hourlyGenerations"])
-        df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-        df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-        df.rename(index=str, columns={"total": santral["Kısa Adı"]}, inplace=True)
-        df = df[["Tarih", "Saat", santral["Kısa Adı"]]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    df = __uc_noktalar.cek("uretim.santral_bazli_gerceklesen", baslangic_tarihi, bitis_tarihi, santral["Id"])
+    if len(df) > 0:
+        df = df[["Tarih", "Saat", "Toplam"]].rename(columns={"Toplam": santral["Kısa Adı"]})
+    return df
 
 
 def __organizasyon_cekis_birimleri(org):
@@ -582,26 +414,15 @@ def __organizasyon_cekis_birimleri(org):
     KGÜP Girebilen Organizasyon Bilgileri(Org Id, Org Adı, Org EIC Kodu, Org Kısa Adı,Org Durum, UEVÇB Id, UEVÇB Adı,
     UEVÇB EIC Kodu)
     """
-    try:
-        particular_url = __first_part_url + "dpp-injection-unit-name?organizationEIC=" + org["EIC Kodu"]
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["injectionUnitNames"])
-        df["Org Id"] = org["Id"]
-        df["Org Adı"] = org["Adı"]
-        df["Org EIC Kodu"] = org["EIC Kodu"]
-        df["Org Kısa Adı"] = org["Kısa Adı"]
-        df["Org Durum"] = org["Durum"]
-        df.rename(index=str,
-                  columns={"id": "UEVÇB Id", "name": "UEVÇB Adı", "eic": "UEVÇB EIC Kodu"},
-                  inplace=True)
-        df = df[["Org Id", "Org Adı", "Org EIC Kodu", "Org Kısa Adı",
-                 "Org Durum", "UEVÇB Id", "UEVÇB Adı", "UEVÇB EIC Kodu"]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    df = __uc_noktalar.cek("uretim.organizasyon_veris_cekis_birimleri", org["EIC Kodu"])
+    if len(df) > 0:
+        df.rename(index=str, columns={"Id": "UEVÇB Id", "Adı": "UEVÇB Adı", "EIC Kodu": "UEVÇB EIC Kodu"}, inplace=True)
+        for i, sutun in enumerate(["Id", "Adı", "EIC Kodu", "Kısa Adı", "Durum"]):
+            df.insert(loc=i, column="Org " + sutun, value=org[sutun])
+    return df
 
 
+@__pencere.pencereli(gun=31)
 def __kgup(baslangic_tarihi, bitis_tarihi, org):
     """
     İlgili tarih aralığı ve organizasyon için  kesinleşmiş günlük üretim prgoramı (KGÜP) bilgisini vermektedir.
@@ -617,21 +438,13 @@ def __kgup(baslangic_tarihi, bitis_tarihi, org):
     Organizasyonel KGUP değerleri
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "dpp" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi \
-                             + "&organizationEIC=" + org["EIC Kodu"]
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["dppList"])
-            df["Saat"] = df["tarih"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["tarih"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"toplam": org["Kısa Adı"]}, inplace=True)
-            df = df[["Tarih", "Saat", org["Kısa Adı"]]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        df = __uc_noktalar.cek("uretim.kgup", baslangic_tarihi, bitis_tarihi, org["EIC Kodu"], "")
+        if len(df) > 0:
+            df = df[["Tarih", "Saat", "Toplam"]].rename(columns={"Toplam": org["Kısa Adı"]})
+        return df
 
 
+@__pencere.pencereli(gun=31)
 def __kgup_uevcb(baslangic_tarihi, bitis_tarihi, org_uevcb):
     """
     İlgili tarih aralığı ve uzlaştırmaya esas veriş çekiş birimi için kesinleşmiş günlük üretim prgoramı (KGÜP)
@@ -648,22 +461,14 @@ def __kgup_uevcb(baslangic_tarihi, bitis_tarihi, org_uevcb):
     UEVCB KGUP değerleri
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "dpp" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi \
-                             + "&organizationEIC=" + org_uevcb["Org EIC Kodu"] + "&uevcbEIC=" + org_uevcb[
-                                 "UEVÇB EIC Kodu"]
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["dppList"])
-            df["Saat"] = df["tarih"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["tarih"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"toplam": org_uevcb["UEVÇB Adı"]}, inplace=True)
-            df = df[["Tarih", "Saat", org_uevcb["UEVÇB Adı"]]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        df = __uc_noktalar.cek("uretim.kgup", baslangic_tarihi, bitis_tarihi, org_uevcb["Org EIC Kodu"],
+                               org_uevcb["UEVÇB EIC Kodu"])
+        if len(df) > 0:
+            df = df[["Tarih", "Saat", "Toplam"]].rename(columns={"Toplam": org_uevcb["UEVÇB Adı"]})
+        return df
 
 
+@__pencere.pencereli(gun=31)
 def __eak(baslangic_tarihi, bitis_tarihi, org):
     """
     İlgili tarih aralığı ve organizasyon için emre amade kapasite (EAK) bilgisini vermektedir.
@@ -679,21 +484,13 @@ def __eak(baslangic_tarihi, bitis_tarihi, org):
     ORganizasyonel EAK değerleri
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "aic" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi \
-                             + "&organizationEIC=" + org["EIC Kodu"]
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["aicList"])
-            df["Saat"] = df["tarih"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["tarih"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"toplam": org["Kısa Adı"]}, inplace=True)
-            df = df[["Tarih", "Saat", org["Kısa Adı"]]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        df = __uc_noktalar.cek("uretim.eak", baslangic_tarihi, bitis_tarihi, org["EIC Kodu"], "")
+        if len(df) > 0:
+            df = df[["Tarih", "Saat", "Toplam"]].rename(columns={"Toplam": org["Kısa Adı"]})
+        return df
 
 
+@__pencere.pencereli(gun=31)
 def __eak_uevcb(baslangic_tarihi, bitis_tarihi, org_uevcb):
     """
     İlgili tarih aralığı ve uzlaştırmaya esas veriş çekiş birimi için emre amade kapasite (EAK) bilgisini vermektedir.
@@ -709,17 +506,8 @@ def __eak_uevcb(baslangic_tarihi, bitis_tarihi, org_uevcb):
     UEVCB EAK değerleri
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = __first_part_url + "aic" + "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi \
-                             + "&organizationEIC=" + org_uevcb["Org EIC Kodu"] + "&uevcbEIC=" + org_uevcb[
-                                 "UEVÇB EIC Kodu"]
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["aicList"])
-            df["Saat"] = df["tarih"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["tarih"].apply(lambda d: d[:10]))
-            df.rename(index=str, columns={"toplam": org_uevcb["UEVÇB Adı"]}, inplace=True)
-            df = df[["Tarih", "Saat", org_uevcb["UEVÇB Adı"]]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        df = __uc_noktalar.cek("uretim.eak", baslangic_tarihi, bitis_tarihi, org_uevcb["Org EIC Kodu"],
+                               org_uevcb["UEVÇB EIC Kodu"])
+        if len(df) > 0:
+            df = df[["Tarih", "Saat", "Toplam"]].rename(columns={"Toplam": org_uevcb["UEVÇB Adı"]})
+        return df
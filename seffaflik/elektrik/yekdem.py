@@ -1,15 +1,14 @@
 import pandas as __pd
 import datetime as __dt
 from dateutil import relativedelta as __rd
-from multiprocessing import Pool as __Pool
-import multiprocessing as __mp
-import requests as __requests
 
-from seffaflik.__ortak.__araclar import make_requests as __make_requests
+from seffaflik.__ortak import __pencere
+from seffaflik.__ortak import __yurutucu
+from seffaflik.__ortak import __oturum
+from seffaflik.__ortak import __uc_noktalar
+from seffaflik.__ortak import __veri_tipi
 from seffaflik.__ortak import __dogrulama as __dogrulama
 
-__first_part_url = "production/"
-
 
 def santraller(tarih=__dt.datetime.now().strftime("%Y-%m-%d")):
     """
@@ -24,17 +23,7 @@ def santraller(tarih=__dt.datetime.now().strftime("%Y-%m-%d")):
     Santral Bilgileri(Id, Adı, EIC Kodu, Kısa Adı)
     """
     if __dogrulama.__tarih_dogrulama(tarih):
-        try:
-            particular_url = __first_part_url + "renewable-sm-licensed-power-plant-list?period=" + tarih
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["powerPlantList"])
-            df.rename(index=str, columns={"id": "Id", "name": "Adı", "eic": "EIC Kodu",
-                                          "shortName": "Kısa Adı"}, inplace=True)
-            df = df[["Id", "Adı", "EIC Kodu", "Kısa Adı"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("yekdem.santraller", tarih)
 
 
 def kurulu_guc(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -59,11 +48,11 @@ def kurulu_guc(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
         while ilk <= son and ilk <= __dt.datetime.today():
             date_list.append(ilk.strftime("%Y-%m-%d"))
             ilk = ilk + __rd.relativedelta(months=+1)
-        with __Pool(__mp.cpu_count()) as p:
-            df_list = p.map(__yekdem_kurulu_guc, date_list)
-        return __pd.concat(df_list, sort=False)
+        df_list = __yurutucu.esle(__yekdem_kurulu_guc, date_list)
+        return __veri_tipi.uygula(__pd.concat(df_list, sort=False))
 
 
+@__pencere.pencereli(gun=31)
 def lisansli_uevm(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                   bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -80,29 +69,10 @@ def lisansli_uevm(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Saatlik YEKDEM Lisanslı UEVM (MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "renewable-sm-licensed-injection-quantity" + "?startDate=" + baslangic_tarihi + \
-                "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["renewableSMProductionList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"canalType": "Kanal Tipi", "riverType": "Nehir Tipi", "biogas": "Biyogaz",
-                               "biomass": "Biyokütle", "landfillGas": "Çöp Gazı", "sun": "Güneş",
-                               "geothermal": "Jeotermal", "reservoir": "Rezervuarlı", "wind": "Rüzgar",
-                               "total": "Toplam", "others": "Diğer"},
-                      inplace=True)
-            df = df[
-                ["Tarih", "Saat", "Rüzgar", "Jeotermal", "Rezervuarlı", "Kanal Tipi", "Nehir Tipi", "Çöp Gazı",
-                 "Biyogaz", "Güneş", "Biyokütle", "Diğer", "Toplam"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("yekdem.lisansli_uevm", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def lisanssiz_uevm(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                    bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -119,28 +89,10 @@ def lisanssiz_uevm(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Saatlik YEKDEM Lisanssiz UEVM (MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "renewable-unlicenced-generation-amount" + "?startDate=" + baslangic_tarihi + \
-                "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["renewableUnlicencedGenerationAmountList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"canalType": "Kanal Tipi", "riverType": "Nehir Tipi", "biogas": "Biyogaz",
-                               "biomass": "Biyokütle", "lfg": "Çöp Gazı", "sun": "Güneş",
-                               "geothermal": "Jeotermal", "reservoir": "Rezervuarlı", "wind": "Rüzgar",
-                               "total": "Toplam", "others": "Diğer"},
-                      inplace=True)
-            df = df[
-                ["Tarih", "Saat", "Rüzgar", "Kanal Tipi", "Biyogaz", "Güneş", "Biyokütle", "Diğer", "Toplam"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("yekdem.lisanssiz_uevm", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def uevm(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
          bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")):
     """
@@ -157,28 +109,10 @@ def uevm(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Saatlik YEKDEM UEVM (MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "renewable-sm-production" + "?startDate=" + baslangic_tarihi + \
-                "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["renewableSMProductionList"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"canalType": "Kanal Tipi", "riverType": "Nehir Tipi", "biogas": "Biyogaz",
-                               "biomass": "Biyokütle", "landfillGas": "Çöp Gazı",
-                               "geothermal": "Jeotermal", "dammedHydroWithReservoir": "Rezervuarlı", "wind": "Rüzgar",
-                               "total": "Toplam", "others": "Diğer"},
-                      inplace=True)
-            df = df[["Tarih", "Saat", "Rüzgar", "Jeotermal", "Rezervuarlı", "Kanal Tipi", "Nehir Tipi", "Çöp Gazı",
-                     "Biyogaz", "Biyokütle", "Diğer", "Toplam"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("yekdem.uevm", baslangic_tarihi, bitis_tarihi)
 
 
+@__pencere.pencereli(gun=31)
 def lisansli_gerceklesen(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
                          bitis_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"), santral_id=""):
     """
@@ -220,24 +154,7 @@ def birim_maliyet(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Dönemlik YEKDEM Birim Maliyet (₺/MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "renewable-sm-unit-cost" + "?startDate=" + baslangic_tarihi + "&endDate=" + \
-                bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["renewableSMUnitCostList"])
-            df["Dönem"] = df["id"].apply(
-                lambda x: str(__pd.to_datetime(x["donem"][:10]).month_name(locale='tr_TR.UTF-8')) + "-" + str(
-                    __pd.to_datetime(x["donem"][:10]).year))
-            df["Versiyon"] = df["id"].apply(
-                lambda x: str(__pd.to_datetime(x["versiyon"][:10]).month_name(locale='tr_TR.UTF-8')) + "-" + str(
-                    __pd.to_datetime(x["versiyon"][:10]).year))
-            df.rename(index=str, columns={"unitCost": "Birim Maliyet (TL)"}, inplace=True)
-            df = df[["Dönem", "Versiyon", "Birim Maliyet (TL)"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("yekdem.birim_maliyet", baslangic_tarihi, bitis_tarihi)
 
 
 def donemsel_maliyet(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
@@ -255,28 +172,7 @@ def donemsel_maliyet(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d")
     Dönemsel YEKDEM Maliyeti (MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "renewables-support" + "?startDate=" + baslangic_tarihi + \
-                "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["renewablesSupports"])
-            df["Dönem"] = df["period"].apply(
-                lambda x: str(__pd.to_datetime(x[:10]).month_name(locale='tr_TR.UTF-8')) + "-" + str(
-                    __pd.to_datetime(x[:10]).year))
-            df.rename(index=str,
-                      columns={"unitCost": "Birim Maliyet (TL)", "licenseExemptCost": "Lisanssız Toplam Maliyet (TL)",
-                               "renewablesTotalCost": "Toplam Maliyet (TL)",
-                               "reneablesCost": "Lisanlı Toplam Maliyet (TL)",
-                               "portfolioIncome": "Toplam Gelir (TL)"},
-                      inplace=True)
-            df = df[
-                ["Dönem", "Birim Maliyet (TL)", "Lisanssız Toplam Maliyet (TL)", "Lisanlı Toplam Maliyet (TL)",
-                 "Toplam Maliyet (TL)", "Toplam Gelir (TL)"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("yekdem.donemsel_maliyet", baslangic_tarihi, bitis_tarihi)
 
 
 def res_uretim_tahmini():
@@ -291,11 +187,12 @@ def res_uretim_tahmini():
     -----------------
     RES Üretim Tahmini (MWh)
     """
-    r = __requests.get("http://www.ritm.gov.tr/amline/data_file_ritm.txt")
+    r = __oturum.istek("GET", "http://www.ritm.gov.tr/amline/data_file_ritm.txt")
     df = __pd.DataFrame(r.text.split("\n")[1:][:-1])
     df = __pd.DataFrame(df[0].str.split(",").tolist(), columns=["Tarih", "Q5", "Q25", "Q75", "Q95", "Tahmin", "Üretim"])
-    df["Saat"] = df["Tarih"].apply(lambda x: x.split(" ")[1])
-    df["Tarih"] = df["Tarih"].apply(lambda x: __pd.to_datetime(x.split(" ")[0], format="%d.%m.%Y"))
+    tarih_saat = df["Tarih"].str.split(" ", n=1, expand=True)
+    df["Saat"] = tarih_saat[1]
+    df["Tarih"] = __pd.to_datetime(tarih_saat[0], format="%d.%m.%Y")
     df = df[["Tarih", "Saat", "Q5", "Q25", "Q75", "Q95", "Tahmin", "Üretim"]]
     return df
 
@@ -316,26 +213,7 @@ def __gerceklesen(baslangic_tarihi=__dt.datetime.today().strftime("%Y-%m-%d"),
     Saatlik YEKDEM Lisanslı UEVM (MWh)
     """
     if __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
-        try:
-            particular_url = \
-                __first_part_url + "renewable-sm-licensed-real-time-generation" + "?startDate=" + baslangic_tarihi + \
-                "&endDate=" + bitis_tarihi
-            json = __make_requests(particular_url)
-            df = __pd.DataFrame(json["body"]["renewableLicencedGenerationAmount"])
-            df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-            df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-            df.rename(index=str,
-                      columns={"canalType": "Kanal Tipi", "riverType": "Nehir Tipi", "biogas": "Biyogaz",
-                               "biomass": "Biyokütle", "lfg": "Çöp Gazı", "sun": "Güneş",
-                               "geothermal": "Jeotermal", "reservoir": "Rezervuarlı", "wind": "Rüzgar",
-                               "total": "Toplam", "others": "Diğer"},
-                      inplace=True)
-            df = df[["Tarih", "Saat", "Rüzgar", "Jeotermal", "Rezervuarlı", "Kanal Tipi", "Nehir Tipi", "Çöp Gazı",
-                     "Biyogaz", "Güneş", "Biyokütle", "Diğer", "Toplam"]]
-        except (KeyError, TypeError):
-            return __pd.DataFrame()
-        else:
-            return df
+        return __uc_noktalar.cek("yekdem.gerceklesen", baslangic_tarihi, bitis_tarihi)
 
 
 def __santral_bazli_gerceklesen(baslangic_tarihi, bitis_tarihi, santral_id):
@@ -354,27 +232,7 @@ def __santral_bazli_gerceklesen(baslangic_tarihi, bitis_tarihi, santral_id):
                 "Rüzgar", "Güneş", "Fuel Oil", "Jeo Termal", "Asfaltit Kömür", "Taş Kömür", "Biokütle", "Nafta", "LNG",
                 "Uluslararası", "Toplam")
     """
-    try:
-        particular_url = __first_part_url + "renewable-sm-licensed-real-time-generation_with_powerplant" + \
-                         "?startDate=" + baslangic_tarihi + "&endDate=" + bitis_tarihi + "&powerPlantId=" + \
-                         str(santral_id)
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["renewableLicencedGenerationAmount"])
-        df["Saat"] = df["date"].apply(lambda h: int(h[11:13]))
-        df["Tarih"] = __pd.to_datetime(df["date"].apply(lambda d: d[:10]))
-        df.rename(index=str,
-                  columns={"canalType": "Kanal Tipi", "riverType": "Nehir Tipi", "biogas": "Biyogaz",
-                           "biomass": "Biyokütle", "lfg": "Çöp Gazı", "sun": "Güneş",
-                           "geothermal": "Jeotermal", "reservoir": "Rezervuarlı", "wind": "Rüzgar",
-                           "total": "Toplam", "others": "Diğer"},
-                  inplace=True)
-        df = df[
-            ["Tarih", "Saat", "Rüzgar", "Jeotermal", "Rezervuarlı", "Kanal Tipi", "Nehir Tipi", "Çöp Gazı", "Biyogaz",
-             "Güneş", "Biyokütle", "Diğer", "Toplam"]]
-    except (KeyError, TypeError):
-        return __pd.DataFrame()
-    else:
-        return df
+    return __uc_noktalar.cek("yekdem.santral_bazli_gerceklesen", baslangic_tarihi, bitis_tarihi, santral_id)
 
 
 def __yekdem_kurulu_guc(tarih):
@@ -391,12 +249,10 @@ def __yekdem_kurulu_guc(tarih):
     Kurulu Güç Bilgisi (Tarih, Kurulu Güç)
     """
     try:
-        particular_url = __first_part_url + "installed-capacity-of-renewable?period=" + tarih
-        json = __make_requests(particular_url)
-        df = __pd.DataFrame(json["body"]["installedCapacityOfRenewableList"])
+        df = __pd.DataFrame(__uc_noktalar.kayitlar("yekdem.kurulu_guc", tarih))
         columns = df["capacityType"].values
         df = df[["capacity"]].transpose()
-        df.set_axis(columns, axis=1, inplace=True)
+        df = df.set_axis(columns, axis=1)
         df.reset_index(drop=True, inplace=True)
         df.insert(loc=0, column="Tarih", value=__pd.to_datetime(tarih))
     except (KeyError, TypeError):
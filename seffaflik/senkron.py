@@ -0,0 +1,228 @@
+"""
+Tarih aralığı alan veri fonksiyonlarının sonuçlarını yerel, bölümlenmiş (yil=YYYY/ay=AA) bir Parquet veri setinde
+güncel tutan artımlı senkronizasyon. Her veri seti için en son senkronize edilen gün (high-water mark) veri setinin
+bulunduğu dizindeki manifest.json dosyasında tutulur; sonraki senkronizasyonlarda yalnızca bu günden, sonradan
+düzeltilebilecek günler için geriye_bakis kadar önceden itibaren veri çekilir. Veri setleri veri_seti modülüyle yazılır;
+tekrar çekilen günlerin satırları bölüm dosyası atomik olarak yenilenerek değiştirilir.
+
+    from seffaflik import senkron
+    from seffaflik.elektrik import uretim
+    senkron.senkronize(uretim.gerceklesen, baslangic_tarihi="2020-01-01")  # ilk seferde tüm aralık
+    senkron.senkronize(uretim.gerceklesen)                                 # sonrakilerde yalnızca yeni günler
+    df = senkron.oku(uretim.gerceklesen, baslangic_tarihi="2023-01-01")
+"""
+import os as __os
+import json as __json
+import uuid as __uuid
+import logging as __logging
+import datetime as __dt
+import threading as __threading
+
+try:
+    import fcntl as __fcntl
+except ImportError:  # Windows: manifest yalnızca süreç içinde kilitlenir
+    __fcntl = None
+
+from seffaflik import veri_seti as __veri_seti
+from seffaflik.__ortak import __onbellek
+from seffaflik.__ortak import __pencere
+from seffaflik.__ortak import __dogrulama
+from seffaflik.__ortak.__parametreler import __seffaflik_dir
+
+__manifest = "manifest.json"
+__kilit = __threading.Lock()
+
+
+def senkronize(fonksiyon, baslangic_tarihi=None, bitis_tarihi=None, dizin=None, geriye_bakis=None, pencere="1M",
+               azami_deneme=3, **kwargs):
+    """
+    İlgili veri fonksiyonunun veri setini son senkronizasyondan bu yana yayımlanan günlerle günceller. Veri seti ilk
+    kez senkronize edilirken baslangic_tarihi girilmelidir; sonraki senkronizasyonlarda girilmediği taktirde verisi
+    olan son günden geriye_bakis gün öncesinden başlanır. Uzun aralıklar pencere pencere çekilip yazılır;
+    böylece tüm aralık aynı anda belleğe alınmaz. Veri alınamayan (hatalı ya da boş yanıt alınan) pencereler
+    manifestte deneme sayısıyla birlikte eksik aralık olarak tutulur ve sonraki senkronizasyonlarda veri alınana kadar,
+    toplamda en fazla azami_deneme kez çekilir; böylece gerçekten verisi olmayan aralıklar her seferinde çekilmez.
+
+    Parametreler
+    ------------
+    fonksiyon        : tarih aralığı alan veri fonksiyonu (ör: uretim.gerceklesen)
+    baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi (Varsayılan: son senkronize edilen gün - geriye_bakis)
+    bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi (Varsayılan: bugün)
+    dizin            : veri setlerinin saklandığı dizin. None ise $SEFFAFLIK_DIR/senkron kullanılır (Varsayılan: None)
+    geriye_bakis     : sonradan düzeltilebilecek günler için son senkronize edilen günden geriye doğru yeniden çekilecek
+                       gün sayısı. None ise fonksiyonun kesinleşme süresi (yoksa 1) kullanılır (Varsayılan: None)
+    pencere          : tek seferde çekilip yazılacak aralık; gün ("1D"), hafta ("1W") ya da ay ("1M") cinsinden
+                       (Varsayılan: "1M")
+    azami_deneme     : veri alınamayan bir aralığın ilk deneme dahil en fazla kaç kez çekileceği. Aşıldığında aralık
+                       manifestte kalır, ancak yalnızca istenen aralığın içinde kaldığında tekrar çekilir
+                       (Varsayılan: 3)
+    kwargs           : fonksiyona iletilecek diğer parametreler (ör: organizasyon_eic)
+
+    Geri Dönüş Değeri
+    -----------------
+    Senkronizasyon Özeti (dict: veri_seti, baslangic_tarihi, bitis_tarihi, gun, satir, eksik ([ilk, son, deneme]))
+    """
+    if __veri_seti.__pyarrow() is None:
+        return
+    dizin = dizin or __varsayilan_dizin()
+    ad = veri_seti(fonksiyon, **kwargs)
+    tarih_sutunu = getattr(fonksiyon, "tarih_sutunu", "Tarih")
+    kayit = durum(dizin).get(ad, {})
+    bitis_tarihi = bitis_tarihi or __dt.date.today().isoformat()
+    if baslangic_tarihi is None:
+        if "son_tarih" not in kayit:
+            __logging.warning(ad + " veri seti ilk kez senkronize edilirken başlangıç tarihi girilmelidir!")
+            return
+        if geriye_bakis is None:
+            geriye_bakis = getattr(fonksiyon, "kesinlesme", 1)
+        baslangic_tarihi = (__dt.date.fromisoformat(kayit["son_tarih"]) - __dt.timedelta(days=geriye_bakis)) \
+            .isoformat()
+        baslangic_tarihi = min(baslangic_tarihi, bitis_tarihi)
+    if not __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
+        return
+    # Önceki senkronizasyonlarda veri alınamayan aralıklar bu aralığın dışında kalıyorsa azami_deneme kez tekrar
+    # denenir; deneme hakkı biten aralıklar manifestte olduğu gibi bırakılır
+    onceki_eksik = [(aralik[0], aralik[1], aralik[2] if len(aralik) > 2 else 1) for aralik in kayit.get("eksik", [])]
+    araliklar, eksik = [], []
+    for ilk, son, deneme in onceki_eksik:
+        if ilk >= baslangic_tarihi and son <= bitis_tarihi:
+            continue
+        if deneme < azami_deneme:
+            araliklar.append((ilk, son))
+        else:
+            eksik.append((ilk, son, deneme))
+    araliklar.append((baslangic_tarihi, bitis_tarihi))
+    gunler, satir = set(), 0
+    for aralik_baslangici, aralik_bitisi in araliklar:
+        for ilk, son, df in __pencere.pencere_sonuclari(fonksiyon, aralik_baslangici, aralik_bitisi, pencere=pencere,
+                                                        **kwargs):
+            if df is not None and tarih_sutunu not in df.columns:
+                # Bölümlenemeyen pencere yazılmaz; önceki pencereler yazılmış olabileceğinden manifest yine güncellenir
+                __logging.warning(ad + " sonuçlarında " + tarih_sutunu + " sütunu bulunmamaktadır!")
+                df = None
+            if df is None:
+                eksik.append((ilk, son, __deneme(onceki_eksik, ilk, son) + 1))
+                continue
+            gunler.update(__veri_seti.tablo_yaz(df, __os.path.join(dizin, ad), tarih_sutunu))
+            satir += len(df)
+    # Hatalı ya da boş yanıt alınan pencereler manifestte eksik aralık olarak tutulur ve sonraki senkronizasyonlarda,
+    # son senkronize edilen gün bu aralıkları geçmiş olsa da, veri alınana ya da deneme hakkı bitene kadar tekrar
+    # çekilir
+    eksik = __birlestir(eksik)
+    if len(gunler) > 0 or "son_tarih" in kayit:
+        son_tarih = max([kayit.get("son_tarih", "")] + [gun.isoformat() for gun in gunler])
+        __manifest_guncelle(dizin, ad, {"fonksiyon": __fonksiyon_adi(fonksiyon), "parametreler": kwargs,
+                                        "tarih_sutunu": tarih_sutunu, "son_tarih": son_tarih, "eksik": eksik,
+                                        "son_senkron": __dt.datetime.now().isoformat(timespec="seconds")})
+    return {"veri_seti": ad, "baslangic_tarihi": baslangic_tarihi, "bitis_tarihi": bitis_tarihi, "gun": len(gunler),
+            "satir": satir, "eksik": eksik}
+
+
+def oku(fonksiyon, baslangic_tarihi=None, bitis_tarihi=None, dizin=None, **kwargs):
+    """
+    İlgili veri fonksiyonunun yerel veri setini okur. Tarih girildiği taktirde yalnızca aralığa denk gelen bölümler
+    okunur.
+
+    Parametreler
+    ------------
+    fonksiyon        : tarih aralığı alan veri fonksiyonu (ör: uretim.gerceklesen)
+    baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi (Varsayılan: None)
+    bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi (Varsayılan: None)
+    dizin            : veri setlerinin saklandığı dizin. None ise $SEFFAFLIK_DIR/senkron kullanılır (Varsayılan: None)
+    kwargs           : senkronizasyonda fonksiyona iletilen diğer parametreler
+
+    Geri Dönüş Değeri
+    -----------------
+    Veri Seti (DataFrame)
+    """
+    return __veri_seti.oku(__os.path.join(dizin or __varsayilan_dizin(), veri_seti(fonksiyon, **kwargs)),
+                           baslangic_tarihi, bitis_tarihi)
+
+
+def durum(dizin=None):
+    """
+    Dizindeki veri setlerinin senkronizasyon durumunu (manifest) vermektedir.
+
+    Parametreler
+    ------------
+    dizin : veri setlerinin saklandığı dizin. None ise $SEFFAFLIK_DIR/senkron kullanılır (Varsayılan: None)
+
+    Geri Dönüş Değeri
+    -----------------
+    Veri Seti Durumları (dict: veri seti adı -> fonksiyon, parametreler, tarih_sutunu, son_tarih, eksik, son_senkron)
+    """
+    try:
+        with open(__os.path.join(dizin or __varsayilan_dizin(), __manifest), encoding="utf-8") as f:
+            return __json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def veri_seti(fonksiyon, **kwargs):
+    """
+    İlgili veri fonksiyonu ve parametreleri için veri seti adını vermektedir. Parametre girilmediği taktirde ad
+    fonksiyonun modülü ve adından oluşur (ör: "elektrik.uretim.gerceklesen").
+
+    Parametreler
+    ------------
+    fonksiyon : veri fonksiyonu
+    kwargs    : fonksiyona iletilecek diğer parametreler
+
+    Geri Dönüş Değeri
+    -----------------
+    Veri Seti Adı (metin)
+    """
+    ad = __fonksiyon_adi(fonksiyon)
+    if kwargs:
+        ad += "-" + __onbellek.__parametre_anahtari(kwargs)
+    return ad
+
+
+def __birlestir(araliklar):
+    # Ardışık ya da çakışan aralıklar tek aralıkta birleştirilir; birleşen aralığın deneme sayısı en yükseğidir
+    sonuc = []
+    for ilk, son, deneme in sorted(araliklar):
+        if sonuc and __dt.date.fromisoformat(ilk) <= __dt.date.fromisoformat(sonuc[-1][1]) + __dt.timedelta(days=1):
+            sonuc[-1][1] = max(sonuc[-1][1], son)
+            sonuc[-1][2] = max(sonuc[-1][2], deneme)
+        else:
+            sonuc.append([ilk, son, deneme])
+    return sonuc
+
+
+def __deneme(araliklar, ilk, son):
+    # Pencereyle çakışan önceki eksik aralıkların en yüksek deneme sayısı
+    return max([deneme for a, b, deneme in araliklar if a <= son and b >= ilk], default=0)
+
+
+def __fonksiyon_adi(fonksiyon):
+    return fonksiyon.__module__.replace("seffaflik.", "") + "." + fonksiyon.__name__
+
+
+def __manifest_guncelle(dizin, ad, kayit):
+    # Aynı dizini senkronize eden süreçlerin (ör: ayrı zamanlanmış işler) birbirinin kayıtlarını ezmemesi için manifest
+    # oku-değiştir-yaz sırasında kilit dosyasıyla kilitlenir
+    __os.makedirs(dizin, exist_ok=True)
+    if __fcntl is None:
+        with __kilit:
+            __manifest_yaz(dizin, ad, kayit)
+        return
+    with open(__os.path.join(dizin, "." + __manifest + ".kilit"), "a") as f:
+        __fcntl.flock(f, __fcntl.LOCK_EX)
+        try:
+            __manifest_yaz(dizin, ad, kayit)
+        finally:
+            __fcntl.flock(f, __fcntl.LOCK_UN)
+
+
+def __manifest_yaz(dizin, ad, kayit):
+    manifest = durum(dizin)
+    manifest[ad] = kayit
+    gecici = __os.path.join(dizin, "." + __manifest + "." + __uuid.uuid4().hex + ".tmp")
+    with open(gecici, "w", encoding="utf-8") as f:
+        __json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True, default=str)
+    __os.replace(gecici, __os.path.join(dizin, __manifest))
+
+
+def __varsayilan_dizin():
+    return __os.path.join(__seffaflik_dir, "senkron")
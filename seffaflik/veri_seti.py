@@ -0,0 +1,217 @@
+"""
+Veri fonksiyonlarının sonuçlarını Hive biçiminde yıl/ay bölümlenmiş (yil=YYYY/ay=AA) Parquet veri setlerine yazar ve
+bu veri setlerini okur. Her bölüm tek bir dosyadan oluşur; yazılan günlerin bölümdeki eski satırları yeni satırlarla
+değiştirilir, böylece aynı aralığın tekrar yazılması satırları çoğaltmaz. Dosyalar geçici bir dosyaya yazılıp atomik
+olarak yerine taşınır. Yeni sütunlar ya da genişleyen tipler (ör: tam sayıdan ondalıklıya) veri setinin ortak şemasına
+(_common_metadata) eklenir; okumada eski dosyalar bu şemaya göre okunur. pyarrow paketi gereklidir
+(pip install seffaflik[parquet]).
+
+    from seffaflik import veri_seti
+    veri_seti.yaz(uretim.gerceklesen, "2020-01-01", "2023-12-31", dizin="veri/uretim")
+    df = veri_seti.oku("veri/uretim", baslangic_tarihi="2023-06-01", bitis_tarihi="2023-06-30")
+"""
+import os as __os
+import uuid as __uuid
+import logging as __logging
+import threading as __threading
+import importlib as __importlib
+import pandas as __pd
+
+from seffaflik.__ortak import __pencere
+from seffaflik.__ortak import __dogrulama
+
+__dosya = "part-0.parquet"
+__sema_dosyasi = "_common_metadata"
+__tarih_sutunlari = ("Tarih", "Gaz Günü")
+__kilit = __threading.Lock()
+
+
+def yaz(fonksiyon, baslangic_tarihi, bitis_tarihi, dizin, pencere="1M", **kwargs):
+    """
+    İlgili veri fonksiyonunun tarih aralığındaki sonuçlarını yıl/ay bölümlenmiş Parquet veri setine yazar. Aralık
+    pencere pencere çekilip yazılır; böylece uzun aralıklar tek seferde belleğe alınmaz. Bölümleme fonksiyonun
+    tarih sütununa (ör: STP için "Gaz Günü") göre yapılır.
+
+    Parametreler
+    ------------
+    fonksiyon        : tarih aralığı alan veri fonksiyonu (ör: uretim.gerceklesen)
+    baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi
+    bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi
+    dizin            : veri setinin dizini
+    pencere          : tek seferde çekilip yazılacak aralık; gün ("1D"), hafta ("1W") ya da ay ("1M") cinsinden
+                       (Varsayılan: "1M")
+    kwargs           : fonksiyona iletilecek diğer parametreler (ör: organizasyon_eic)
+
+    Geri Dönüş Değeri
+    -----------------
+    Yazılan Günler (list of datetime.date)
+    """
+    if __pyarrow() is None or not __dogrulama.__baslangic_bitis_tarih_dogrulama(baslangic_tarihi, bitis_tarihi):
+        return []
+    gunler = []
+    for df in __pencere.parcali(fonksiyon, baslangic_tarihi, bitis_tarihi, pencere=pencere, **kwargs):
+        gunler.extend(tablo_yaz(df, dizin, getattr(fonksiyon, "tarih_sutunu", None)))
+    return gunler
+
+
+def tablo_yaz(df, dizin, tarih_sutunu=None):
+    """
+    DataFrame'i yıl/ay bölümlenmiş Parquet veri setine yazar. DataFrame'de bulunan günlerin bölümlerdeki eski
+    satırları çıkarılır ve yeni satırlar eklenir; bölüm dosyası ve ortak şema atomik olarak güncellenir.
+
+    Parametreler
+    ------------
+    df          : pandas.DataFrame
+    dizin       : veri setinin dizini
+    tarih_sutunu: bölümlemede kullanılacak tarih sütunu. None ise "Tarih" ya da "Gaz Günü" sütunu kullanılır
+                  (Varsayılan: None)
+
+    Geri Dönüş Değeri
+    -----------------
+    Yazılan Günler (list of datetime.date)
+    """
+    pa = __pyarrow()
+    if pa is None or df is None or len(df) == 0:
+        return []
+    tarih_sutunu = tarih_sutunu or next((s for s in __tarih_sutunlari if s in df.columns), None)
+    if tarih_sutunu not in df.columns:
+        __logging.warning("Veri setine yazmak için sonuçlarda tarih sütunu (" + ", ".join(__tarih_sutunlari) +
+                          ") bulunmalıdır!")
+        return []
+    pq = __importlib.import_module("pyarrow.parquet")
+    df = __kategorileri_coz(df.reset_index(drop=True))
+    gunler = __pd.to_datetime(df[tarih_sutunu]).dt.date
+    yazilan = []
+    with __kilit:
+        sema = __sema_oku(dizin)
+        bolumler = []
+        for (yil, ay), df_bolum in df.groupby([gunler.map(lambda g: g.year), gunler.map(lambda g: g.month)],
+                                              sort=True):
+            dosya = __os.path.join(dizin, "yil=" + str(yil), "ay=" + "{:02d}".format(ay), __dosya)
+            yeni_gunler = sorted(set(gunler[df_bolum.index]))
+            eski = __bolum_oku(dosya, sema)
+            if eski is not None:
+                eski = eski[~__pd.to_datetime(eski[tarih_sutunu]).dt.date.isin(yeni_gunler)]
+                df_bolum = __pd.concat([eski, df_bolum], sort=False)
+                df_bolum = df_bolum.sort_values(tarih_sutunu, kind="stable", ignore_index=True)
+            tablo = pa.Table.from_pandas(df_bolum, preserve_index=False)
+            sema = pa.unify_schemas([s.remove_metadata() for s in (sema, tablo.schema) if s is not None],
+                                    promote_options="permissive")
+            bolumler.append((dosya, tablo, yeni_gunler))
+        # Ortak şema bölümlerden önce yazılır; bir bölüm yazılamasa da yazılan bölümler şemayla uyumlu kalır (şemanın
+        # bölümlerden geniş olması okumayı etkilemez)
+        sema = sema.with_metadata({b"seffaflik.tarih_sutunu": tarih_sutunu.encode()})
+        __atomik_yaz(__os.path.join(dizin, __sema_dosyasi), lambda yol: pq.write_metadata(sema, yol))
+        for dosya, tablo, yeni_gunler in bolumler:
+            tablo = __semaya_cevir(tablo, sema.remove_metadata())
+            __atomik_yaz(dosya, lambda yol: pq.write_table(tablo, yol))
+            yazilan.extend(yeni_gunler)
+    return yazilan
+
+
+def oku(dizin, baslangic_tarihi=None, bitis_tarihi=None, sutunlar=None):
+    """
+    Yıl/ay bölümlenmiş Parquet veri setini ortak şemasıyla okur. Tarih girildiği taktirde yalnızca aralığa denk gelen
+    bölümler okunur (predicate pushdown).
+
+    Parametreler
+    ------------
+    dizin            : veri setinin dizini
+    baslangic_tarihi : %YYYY-%AA-%GG formatında başlangıç tarihi (Varsayılan: None)
+    bitis_tarihi     : %YYYY-%AA-%GG formatında bitiş tarihi (Varsayılan: None)
+    sutunlar         : okunacak sütunlar. None ise tüm sütunlar okunur (Varsayılan: None)
+
+    Geri Dönüş Değeri
+    -----------------
+    Veri Seti (DataFrame)
+    """
+    pa = __pyarrow()
+    sema = __sema_oku(dizin) if pa is not None else None
+    if sema is None:
+        return __pd.DataFrame()
+    ds = __importlib.import_module("pyarrow.dataset")
+    tarih_sutunu = (sema.metadata or {}).get(b"seffaflik.tarih_sutunu", b"Tarih").decode()
+    bolumler = pa.schema([("yil", pa.int32()), ("ay", pa.int32())])
+    veri = ds.dataset(dizin, schema=pa.unify_schemas([sema, bolumler]), format="parquet",
+                      partitioning=ds.partitioning(bolumler, flavor="hive"))
+    filtre = None
+    for tarih, karsilastir in ((baslangic_tarihi, lambda a, b: a >= b), (bitis_tarihi, lambda a, b: a <= b)):
+        if tarih is not None:
+            kosul = karsilastir(ds.field("yil") * 100 + ds.field("ay"), int(tarih[:4]) * 100 + int(tarih[5:7]))
+            filtre = kosul if filtre is None else filtre & kosul
+    okunacak = list(dict.fromkeys([tarih_sutunu] + list(sutunlar or sema.names)))
+    df = veri.to_table(columns=okunacak, filter=filtre).to_pandas()
+    if len(df) > 0 and (baslangic_tarihi is not None or bitis_tarihi is not None):
+        gunler = __pd.to_datetime(df[tarih_sutunu]).dt.strftime("%Y-%m-%d")
+        df = df[(gunler >= (baslangic_tarihi or "")) & (gunler <= (bitis_tarihi or "9999-12-31"))]
+    if sutunlar is not None:
+        df = df[list(sutunlar)]
+    return df.reset_index(drop=True)
+
+
+def sema(dizin):
+    """
+    Veri setinin tüm dosyalarını kapsayan ortak şemasını vermektedir.
+
+    Parametreler
+    ------------
+    dizin : veri setinin dizini
+
+    Geri Dönüş Değeri
+    -----------------
+    Şema (pyarrow.Schema; veri seti yoksa None)
+    """
+    return __sema_oku(dizin) if __pyarrow() is not None else None
+
+
+def __kategorileri_coz(df):
+    # Kompakt veri tipindeki kategorik sütunlar değer tipleriyle yazılır; böylece dosyaların şemaları birleşebilir
+    kategorik = [i for i, tip in enumerate(df.dtypes) if isinstance(tip, __pd.CategoricalDtype)]
+    if len(kategorik) == 0:
+        return df
+    df = df.copy(deep=False)
+    for i in kategorik:
+        df.isetitem(i, df.iloc[:, i].astype(df.dtypes.iloc[i].categories.dtype))
+    return df
+
+
+def __semaya_cevir(tablo, sema):
+    pa = __pyarrow()
+    sutunlar = [tablo.column(alan.name).cast(alan.type) if alan.name in tablo.column_names
+                else pa.nulls(tablo.num_rows, alan.type) for alan in sema]
+    return pa.Table.from_arrays(sutunlar, schema=sema)
+
+
+def __bolum_oku(dosya, sema):
+    if not __os.path.exists(dosya):
+        return None
+    tablo = __importlib.import_module("pyarrow.parquet").read_table(dosya, partitioning=None)
+    return __semaya_cevir(tablo, sema or tablo.schema.remove_metadata()).to_pandas()
+
+
+def __sema_oku(dizin):
+    try:
+        return __importlib.import_module("pyarrow.parquet").read_schema(__os.path.join(dizin, __sema_dosyasi))
+    except (OSError, ValueError):
+        return None
+
+
+def __atomik_yaz(dosya, yazici):
+    __os.makedirs(__os.path.dirname(dosya), exist_ok=True)
+    # "." ile başlayan dosyalar pyarrow.dataset tarafından okunmaz; yarım yazılmış dosya eşzamanlı okumaya karışmaz
+    gecici = __os.path.join(__os.path.dirname(dosya), "." + __os.path.basename(dosya) + "." + __uuid.uuid4().hex +
+                            ".tmp")
+    try:
+        yazici(gecici)
+        __os.replace(gecici, dosya)
+    finally:
+        if __os.path.exists(gecici):
+            __os.remove(gecici)
+
+
+def __pyarrow():
+    try:
+        return __importlib.import_module("pyarrow")
+    except ImportError:
+        __logging.warning("Parquet veri setleri için pyarrow paketi gereklidir (pip install seffaflik[parquet])!")
+        return None
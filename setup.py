@@ -29,15 +29,20 @@ setup(
 
     # List run-time dependencies here.  These will be installed by pip when
     # your project is installed.
-    install_requires=['requests', 'pandas', 'python-dateutil', 'beautifulsoup4', 'xlrd'],
+    install_requires=['requests', 'pandas>=2.0', 'python-dateutil', 'beautifulsoup4', 'xlrd'],
+    extras_require={
+        'parquet': ['pyarrow>=14'],
+        'json': ['orjson'],
+    },
     classifiers=[
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.9",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.8',
     package_data={
         'seffaflik': ['LICENSE', 'README.md'],
     },
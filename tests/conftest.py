@@ -0,0 +1,29 @@
+"""
+Testler ağa çıkmadan benchmarks/sahte_sunucu.py'deki sahte sunucuya karşı çalışır. Her test ayarları ve önbellek
+dizinlerini kendine ait geçici dizinlerle başlatır; test bitince ayarlar geri alınır.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+import seffaflik  # noqa: E402
+from seffaflik import _ayarlar  # noqa: E402
+from sahte_sunucu import SahteSunucu  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def ayarlar(tmp_path):
+    eski = dict(_ayarlar.AYARLAR)
+    seffaflik.ayarlar(onbellek_dizini=str(tmp_path / "onbellek"), bellek_suresi=0)
+    yield
+    seffaflik.ayarlar(**eski)
+
+
+@pytest.fixture
+def sunucu():
+    with SahteSunucu(liste_boyutu=3) as sahte:
+        seffaflik.ayarlar(ana_url=sahte.adres)
+        yield sahte
@@ -0,0 +1,25 @@
+import seffaflik
+from seffaflik.__ortak import __uc_noktalar as uc_noktalar
+from seffaflik.__ortak.__araclar import dogrulanabilir
+from seffaflik.elektrik.piyasalar import gop
+
+
+def test_degismeyen_yanitta_onceki_dataframe_yeniden_kullanilir(sunucu, monkeypatch):
+    ayristirilan = []
+    ayristir = uc_noktalar.ayristir
+    monkeypatch.setattr(uc_noktalar, "ayristir", lambda ad, liste: ayristirilan.append(ad) or ayristir(ad, liste))
+    ilk = uc_noktalar.cek("santraller.kurulu_guc", "2019-05-01")
+    ikinci = uc_noktalar.cek("santraller.kurulu_guc", "2019-05-01")
+    assert sunucu.sayaclar["istek"] == 2
+    assert sunucu.sayaclar["degismedi"] == 1
+    assert ayristirilan == ["santraller.kurulu_guc"]
+    assert ikinci.equals(ilk) and ikinci is not ilk
+
+
+def test_tarih_araligi_alan_uc_noktalar_kosullu_istekte_saklanmaz(sunucu):
+    seffaflik.ayarlar(onbellek=False)
+    gop.ptf("2019-05-01", "2019-05-02")
+    gop.ptf("2019-05-01", "2019-05-02")
+    assert sunucu.sayaclar["istek"] == 2
+    assert sunucu.sayaclar["degismedi"] == 0
+    assert not dogrulanabilir(uc_noktalar.url("gop.ptf", "2019-05-01", "2019-05-02"))
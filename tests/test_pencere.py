@@ -0,0 +1,22 @@
+import pandas as pd
+
+import seffaflik
+from seffaflik.__ortak import __pencere as pencere
+from seffaflik.elektrik.piyasalar import gop
+
+
+def test_birlestir_pencere_sinirinda_tekrar_eden_satirlari_cikarir():
+    ilk = pd.DataFrame({"Tarih": ["2019-01-01", "2019-01-02", "2019-01-02"], "Değer": [1, 2, 2]})
+    son = pd.DataFrame({"Tarih": ["2019-01-02", "2019-01-03"], "Değer": [2, 3]})
+    df = pencere.birlestir([ilk, None, son])
+    # Pencere içindeki tekrarlar korunur, yalnızca önceki pencerede de bulunan satırlar çıkarılır
+    assert df["Değer"].tolist() == [1, 2, 2, 3]
+
+
+def test_pencereli_fonksiyon_uzun_araligi_tekrarsiz_birlestirir(sunucu):
+    seffaflik.ayarlar(onbellek=False)
+    df = gop.ptf("2019-01-01", "2019-03-15")
+    assert sunucu.sayaclar["istek"] == 3
+    assert len(df) == 74 * 24
+    assert not df.duplicated(["Tarih", "Saat"]).any()
+    assert df["Tarih"].is_monotonic_increasing
@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+from seffaflik import senkron
+from seffaflik.elektrik.piyasalar import gop
+
+pytest.importorskip("pyarrow")
+
+# Şubat pencerelerinin veri alınamamış gibi davranıp davranmayacağı ve çağrılan aralıklar
+DURUM = {"subat": None, "cagrilar": []}
+
+
+def ptf(baslangic_tarihi, bitis_tarihi):
+    DURUM["cagrilar"].append((baslangic_tarihi, bitis_tarihi))
+    df = gop.ptf(baslangic_tarihi, bitis_tarihi)
+    if baslangic_tarihi.startswith("2019-02") and DURUM["subat"] == "bos":
+        return pd.DataFrame()
+    if baslangic_tarihi.startswith("2019-02") and DURUM["subat"] == "tarihsiz":
+        return df.drop(columns=["Tarih"])
+    return df
+
+
+def subat_cagrilari():
+    return [c for c in DURUM["cagrilar"] if c[0].startswith("2019-02")]
+
+
+def senkronize(tmp_path, **kwargs):
+    DURUM["cagrilar"].clear()
+    return senkron.senkronize(ptf, dizin=str(tmp_path / "senkron"), **kwargs)
+
+
+def test_veri_alinamayan_pencere_eksik_aralik_olarak_tutulur_ve_tamamlanir(sunucu, tmp_path):
+    DURUM["subat"] = "bos"
+    ozet = senkronize(tmp_path, baslangic_tarihi="2019-01-01", bitis_tarihi="2019-03-31")
+    assert ozet["gun"] == 31 + 31
+    assert ozet["eksik"] == [["2019-02-01", "2019-02-28", 1]]
+    # Son senkronize edilen gün Şubat'ı geçmiş olsa da eksik aralık tekrar çekilir
+    DURUM["subat"] = None
+    ozet = senkronize(tmp_path, bitis_tarihi="2019-04-01")
+    assert subat_cagrilari() == [("2019-02-01", "2019-02-28")]
+    assert ozet["eksik"] == []
+    df = senkron.oku(ptf, dizin=str(tmp_path / "senkron"))
+    assert len(df) == (31 + 28 + 31 + 1) * 24
+    assert not df.duplicated(["Tarih", "Saat"]).any()
+
+
+def test_eksik_aralik_en_fazla_azami_deneme_kadar_cekilir(sunucu, tmp_path):
+    DURUM["subat"] = "bos"
+    senkronize(tmp_path, baslangic_tarihi="2019-01-01", bitis_tarihi="2019-03-31", azami_deneme=2)
+    ozet = senkronize(tmp_path, bitis_tarihi="2019-04-01", azami_deneme=2)
+    assert len(subat_cagrilari()) == 1
+    assert ozet["eksik"] == [["2019-02-01", "2019-02-28", 2]]
+    ozet = senkronize(tmp_path, bitis_tarihi="2019-04-02", azami_deneme=2)
+    assert subat_cagrilari() == []
+    assert ozet["eksik"] == [["2019-02-01", "2019-02-28", 2]]
+
+
+def test_tarih_sutunu_olmayan_pencerede_manifest_guncellenir(sunucu, tmp_path):
+    DURUM["subat"] = "tarihsiz"
+    ozet = senkronize(tmp_path, baslangic_tarihi="2019-01-01", bitis_tarihi="2019-03-31")
+    assert ozet["eksik"] == [["2019-02-01", "2019-02-28", 1]]
+    kayit = senkron.durum(str(tmp_path / "senkron"))[senkron.veri_seti(ptf)]
+    assert kayit["son_tarih"] == "2019-03-31"
+    assert kayit["eksik"] == ozet["eksik"]
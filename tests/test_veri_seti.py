@@ -0,0 +1,28 @@
+import pytest
+
+from seffaflik import veri_seti
+from seffaflik.elektrik.piyasalar import gop
+
+pytest.importorskip("pyarrow")
+
+
+def test_yeni_sutunlar_ortak_semaya_eklenir(sunucu, tmp_path):
+    dizin = str(tmp_path / "ptf")
+    assert len(veri_seti.yaz(gop.ptf, "2019-01-01", "2019-01-31", dizin)) == 31
+    subat = gop.ptf("2019-02-01", "2019-02-28")
+    subat["Saat"] = subat["Saat"].astype("float64")
+    subat["Not"] = "düzeltme"
+    veri_seti.tablo_yaz(subat, dizin)
+    assert veri_seti.sema(dizin).field("Not") is not None
+    assert str(veri_seti.sema(dizin).field("Saat").type) == "double"
+    df = veri_seti.oku(dizin)
+    assert len(df) == (31 + 28) * 24
+    assert df.loc[df["Tarih"] < "2019-02-01", "Not"].isna().all()
+    assert (df.loc[df["Tarih"] >= "2019-02-01", "Not"] == "düzeltme").all()
+    # Yalnızca eski bölüm okunduğunda da ortak şema kullanılır; eski bölüm yeniden yazıldığında yeni sütun korunur
+    ocak = veri_seti.oku(dizin, "2019-01-01", "2019-01-31")
+    assert "Not" in ocak.columns and len(ocak) == 31 * 24
+    veri_seti.yaz(gop.ptf, "2019-01-01", "2019-01-31", dizin)
+    df = veri_seti.oku(dizin)
+    assert len(df) == (31 + 28) * 24
+    assert (df.loc[df["Tarih"] >= "2019-02-01", "Not"] == "düzeltme").all()